@@ -1,59 +1,116 @@
 import streamlit as st
 import numpy as np
-import plotly.graph_objects as go
 import math
 
+from formatting import to_sig_fig
+from engine import INPUTS, evaluate, ej_height, d_EJ0_min_req, governing_ratio
+from graph import DesignGraph
+from checks import CHECK_INFO, checks_json
+from schematic import schematic_layers, schematic_figure, schematic_svg
+from optimizer import PLATE_STEP, STIFFENER_GRID, beam_selection, search, stiffener_layouts
+from reliability import DEFAULT_SCATTER, monte_carlo
+from inverse import InverseSolver, ej_candidates
+from project import Project
+from hysteresis import hysteresis, POINTS_PER_QUARTER
+from pushover import N_POINTS, backbone, polyline, pushover_npz
+from pareto import candidate_designs, pareto_front
+from report import render_report, reports_zip
+from profiling import begin_rerun, mark, stage, profiled, end_rerun
+from sections import STEEL_DB, EJ_D_TOL, get_table
+
 # ==========================================
-# UI 與數值輔助函式 (3位有效數字轉換)
+# UI 輔助函式 (檢核結果方塊)
 # ==========================================
-def to_sig_fig(val, sig_figs=3):
-    if val == 0 or np.isnan(val) or np.isinf(val):
-        return "0.00"
-    try:
-        val_abs = abs(float(val))
-        order = int(math.floor(math.log10(val_abs)))
-        decimals = sig_figs - 1 - order
-        rounded = round(val_abs, decimals)
-        
-        new_order = int(math.floor(math.log10(rounded))) if rounded != 0 else 0
-        if new_order > order:
-            decimals = sig_figs - 1 - new_order
-            
-        if decimals <= 0:
-            result = str(int(round(rounded, 0)))
-        else:
-            fmt = f"{{:.{decimals}f}}"
-            result = fmt.format(rounded)
-        return "-" + result if val < 0 else result
-    except:
-        return str(val)
-
-def detail_check(name, actual, limit, unit="", is_lower_bound=False, highlight=False, note=""):
-    is_ok = actual >= limit if is_lower_bound else actual <= limit
-    color = "#00E000" if is_ok else "#FF0000"
-    symbol = "≥" if is_lower_bound else "≤"
-    status = "OK!" if is_ok else "NG!"
+def check_html(c, highlight=False):
+    """單項檢核結果 (checks.check_results 的一筆) 轉為 HTML 方塊與公式說明。"""
+    color = "#00E000" if c["ok"] else "#FF0000"
+    symbol = "≥" if c["lower_bound"] else "≤"
+    status = "OK!" if c["ok"] else "NG!"
     bg_style = "background-color: rgba(255, 255, 0, 0.15);" if highlight else "background-color: rgba(255,255,255,0.05);"
-    
-    val_disp = to_sig_fig(actual) if isinstance(actual, (float, int, np.floating, np.integer)) else str(actual)
-    limit_disp = to_sig_fig(limit) if isinstance(limit, (float, int, np.floating, np.integer)) else str(limit)
+    unit = f" {c['unit']}" if c["unit"] else ""
+    return (
+        f'<div class="check-box" style="border-left: 5px solid {color}; {bg_style} margin-bottom: 2px;">'
+        f'<div style="display: flex; justify-content: space-between;">'
+        f'<strong style="font-size: 1.1em;">{c["name"]}</strong>'
+        f'<span style="color:{color}; font-weight:bold;">{status}</span></div>'
+        f'設計值: <code>{to_sig_fig(c["demand"])}{unit}</code> {symbol} '
+        f'規範值: <code>{to_sig_fig(c["capacity"])}{unit}</code></div>\n\n'
+        f'↳ ${c["formula"]}$'
+    )
+
+
+def render_checks(checks, keys):
+    """多項檢核合併為單一 markdown 元素輸出。"""
+    with stage("檢核結果方塊"):
+        st.markdown("\n\n".join(check_html(checks[k]) for k in keys), unsafe_allow_html=True)
+
+# ==========================================
+# 快取層 (型錄: cache_resource；最佳化與示意圖: cache_data，有容量上限與 TTL)
+# 單一設計的引擎結果由每個 session 的 DesignGraph 增量重算
+# ==========================================
+CACHE_TTL_S = 3600
+CACHE_MAX_ENTRIES = 256
+DB_CHOICES = {"CNS 標準 (RH 型鋼)": "CNS", "AISC 標準 (W 型鋼)": "AISC"}
+
+
+@st.cache_resource
+def get_section_table(db_key):
+    return get_table(db_key)
+
+
+@st.cache_data(max_entries=16, ttl=CACHE_TTL_S, show_spinner=False)
+def cached_search(db_key, mat_ic, mat_ej, mat_beam, *args, **kwargs):
+    return search(get_section_table(db_key), STEEL_DB[mat_ic], STEEL_DB[mat_ej], STEEL_DB[mat_beam], *args, **kwargs)
+
+
+@st.cache_data(max_entries=16, ttl=CACHE_TTL_S, show_spinner=False)
+def cached_monte_carlo(input_items, scatter_items, n_samples, seed):
+    return monte_carlo(dict(input_items), n_samples, seed=seed, scatter=dict(scatter_items))
+
+
+@st.cache_resource(max_entries=16, ttl=CACHE_TTL_S, show_spinner=False)
+def get_inverse_solver(db_key, input_items):
+    """反算求解器依設計輸入 (不含 EJ 斷面) 快取，保留其粗網格掃描供相近目標值重用。"""
+    p = dict(input_items)
+    ids, candidates = ej_candidates(get_section_table(db_key), p["bf_IC"])
+    return ids, InverseSolver(p, candidates)
+
+
+@st.cache_data(max_entries=16, ttl=CACHE_TTL_S, show_spinner=False)
+def pushover_candidates(db_key, input_items, theta_grid, h_IC_grid):
+    """候選設計組 (相容 EJ 斷面 × θ × h_IC) 的骨架參數與檢核結果，攤平為一維陣列。"""
+    p = dict(input_items)
+    table = get_section_table(db_key)
+    ids, c = ej_candidates(table, p["bf_IC"])
+    ej = {k: c[k][:, None, None] for k in ("bf_EJ", "tw_EJ", "tf_EJ")}
+    theta, h_IC = np.asarray(theta_grid)[None, :, None], np.asarray(h_IC_grid)[None, None, :]
+    res = evaluate(**dict(p, **ej, theta_deg=theta, h_IC_mm=h_IC))
+    shape = (len(ids), theta.size, h_IC.size)
+
+    def flat(v):
+        return np.broadcast_to(v, shape).ravel()
+
+    out = {k: flat(res[k]) for k in ("Ke_F", "Kp_F", "Vn_IC", "Vmax", "h_SYSC_mm", "theta_u", "K_eff_kN_mm", "W_total")}
+    depth_ok = c["d_EJ0"][:, None, None] >= d_EJ0_min_req(p["d_IC"], res["h_EJ_mm"], theta) - EJ_D_TOL
+    out["ok"] = flat(governing_ratio(res) <= 1.0) & flat(depth_ok)
+    out["ej_id"], out["theta_deg"], out["h_IC_mm"] = flat(ids[:, None, None]), flat(theta), flat(h_IC)
+    return out
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_S, show_spinner=False)
+def build_schematic(*geometry):
+    return schematic_figure(schematic_layers(*geometry))
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_S, show_spinner=False)
+def build_schematic_svg(*geometry):
+    return schematic_svg(schematic_layers(*geometry))
 
-    st.markdown(f"""
-    <div class="check-box" style="border-left: 5px solid {color}; {bg_style} margin-bottom: 2px;">
-        <div style="display: flex; justify-content: space-between;">
-            <strong style="font-size: 1.1em;">{name}</strong>
-            <span style="color:{color}; font-weight:bold;">{status}</span>
-        </div>
-        設計值: <code>{val_disp} {unit}</code> {symbol} 
-        規範值: <code>{limit_disp} {unit}</code>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    if note:
-        st.markdown(f"↳ ${note}$")
 
 # --- 頁面基本設定 ---
 st.set_page_config(page_title="TP-SYSC計算機", layout="wide")
+begin_rerun(st.session_state.get("profile_toggle"))
+mark("頁面設定")
 
 st.markdown("""
 <style>
@@ -69,563 +126,83 @@ st.title("梯形變斷面剪力降伏型耐震間柱 (TP-SYSC) 計算機")
 st.markdown("作者：傻逼巴拉")
 
 # ==========================================
-# 內建資料庫 (材料與型鋼斷面)
+# 片段 (fragment) 相依關係: 僅影響部分輸出的輸入群組，變更時只重跑相依的分頁
+# 材料、斷面與高度角度會影響所有結果，維持全頁重跑
 # ==========================================
-STEEL_DB = {
-    "SN400B": {"Fy": 235, "Ry": 1.3, "Omega": 1.5},
-    "SN490B": {"Fy": 325, "Ry": 1.2, "Omega": 1.3},
+INPUT_DEPENDENTS = {
+    "target": ["in_target", "tab_stiff", "tab_summary", "tab_opt", "tab_pareto", "tab_sweep", "tab_mc", "tab_inverse", "tab_project", "tab_hyst", "tab_push"],
+    "stiff": ["in_stiff", "tab_stiff", "tab_summary", "tab_pareto", "tab_sweep", "tab_mc", "tab_inverse", "tab_project", "tab_hyst", "tab_push"],
+    "frame": ["in_frame", "tab_frame", "tab_summary", "tab_opt", "tab_pareto", "tab_sweep", "tab_mc", "tab_inverse", "tab_project", "tab_push"],
 }
 
-# CNS
-CNS_RH_database = {
-    "294 X 302 X 12 X 12": (294, 302, 12, 12), "300 X 300 X 10 X 15": (300, 300, 10, 15),
-    "300 X 305 X 15 X 15": (300, 305, 15, 15), "304 X 301 X 11 X 17": (304, 301, 11, 17),
-    "312 X 303 X 13 X 21": (312, 303, 13, 21), "318 X 307 X 17 X 24": (318, 307, 17, 24),
-    "326 X 310 X 20 X 28": (326, 310, 20, 28), "346 X 174 X 6 X 9": (346, 174, 6, 9),
-    "350 X 175 X 7 X 11": (350, 175, 7, 11),   "336 X 249 X 8 X 12": (336, 249, 8, 12),
-    "340 X 250 X 9 X 14": (340, 250, 9, 14),   "350 X 252 X 11 X 19": (350, 252, 11, 19),
-    "356 X 256 X 15 X 22": (356, 256, 15, 22), "364 X 258 X 17 X 26": (364, 258, 17, 26),
-    "338 X 351 X 13 X 13": (338, 351, 13, 13), "344 X 348 X 10 X 16": (344, 348, 10, 16),
-    "344 X 354 X 16 X 16": (344, 354, 16, 16), "350 X 350 Theater": (350, 350, 12, 19),
-    "350 X 350 X 12 X 19": (350, 350, 12, 19), "350 X 357 X 19 X 19": (350, 357, 19, 19),
-    "360 X 354 X 16 X 24": (360, 354, 16, 24), "368 X 356 X 18 X 28": (368, 356, 18, 28),
-    "378 X 358 X 20 X 33": (378, 358, 20, 33), "396 X 199 X 7 X 11": (396, 199, 7, 11),
-    "400 X 200 X 8 X 13": (400, 200, 8, 13),   "386 X 299 X 9 X 14": (386, 299, 9, 14),
-    "390 X 300 X 10 X 16": (390, 300, 10, 16), "400 X 304 X 14 X 21": (400, 304, 14, 21),
-    "410 X 308 X 18 X 26": (410, 308, 18, 26), "418 X 310 X 20 X 30": (418, 310, 20, 30),
-    "388 X 402 X 15 X 15": (388, 402, 15, 15), "394 X 398 X 11 X 18": (394, 398, 11, 18),
-    "394 X 405 X 18 X 18": (394, 405, 18, 18), "400 X 400 X 13 X 21": (400, 400, 13, 21),
-    "400 X 408 X 21 X 21": (400, 408, 21, 21), "414 X 405 X 18 X 28": (414, 405, 18, 28),
-    "428 X 407 X 20 X 35": (428, 407, 20, 35), "458 X 417 X 30 X 50": (458, 417, 30, 50),
-    "446 X 199 X 8 X 12": (446, 199, 8, 12),   "450 X 200 X 9 X 14": (450, 200, 9, 14),
-    "456 X 201 X 10 X 17": (456, 201, 10, 17), "466 X 205 X 14 X 22": (466, 205, 14, 22),
-    "478 X 208 X 17 X 28": (478, 208, 17, 28), "434 X 299 X 10 X 15": (434, 299, 10, 15),
-    "440 X 300 X 11 X 18": (440, 300, 11, 18), "446 X 302 X 13 X 21": (446, 302, 13, 21),
-    "450 X 304 X 15 X 23": (450, 304, 15, 23), "458 X 306 X 17 X 27": (458, 306, 17, 27),
-    "468 X 308 X 19 X 32": (468, 308, 19, 32), "496 X 199 X 9 X 14": (496, 199, 9, 14),
-    "500 X 200 X 10 X 16": (500, 200, 10, 16), "506 X 201 X 11 X 19": (506, 201, 11, 19),
-    "512 X 202 X 12 X 22": (512, 202, 12, 22), "518 X 205 X 15 X 25": (518, 205, 15, 25),
-    "528 X 208 X 18 X 30": (528, 208, 18, 30), "536 X 210 X 20 X 34": (536, 210, 20, 34),
-    "548 X 215 X 25 X 40": (548, 215, 25, 40), "482 X 300 X 11 X 15": (482, 300, 11, 15),
-    "488 X 300 X 11 X 18": (488, 300, 11, 18), "494 X 302 X 13 X 21": (494, 302, 13, 21),
-    "500 X 304 X 15 X 24": (500, 304, 15, 24), "510 X 306 X 17 X 29": (510, 306, 17, 29),
-    "518 X 310 X 21 X 33": (518, 310, 21, 33), "532 X 314 X 25 X 40": (532, 314, 25, 40),
-    "596 X 199 X 10 X 15": (596, 199, 10, 15), "600 X 200 X 11 X 17": (600, 200, 11, 17),
-    "606 X 201 X 12 X 20": (606, 201, 12, 20), "612 X 202 X 13 X 23": (612, 202, 13, 23),
-    "618 X 205 X 16 X 26": (618, 205, 16, 26), "626 X 207 X 18 X 30": (626, 207, 18, 30),
-    "634 X 209 X 20 X 34": (634, 209, 20, 34), "646 X 214 X 25 X 40": (646, 214, 25, 40),
-    "582 X 300 X 12 X 17": (582, 300, 12, 17), "588 X 300 X 12 X 20": (588, 300, 12, 20),
-    "594 X 302 X 14 X 23": (594, 302, 14, 23), "600 X 304 X 16 X 26": (600, 304, 16, 26),
-    "608 X 306 X 18 X 30": (608, 306, 18, 30), "616 X 308 X 20 X 34": (616, 308, 20, 34),
-    "628 X 312 X 24 X 40": (628, 312, 24, 40), "692 X 300 X 13 X 20": (692, 300, 13, 20),
-    "700 X 300 X 13 X 24": (700, 300, 13, 24), "708 X 302 X 15 X 28": (708, 302, 15, 28),
-    "712 X 306 X 19 X 30": (712, 306, 19, 30), "718 X 308 X 21 X 33": (718, 308, 21, 33),
-    "732 X 311 X 24 X 40": (732, 311, 24, 40), "792 X 300 X 14 X 22": (792, 300, 14, 22),
-    "800 X 300 X 14 X 26": (800, 300, 14, 26), "808 X 302 X 16 X 30": (808, 302, 16, 30),
-    "816 X 306 X 20 X 34": (816, 306, 20, 34), "828 X 308 X 22 X 40": (828, 308, 22, 40)
-}
 
-# AISC
-AISC_W_database = {
-    "1118 X 404 X 26 X 45 (W44X335)": (1118, 404, 26, 45),
-    "1118 X 300 X 26 X 44 (W44x285)": (1118, 300, 26, 44),
-    "1108 X 428 X 50 X 90 (W40x655a)": (1108, 428, 50, 90),
-    "1108 X 300 X 22 X 40 (W44x248)": (1108, 300, 22, 40),
-    "1107 X 429 X 50 X 90 (W40X655)": (1107, 429, 50, 90),
-    "1107 X 401 X 22 X 40 (W44X290)": (1107, 401, 22, 40),
-    "1100 X 401 X 20 X 36 (W44X262)": (1100, 401, 20, 36),
-    "1100 X 300 X 20 X 36 (W44x224)": (1100, 300, 20, 36),
-    "1095 X 472 X 77 X 115 (W36X925)": (1095, 472, 77, 115),
-    "1095 X 462 X 64 X 115 (W36X853)": (1095, 462, 64, 115),
-    "1092 X 424 X 45 X 82 (W40X593)": (1092, 424, 45, 82),
-    "1092 X 424 X 45 X 83 (W40x593a)": (1092, 424, 45, 83),
-    "1090 X 401 X 18 X 31 (W44X230)": (1090, 401, 18, 31),
-    "1090 X 300 X 18 X 31 (W44x198)": (1090, 300, 18, 31),
-    "1082 X 457 X 60 X 109 (W36X800)": (1082, 457, 60, 109),
-    "1082 X 457 X 60 X 109 (W36X802)": (1082, 457, 60, 109),
-    "1078 X 461 X 64 X 115 (W36x848)": (1078, 461, 64, 115),
-    "1078 X 461 X 64 X 115 (W36x848a)": (1078, 461, 64, 115),
-    "1078 X 321 X 42 X 75 (W40x466)": (1078, 321, 42, 75),
-    "1075 X 419 X 41 X 74 (W40x531a)": (1075, 419, 41, 74),
-    "1069 X 417 X 39 X 70 (W40X503)": (1069, 417, 39, 70),
-    "1067 X 457 X 60 X 109 (W36x798)": (1067, 457, 60, 109),
-    "1066 X 457 X 60 X 109 (W36x798a)": (1066, 457, 60, 109),
-    "1062 X 452 X 55 X 99 (W36X723)": (1062, 452, 55, 99),
-    "1062 X 416 X 37 X 67 (W40x480a)": (1062, 416, 37, 67),
-    "1057 X 315 X 36 X 64 (W40X392)": (1057, 315, 36, 64),
-    "1050 X 412 X 34 X 61 (W40x436a)": (1050, 412, 34, 61),
-    "1049 X 411 X 34 X 60 (W40X431)": (1049, 411, 34, 60),
-    "1046 X 451 X 55 X 99 (W36x720a)": (1046, 451, 55, 99),
-    "1044 X 447 X 50 X 90 (W36X652)": (1044, 447, 50, 90),
-    "1041 X 409 X 31 X 56 (W40X397)": (1041, 409, 31, 56),
-    "1040 X 409 X 31 X 56 (W40x397a)": (1040, 409, 31, 56),
-    "1036 X 310 X 31 X 54 (W40X331)": (1036, 310, 31, 54),
-    "1036 X 307 X 30 X 54 (W40X327)": (1036, 307, 30, 54),
-    "1031 X 409 X 29 X 52 (W40X372)": (1031, 409, 29, 52),
-    "1031 X 406 X 28 X 51 (W40X362)": (1031, 406, 28, 51),
-    "1030 X 407 X 28 X 51 (W40x362a)": (1030, 407, 28, 51),
-    "1029 X 447 X 50 X 90 (W36x650)": (1029, 447, 50, 90),
-    "1028 X 446 X 50 X 90 (W36x650a)": (1028, 446, 50, 90),
-    "1026 X 305 X 27 X 49 (W40X294)": (1026, 305, 27, 49),
-    "1021 X 404 X 25 X 46 (W40X324)": (1021, 404, 25, 46),
-    "1021 X 305 X 26 X 46 (W40X278)": (1021, 305, 26, 46),
-    "1018 X 404 X 25 X 45 (W40x321)": (1018, 404, 25, 45),
-    "1016 X 455 X 23 X 44 (W40x328)": (1016, 455, 23, 44),
-    "1016 X 302 X 24 X 44 (W40X264)": (1016, 302, 24, 44),
-    "1012 X 442 X 45 X 82 (W36x588a)": (1012, 442, 45, 82),
-    "1011 X 437 X 41 X 74 (W36X529)": (1011, 437, 41, 74),
-    "1011 X 401 X 24 X 42 (W40X297)": (1011, 401, 24, 42),
-    "1008 X 453 X 21 X 40 (W40x298)": (1008, 453, 21, 40),
-    "1008 X 401 X 21 X 40 (W40X277)": (1008, 401, 21, 40),
-    "1008 X 302 X 21 X 40 (W40X235)": (1008, 302, 21, 40),
-    "1001 X 401 X 19 X 36 (W40X249)": (1001, 401, 19, 36),
-    "1001 X 300 X 19 X 36 (W40X211)": (1001, 300, 19, 36),
-    "1000 X 451 X 19 X 36 (W40x268)": (1000, 451, 19, 36),
-    "998 X 434 X 38 X 68 (W36X487)": (998, 434, 38, 68),
-    "996 X 437 X 41 X 74 (W36x527)": (996, 437, 41, 74),
-    "996 X 437 X 41 X 74 (W36x527a)": (996, 437, 41, 74),
-    "992 X 450 X 18 X 32 (W40x244)": (992, 450, 18, 32),
-    "991 X 401 X 17 X 31 (W40X215)": (991, 401, 17, 31),
-    "991 X 300 X 17 X 30 (W40X183)": (991, 300, 17, 30),
-    "990 X 300 X 17 X 31 (W40x183b)": (990, 300, 17, 31),
-    "988 X 432 X 35 X 62 (W36X441)": (988, 432, 35, 62),
-    "984 X 434 X 38 X 68 (W36x485a)": (984, 434, 38, 68),
-    "983 X 401 X 17 X 27 (W40X199)": (983, 401, 17, 27),
-    "982 X 450 X 18 X 27 (W40x221)": (982, 450, 18, 27),
-    "980 X 300 X 17 X 26 (W40X167)": (980, 300, 17, 26),
-    "977 X 430 X 50 X 90 (W33x619a)": (977, 430, 50, 90),
-    "975 X 427 X 31 X 56 (W36X395)": (975, 427, 31, 56),
-    "973 X 432 X 35 X 62 (W36x439)": (973, 432, 35, 62),
-    "972 X 431 X 35 X 62 (W36x439a)": (972, 431, 35, 62),
-    "970 X 450 X 18 X 21 (W40x192)": (970, 450, 18, 21),
-    "970 X 400 X 17 X 21 (W40x174)": (970, 400, 17, 21),
-    "970 X 300 X 16 X 21 (W40X149)": (970, 300, 16, 21),
-    "965 X 424 X 28 X 51 (W36X361)": (965, 424, 28, 51),
-    "963 X 425 X 46 X 83 (W33x567a)": (963, 425, 46, 83),
-    "960 X 427 X 31 X 56 (W36x393)": (960, 427, 31, 56),
-    "960 X 427 X 31 X 56 (W36x393a)": (960, 427, 31, 56),
-    "958 X 422 X 26 X 47 (W36X330)": (958, 422, 26, 47),
-    "951 X 310 X 24 X 44 (W36x256b)": (951, 310, 24, 44),
-    "950 X 425 X 28 X 51 (W36x359a)": (950, 425, 28, 51),
-    "950 X 424 X 28 X 51 (W36x359)": (950, 424, 28, 51),
-    "950 X 310 X 24 X 44 (W36X256)": (950, 310, 24, 44),
-    "949 X 421 X 42 X 76 (W33x515a)": (949, 421, 42, 76),
-    "947 X 424 X 24 X 43 (W36X302)": (947, 424, 24, 43),
-    "942 X 422 X 22 X 40 (W36X282)": (942, 422, 22, 40),
-    "942 X 422 X 26 X 47 (W36x328)": (942, 422, 26, 47),
-    "942 X 422 X 26 X 47 (W36x328a)": (942, 422, 26, 47),
-    "942 X 307 X 22 X 40 (W36X232)": (942, 307, 22, 40),
-    "937 X 422 X 21 X 37 (W36X262)": (937, 422, 21, 37),
-    "935 X 418 X 39 X 69 (W33x468a)": (935, 418, 39, 69),
-    "933 X 423 X 24 X 43 (W36x16.5)": (933, 423, 24, 43),
-    "932 X 424 X 24 X 43 (W36x300)": (932, 424, 24, 43),
-    "932 X 419 X 20 X 34 (W36X247)": (932, 419, 20, 34),
-    "932 X 310 X 21 X 35 (W36X210)": (932, 310, 21, 35),
-    "927 X 422 X 22 X 40 (W36x280)": (927, 422, 22, 40),
-    "927 X 419 X 19 X 32 (W36X231)": (927, 419, 19, 32),
-    "927 X 308 X 20 X 32 (W36x12)": (927, 308, 20, 32),
-    "927 X 307 X 19 X 32 (W36X194)": (927, 307, 19, 32),
-    "923 X 414 X 35 X 63 (W33x424a)": (923, 414, 35, 63),
-    "922 X 422 X 21 X 37 (W36x260)": (922, 422, 21, 37),
-    "922 X 307 X 18 X 30 (W36X182)": (922, 307, 18, 30),
-    "919 X 306 X 17 X 28 (W36x170b)": (919, 306, 17, 28),
-    "919 X 305 X 17 X 28 (W36X170)": (919, 305, 17, 28),
-    "917 X 419 X 20 X 34 (W36x245)": (917, 419, 20, 34),
-    "914 X 411 X 32 X 58 (W33X387)": (914, 411, 32, 58),
-    "914 X 305 X 17 X 26 (W36X160)": (914, 305, 17, 26),
-    "913 X 411 X 32 X 58 (W33x387a)": (913, 411, 32, 58),
-    "912 X 419 X 19 X 32 (W36x230)": (912, 419, 19, 32),
-    "912 X 305 X 16 X 24 (W36X150)": (912, 305, 16, 24),
-    "904 X 409 X 29 X 53 (W33X354)": (904, 409, 29, 53),
-    "904 X 305 X 15 X 20 (W36X135)": (904, 305, 15, 20),
-    "903 X 409 X 29 X 53 (W33x354a)": (903, 409, 29, 53),
-    "899 X 411 X 50 X 90 (W30x581a)": (899, 411, 50, 90),
-    "894 X 406 X 26 X 48 (W33X318)": (894, 406, 26, 48),
-    "893 X 406 X 26 X 48 (W33x318a)": (893, 406, 26, 48),
-    "884 X 404 X 24 X 44 (W33X291)": (884, 404, 24, 44),
-    "883 X 407 X 45 X 82 (W30x526a)": (883, 407, 45, 82),
-    "876 X 401 X 22 X 40 (W33X263)": (876, 401, 22, 40),
-    "869 X 404 X 21 X 36 (W33X241)": (869, 404, 21, 36),
-    "869 X 403 X 41 X 75 (W30x477)": (869, 403, 41, 75),
-    "869 X 403 X 41 X 75 (W30x477a)": (869, 403, 41, 75),
-    "861 X 401 X 20 X 33 (W33X221)": (861, 401, 20, 33),
-    "859 X 292 X 17 X 31 (W33X169)": (859, 292, 17, 31),
-    "859 X 292 X 17 X 31 (W33x169b)": (859, 292, 17, 31),
-    "856 X 399 X 18 X 29 (W33X201)": (856, 399, 18, 29),
-    "855 X 399 X 38 X 68 (W30x433a)": (855, 399, 38, 68),
-    "851 X 403 X 21 X 36 (W33x240)": (851, 403, 21, 36),
-    "851 X 295 X 16 X 27 (W33X152)": (851, 295, 16, 27),
-    "846 X 292 X 15 X 24 (W33X141)": (846, 292, 15, 24),
-    "845 X 402 X 20 X 32 (W33x220)": (845, 402, 20, 32),
-    "843 X 396 X 35 X 62 (W30X391)": (843, 396, 35, 62),
-    "843 X 396 X 35 X 62 (W30x391a)": (843, 396, 35, 62),
-    "841 X 292 X 15 X 22 (W33X130)": (841, 292, 15, 22),
-    "838 X 400 X 18 X 29 (W33x200)": (838, 400, 18, 29),
-    "836 X 292 X 14 X 19 (W33X118)": (836, 292, 14, 19),
-    "833 X 394 X 31 X 57 (W30X357)": (833, 394, 31, 57),
-    "833 X 393 X 31 X 57 (W30x357a)": (833, 393, 31, 57),
-    "826 X 389 X 50 X 90 (W27X539)": (826, 389, 50, 90),
-    "826 X 387 X 50 X 90 (W27x539a)": (826, 387, 50, 90),
-    "823 X 391 X 29 X 52 (W30X326)": (823, 391, 29, 52),
-    "823 X 390 X 29 X 52 (W30x326a)": (823, 390, 29, 52),
-    "813 X 389 X 26 X 47 (W30X292)": (813, 389, 26, 47),
-    "813 X 387 X 26 X 47 (W30x292a)": (813, 387, 26, 47),
-    "812 X 383 X 46 X 83 (W27x494a)": (812, 383, 46, 83),
-    "803 X 386 X 24 X 42 (W30X261)": (803, 386, 24, 42),
-    "798 X 379 X 42 X 76 (W27x448)": (798, 379, 42, 76),
-    "798 X 379 X 42 X 76 (W27x448a)": (798, 379, 42, 76),
-    "795 X 384 X 21 X 38 (W30X235)": (795, 384, 21, 38),
-    "785 X 384 X 20 X 34 (W30X211)": (785, 384, 20, 34),
-    "784 X 376 X 39 X 69 (W27x407a)": (784, 376, 39, 69),
-    "780 X 381 X 18 X 30 (W30X191)": (780, 381, 18, 30),
-    "780 X 267 X 17 X 30 (W30X148)": (780, 267, 17, 30),
-    "779 X 266 X 17 X 30 (W30x148b)": (779, 266, 17, 30),
-    "772 X 384 X 20 X 33 (W30x210)": (772, 384, 20, 33),
-    "772 X 381 X 17 X 27 (W30X173)": (772, 381, 17, 27),
-    "772 X 373 X 35 X 63 (W27X368)": (772, 373, 35, 63),
-    "772 X 372 X 35 X 63 (W27x368a)": (772, 372, 35, 63),
-    "770 X 267 X 16 X 25 (W30X132)": (770, 267, 16, 25),
-    "767 X 267 X 15 X 24 (W30X124)": (767, 267, 15, 24),
-    "765 X 382 X 18 X 30 (W30x190)": (765, 382, 18, 30),
-    "762 X 371 X 32 X 58 (W27X336)": (762, 371, 32, 58),
-    "762 X 369 X 32 X 58 (W27x336a)": (762, 369, 32, 58),
-    "762 X 267 X 14 X 22 (W30X116)": (762, 267, 14, 22),
-    "759 X 381 X 17 X 27 (W30x172)": (759, 381, 17, 27),
-    "757 X 267 X 14 X 19 (W30X108)": (757, 267, 14, 19),
-    "754 X 267 X 13 X 17 (W30X99)": (754, 267, 13, 17),
-    "753 X 359 X 50 X 90 (W24x492)": (753, 359, 50, 90),
-    "753 X 359 X 50 X 90 (W24x492a)": (753, 359, 50, 90),
-    "752 X 367 X 29 X 53 (W27x307a)": (752, 367, 29, 53),
-    "752 X 366 X 29 X 53 (W27X307)": (752, 366, 29, 53),
-    "749 X 264 X 12 X 15 (W30X90)": (749, 264, 12, 15),
-    "744 X 366 X 27 X 49 (W27X281)": (744, 366, 27, 49),
-    "744 X 364 X 27 X 49 (W27x281a)": (744, 364, 27, 49),
-    "739 X 354 X 46 X 83 (W24x450a)": (739, 354, 46, 83),
-    "737 X 363 X 25 X 45 (W27X258)": (737, 363, 25, 45),
-    "736 X 362 X 25 X 45 (W27x28)": (736, 362, 25, 45),
-    "729 X 361 X 23 X 41 (W27X235)": (729, 361, 23, 41),
-    "725 X 351 X 42 X 76 (W24x408)": (725, 351, 42, 76),
-    "725 X 351 X 42 X 76 (W24x408a)": (725, 351, 42, 76),
-    "721 X 358 X 21 X 38 (W27X217)": (721, 358, 21, 38),
-    "714 X 356 X 19 X 34 (W27X194)": (714, 356, 19, 34),
-    "711 X 348 X 39 X 69 (W24X370)": (711, 348, 39, 69),
-    "711 X 347 X 39 X 69 (W24x370a)": (711, 347, 39, 69),
-    "706 X 358 X 18 X 30 (W27X178)": (706, 358, 18, 30),
-    "702 X 254 X 15 X 28 (W27x129b)": (702, 254, 15, 28),
-    "701 X 356 X 17 X 27 (W27X161)": (701, 356, 17, 27),
-    "701 X 254 X 15 X 28 (W27X129)": (701, 254, 15, 28),
-    "699 X 343 X 35 X 63 (W24x335a)": (699, 343, 35, 63),
-    "698 X 343 X 35 X 63 (W24X335)": (698, 343, 35, 63),
-    "696 X 356 X 15 X 25 (W27X146)": (696, 356, 15, 25),
-    "694 X 358 X 18 X 30 (W27x177)": (694, 358, 18, 30),
-    "693 X 257 X 14 X 24 (W27X114)": (693, 257, 14, 24),
-    "689 X 340 X 32 X 58 (W24x306a)": (689, 340, 32, 58),
-    "688 X 356 X 17 X 27 (W27x160)": (688, 356, 17, 27),
-    "688 X 340 X 32 X 58 (W24X306)": (688, 340, 32, 58),
-    "688 X 254 X 13 X 21 (W27X102)": (688, 254, 13, 21),
-    "683 X 355 X 15 X 25 (W27x145)": (683, 355, 15, 25),
-    "683 X 254 X 12 X 19 (W27X94)": (683, 254, 12, 19),
-    "679 X 338 X 29 X 53 (W24x279a)": (679, 338, 29, 53),
-    "678 X 338 X 29 X 53 (W24X279)": (678, 338, 29, 53),
-    "678 X 254 X 12 X 16 (W27X84)": (678, 254, 12, 16),
-    "669 X 335 X 26 X 48 (W24x250a)": (669, 335, 26, 48),
-    "668 X 335 X 26 X 48 (W24X250)": (668, 335, 26, 48),
-    "661 X 340 X 44 X 80 (W21x402a)": (661, 340, 44, 80),
-    "660 X 333 X 24 X 44 (W24X229)": (660, 333, 24, 44),
-    "653 X 330 X 22 X 40 (W24X207)": (653, 330, 22, 40),
-    "648 X 330 X 21 X 37 (W24X192)": (648, 330, 21, 37),
-    "647 X 337 X 40 X 72 (W21x364a)": (647, 337, 40, 72),
-    "640 X 328 X 19 X 34 (W24X176)": (640, 328, 19, 34),
-    "635 X 334 X 37 X 67 (W21x333a)": (635, 334, 37, 67),
-    "635 X 330 X 18 X 31 (W24X162)": (635, 330, 18, 31),
-    "628 X 358 X 17 X 29 (W24x160)": (628, 358, 17, 29),
-    "627 X 328 X 17 X 28 (W24X146)": (627, 328, 17, 28),
-    "623 X 330 X 34 X 60 (W21x300a)": (623, 330, 34, 60),
-    "623 X 229 X 14 X 25 (W24x103b)": (623, 229, 14, 25),
-    "622 X 357 X 15 X 26 (W24x145)": (622, 357, 15, 26),
-    "622 X 328 X 15 X 24 (W24X131)": (622, 328, 15, 24),
-    "622 X 229 X 14 X 25 (W24X103)": (622, 229, 14, 25),
-    "617 X 325 X 14 X 22 (W24X117)": (617, 325, 14, 22),
-    "617 X 307 X 14 X 24 (W24x120)": (617, 307, 14, 24),
-    "617 X 230 X 13 X 22 (W24X94)": (617, 230, 13, 22),
-    "616 X 356 X 14 X 23 (W24x130)": (616, 356, 14, 23),
-    "614 X 306 X 13 X 22 (W24x110)": (614, 306, 13, 22),
-    "613 X 327 X 31 X 56 (W21x275a)": (613, 327, 31, 56),
-    "612 X 328 X 31 X 56 (W21X275)": (612, 328, 31, 56),
-    "612 X 325 X 13 X 19 (W24X104)": (612, 325, 13, 19),
-    "612 X 229 X 12 X 20 (W24X84)": (612, 229, 12, 20),
-    "610 X 305 X 12 X 20 (W24x100)": (610, 305, 12, 20),
-    "607 X 228 X 11 X 17 (W24X76)": (607, 228, 11, 17),
-    "603 X 324 X 28 X 51 (W21x248a)": (603, 324, 28, 51),
-    "602 X 325 X 28 X 51 (W21X248)": (602, 325, 28, 51),
-    "602 X 228 X 11 X 15 (W24X68)": (602, 228, 11, 15),
-    "602 X 179 X 11 X 15 (W24X62)": (602, 179, 11, 15),
-    "602 X 178 X 11 X 15 (W24x61)": (602, 178, 11, 15),
-    "599 X 478 X 100 X 140 (W14X873)": (599, 478, 100, 140),
-    "599 X 178 X 10 X 13 (W24X55)": (599, 178, 10, 13),
-    "594 X 323 X 25 X 45 (W21X223)": (594, 323, 25, 45),
-    "584 X 320 X 23 X 41 (W21X201)": (584, 320, 23, 41),
-    "579 X 472 X 95 X 130 (W14X808)": (579, 472, 95, 130),
-    "577 X 318 X 21 X 38 (W21X182)": (577, 318, 21, 38),
-    "572 X 315 X 19 X 35 (W21X166)": (572, 315, 19, 35),
-    "569 X 455 X 78 X 125 (W14X730)": (569, 455, 78, 125),
-    "569 X 454 X 78 X 125 (W14x730a)": (569, 454, 78, 125),
-    "567 X 305 X 39 X 70 (W18x311a)": (567, 305, 39, 70),
-    "566 X 305 X 39 X 70 (W18X311)": (566, 305, 39, 70),
-    "561 X 318 X 18 X 29 (W21X147)": (561, 318, 18, 29),
-    "556 X 302 X 36 X 64 (W18X283)": (556, 302, 36, 64),
-    "555 X 302 X 36 X 64 (W18x283a)": (555, 302, 36, 64),
-    "554 X 315 X 17 X 26 (W21X132)": (554, 315, 17, 26),
-    "551 X 315 X 15 X 24 (W21X122)": (551, 315, 15, 24),
-    "550 X 448 X 72 X 115 (W14x665a)": (550, 448, 72, 115),
-    "549 X 450 X 72 X 115 (W14X665)": (549, 450, 72, 115),
-    "549 X 214 X 15 X 24 (W21X93)": (549, 214, 15, 24),
-    "546 X 312 X 14 X 22 (W21X111)": (546, 312, 14, 22),
-    "546 X 300 X 33 X 58 (W18X258)": (546, 300, 33, 58),
-    "545 X 334 X 17 X 28 (W21x142)": (545, 334, 17, 28),
-    "545 X 299 X 33 X 58 (W18x258a)": (545, 299, 33, 58),
-    "544 X 312 X 13 X 20 (W21X101)": (544, 312, 13, 20),
-    "544 X 212 X 13 X 21 (W21X83)": (544, 212, 13, 21),
-    "539 X 332 X 15 X 25 (W21x127)": (539, 332, 15, 25),
-    "538 X 211 X 12 X 19 (W21X73)": (538, 211, 12, 19),
-    "537 X 230 X 15 X 24 (W21x96)": (537, 230, 15, 24),
-    "536 X 297 X 29 X 54 (W18X234)": (536, 297, 29, 54),
-    "536 X 210 X 11 X 17 (W21X68)": (536, 210, 11, 17),
-    "536 X 167 X 10 X 17 (W21X57)": (536, 167, 10, 17),
-    "535 X 296 X 29 X 54 (W18x234a)": (535, 296, 29, 54),
-    "533 X 330 X 13 X 22 (W21x112)": (533, 330, 13, 22),
-    "533 X 209 X 10 X 16 (W21X62)": (533, 209, 10, 16),
-    "531 X 442 X 66 X 106 (W14X605)": (531, 442, 66, 106),
-    "531 X 442 X 66 X 106 (W14x605a)": (531, 442, 66, 106),
-    "530 X 228 X 13 X 20 (W21x82)": (530, 228, 13, 20),
-    "529 X 166 X 9 X 14 (W21x49)": (529, 166, 9, 14),
-    "528 X 209 X 10 X 13 (W21X55)": (528, 209, 10, 13),
-    "528 X 166 X 10 X 14 (W21X50)": (528, 166, 10, 14),
-    "526 X 295 X 27 X 49 (W18X211)": (526, 295, 27, 49),
-    "526 X 165 X 9 X 11 (W21X44)": (526, 165, 9, 11),
-    "525 X 293 X 27 X 49 (W18x211a)": (525, 293, 27, 49),
-    "523 X 207 X 9 X 11 (W21X48)": (523, 207, 9, 11),
-    "518 X 292 X 24 X 44 (W18X192)": (518, 292, 24, 44),
-    "514 X 437 X 60 X 97 (W14x550a)": (514, 437, 60, 97),
-    "513 X 437 X 60 X 97 (W14X550)": (513, 437, 60, 97),
-    "508 X 290 X 23 X 40 (W18X175)": (508, 290, 23, 40),
-    "500 X 287 X 21 X 37 (W18X158)": (500, 287, 21, 37),
-    "498 X 432 X 56 X 89 (W14X500)": (498, 432, 56, 89),
-    "498 X 432 X 56 X 89 (W14x500a)": (498, 432, 56, 89),
-    "495 X 284 X 19 X 34 (W18X143)": (495, 284, 19, 34),
-    "490 X 284 X 17 X 30 (W18X130)": (490, 284, 17, 30),
-    "483 X 428 X 51 X 82 (W14x455a)": (483, 428, 51, 82),
-    "483 X 427 X 51 X 82 (W14X455)": (483, 427, 51, 82),
-    "483 X 287 X 17 X 27 (W18X119)": (483, 287, 17, 27),
-    "475 X 424 X 48 X 77 (W14X426)": (475, 424, 48, 77),
-    "475 X 284 X 15 X 24 (W18X106)": (475, 284, 15, 24),
-    "474 X 424 X 48 X 77 (W13x426a)": (474, 424, 48, 77),
-    "474 X 424 X 48 X 77 (W14x426a)": (474, 424, 48, 77),
-    "472 X 282 X 14 X 22 (W18X97)": (472, 282, 14, 22),
-    "470 X 194 X 13 X 21 (W18X71)": (470, 194, 13, 21),
-    "469 X 301 X 15 X 25 (W18x114)": (469, 301, 15, 25),
-    "467 X 282 X 12 X 20 (W18X86)": (467, 282, 12, 20),
-    "467 X 193 X 11 X 19 (W18X65)": (467, 193, 11, 19),
-    "465 X 422 X 45 X 72 (W14X398)": (465, 422, 45, 72),
-    "465 X 421 X 45 X 72 (W13x398a)": (465, 421, 45, 72),
-    "465 X 421 X 45 X 72 (W14x398a)": (465, 421, 45, 72),
-    "465 X 300 X 14 X 23 (W18x105)": (465, 300, 14, 23),
-    "465 X 224 X 13 X 23 (W18x85)": (465, 224, 13, 23),
-    "462 X 279 X 11 X 17 (W18X76)": (462, 279, 11, 17),
-    "462 X 192 X 11 X 18 (W18X60)": (462, 192, 11, 18),
-    "461 X 298 X 13 X 21 (W18x96)": (461, 298, 13, 21),
-    "461 X 223 X 12 X 21 (W18x77)": (461, 223, 12, 21),
-    "460 X 191 X 10 X 16 (W18X55)": (460, 191, 10, 16),
-    "460 X 154 X 9 X 15 (W18X46)": (460, 154, 9, 15),
-    "457 X 222 X 11 X 19 (W18x70)": (457, 222, 11, 19),
-    "457 X 190 X 9 X 14 (W18X50)": (457, 190, 9, 14),
-    "455 X 419 X 42 X 68 (W14X370)": (455, 419, 42, 68),
-    "455 X 418 X 42 X 68 (W13x370a)": (455, 418, 42, 68),
-    "455 X 418 X 42 X 68 (W14x370a)": (455, 418, 42, 68),
-    "455 X 153 X 8 X 13 (W18X40)": (455, 153, 8, 13),
-    "454 X 221 X 10 X 17 (W18x64)": (454, 221, 10, 17),
-    "454 X 190 X 9 X 13 (W18x45)": (454, 190, 9, 13),
-    "450 X 152 X 8 X 11 (W18X35)": (450, 152, 8, 11),
-    "446 X 416 X 39 X 63 (W13x342a)": (446, 416, 39, 63),
-    "446 X 416 X 39 X 63 (W14x342a)": (446, 416, 39, 63),
-    "444 X 417 X 39 X 63 (W14X342)": (444, 417, 39, 63),
-    "437 X 412 X 36 X 58 (W14x314)": (437, 412, 36, 58),
-    "435 X 412 X 36 X 57 (W13x311a)": (435, 412, 36, 57),
-    "435 X 412 X 36 X 57 (W14x311a)": (435, 412, 36, 57),
-    "434 X 411 X 36 X 57 (W14X311)": (434, 411, 36, 57),
-    "432 X 264 X 15 X 25 (W16X100)": (432, 264, 15, 25),
-    "431 X 265 X 15 X 24 (W16x400)": (431, 265, 15, 24),
-    "427 X 424 X 48 X 53 (W14x320)": (427, 424, 48, 53),
-    "427 X 410 X 33 X 53 (W14x287)": (427, 410, 33, 53),
-    "427 X 340 X 45 X 75 (W12X336)": (427, 340, 45, 75),
-    "427 X 340 X 45 X 75 (W12x336a)": (427, 340, 45, 75),
-    "427 X 264 X 13 X 22 (W16X89)": (427, 264, 13, 22),
-    "425 X 409 X 33 X 53 (W13x283a)": (425, 409, 33, 53),
-    "425 X 409 X 33 X 53 (W14x283a)": (425, 409, 33, 53),
-    "424 X 409 X 33 X 53 (W14X283)": (424, 409, 33, 53),
-    "419 X 407 X 31 X 49 (W14x264)": (419, 407, 31, 49),
-    "419 X 262 X 12 X 19 (W16X77)": (419, 262, 12, 19),
-    "417 X 406 X 30 X 48 (W14X257)": (417, 406, 30, 48),
-    "417 X 181 X 11 X 18 (W16X57)": (417, 181, 11, 18),
-    "416 X 406 X 30 X 48 (W13x257a)": (416, 406, 30, 48),
-    "416 X 406 X 30 X 48 (W14x257a)": (416, 406, 30, 48),
-    "415 X 338 X 41 X 69 (W12x305a)": (415, 338, 41, 69),
-    "415 X 293 X 14 X 22 (W16x96)": (415, 293, 14, 22),
-    "415 X 218 X 13 X 22 (W16x78)": (415, 218, 13, 22),
-    "414 X 335 X 41 X 69 (W12X305)": (414, 335, 41, 69),
-    "414 X 259 X 10 X 17 (W16X67)": (414, 259, 10, 17),
-    "414 X 180 X 10 X 16 (W16X50)": (414, 180, 10, 16),
-    "413 X 405 X 29 X 46 (W14x246)": (413, 405, 29, 46),
-    "410 X 292 X 13 X 20 (W16x88)": (410, 292, 13, 20),
-    "410 X 217 X 12 X 20 (W16x71)": (410, 217, 12, 20),
-    "409 X 404 X 28 X 44 (W14x237)": (409, 404, 28, 44),
-    "409 X 179 X 9 X 14 (W16X45)": (409, 179, 9, 14),
-    "407 X 404 X 27 X 44 (W13x233a)": (407, 404, 27, 44),
-    "407 X 404 X 27 X 44 (W14x233a)": (407, 404, 27, 44),
-    "406 X 404 X 27 X 44 (W14X233)": (406, 404, 27, 44),
-    "406 X 403 X 27 X 43 (W14x228)": (406, 403, 27, 43),
-    "406 X 216 X 11 X 18 (W16x64)": (406, 216, 11, 18),
-    "406 X 178 X 8 X 13 (W16X40)": (406, 178, 8, 13),
-    "404 X 333 X 39 X 63 (W12X279)": (404, 333, 39, 63),
-    "404 X 178 X 7 X 11 (W16X36)": (404, 178, 7, 11),
-    "404 X 140 X 7 X 11 (W16X31)": (404, 140, 7, 11),
-    "403 X 402 X 26 X 41 (W14x219)": (403, 402, 26, 41),
-    "403 X 334 X 39 X 63 (W12x279a)": (403, 334, 39, 63),
-    "403 X 215 X 10 X 16 (W16x58)": (403, 215, 10, 16),
-    "399 X 401 X 25 X 40 (W13x211)": (399, 401, 25, 40),
-    "399 X 401 X 25 X 40 (W14X211)": (399, 401, 25, 40),
-    "399 X 140 X 6 X 9 (W16X26)": (399, 140, 6, 9),
-    "397 X 400 X 24 X 38 (W14x202)": (397, 400, 24, 38),
-    "394 X 399 X 23 X 37 (W14X193)": (394, 399, 23, 37),
-    "393 X 399 X 23 X 37 (W13x193)": (393, 399, 23, 37),
-    "391 X 398 X 21 X 35 (W14x184)": (391, 398, 21, 35),
-    "391 X 330 X 36 X 57 (W12X252)": (391, 330, 36, 57),
-    "391 X 330 X 35 X 57 (W12x252a)": (391, 330, 35, 57),
-    "387 X 398 X 21 X 33 (W13x176)": (387, 398, 21, 33),
-    "386 X 399 X 21 X 33 (W14X176)": (386, 399, 21, 33),
-    "384 X 396 X 20 X 32 (W14x167)": (384, 396, 20, 32),
-    "384 X 328 X 33 X 53 (W12X230)": (384, 328, 33, 53),
-    "382 X 328 X 33 X 53 (W12x230a)": (382, 328, 33, 53),
-    "381 X 396 X 19 X 30 (W14X159)": (381, 396, 19, 30),
-    "381 X 395 X 19 X 30 (W14x158)": (381, 395, 19, 30),
-    "380 X 395 X 19 X 30 (W13x159)": (380, 395, 19, 30),
-    "378 X 394 X 18 X 29 (W14x150)": (378, 394, 18, 29),
-    "376 X 394 X 17 X 28 (W14X145)": (376, 394, 17, 28),
-    "375 X 394 X 17 X 28 (W13x145)": (375, 394, 17, 28),
-    "375 X 394 X 17 X 27 (W14x142)": (375, 394, 17, 27),
-    "375 X 374 X 17 X 27 (W14x136)": (375, 374, 17, 27),
-    "374 X 325 X 30 X 48 (W12x210a)": (374, 325, 30, 48),
-    "373 X 373 X 16 X 26 (W14X132)": (373, 373, 16, 26),
-    "373 X 325 X 30 X 48 (W12X210)": (373, 325, 30, 48),
-    "371 X 373 X 15 X 25 (W14x127)": (371, 373, 15, 25),
-    "368 X 373 X 15 X 24 (W14X120)": (368, 373, 15, 24),
-    "368 X 372 X 14 X 24 (W14x119)": (368, 372, 14, 24),
-    "366 X 323 X 27 X 44 (W12X190)": (366, 323, 27, 44),
-    "365 X 371 X 14 X 22 (W14x111)": (365, 371, 14, 22),
-    "363 X 371 X 13 X 22 (W14X109)": (363, 371, 13, 22),
-    "363 X 257 X 13 X 22 (W14X82)": (363, 257, 13, 22),
-    "362 X 370 X 13 X 21 (W14x103)": (362, 370, 13, 21),
-    "361 X 371 X 12 X 20 (W14X99)": (361, 371, 12, 20),
-    "361 X 257 X 11 X 20 (W14X74)": (361, 257, 11, 20),
-    "360 X 305 X 11 X 20 (W14x84)": (360, 305, 11, 20),
-    "359 X 369 X 12 X 19 (W14x95)": (359, 369, 12, 19),
-    "358 X 172 X 8 X 13 (W14X38)": (358, 172, 8, 13),
-    "357 X 305 X 11 X 18 (W14x78)": (357, 305, 11, 18),
-    "356 X 368 X 11 X 17 (W14x87)": (356, 368, 11, 17),
-    "356 X 368 X 11 X 18 (W14X90)": (356, 368, 11, 18),
-    "356 X 320 X 24 X 40 (W12X170)": (356, 320, 24, 40),
-    "356 X 254 X 11 X 18 (W14X68)": (356, 254, 11, 18),
-    "356 X 171 X 7 X 12 (W14X34)": (356, 171, 7, 12),
-    "353 X 318 X 23 X 38 (W12x161)": (353, 318, 23, 38),
-    "353 X 254 X 10 X 16 (W14X61)": (353, 254, 10, 16),
-    "353 X 205 X 9 X 17 (W14X53)": (353, 205, 9, 17),
-    "353 X 128 X 6 X 11 (W14X26)": (353, 128, 6, 11),
-    "351 X 204 X 9 X 15 (W14X48)": (351, 204, 9, 15),
-    "351 X 171 X 7 X 10 (W14X30)": (351, 171, 7, 10),
-    "348 X 318 X 22 X 36 (W12X152)": (348, 318, 22, 36),
-    "348 X 203 X 8 X 13 (W14X43)": (348, 203, 8, 13),
-    "348 X 127 X 6 X 9 (W14X22)": (348, 127, 6, 9),
-    "340 X 315 X 20 X 32 (W12X136)": (340, 315, 20, 32),
-    "340 X 314 X 19 X 31 (W12x133)": (340, 314, 19, 31),
-    "333 X 312 X 18 X 28 (W12X120)": (333, 312, 18, 28),
-    "328 X 310 X 15 X 25 (W12X106)": (328, 310, 15, 25),
-    "324 X 310 X 15 X 23 (W12x99)": (324, 310, 15, 23),
-    "323 X 310 X 14 X 23 (W12X96)": (323, 310, 14, 23),
-    "321 X 309 X 14 X 22 (W12x92)": (321, 309, 14, 22),
-    "318 X 307 X 13 X 20 (W12x85)": (318, 307, 13, 20),
-    "318 X 307 X 13 X 21 (W12X87)": (318, 307, 13, 21),
-    "318 X 167 X 8 X 13 (W12X35)": (318, 167, 8, 13),
-    "315 X 307 X 12 X 19 (W12X79)": (315, 307, 12, 19),
-    "312 X 305 X 11 X 17 (W12X72)": (312, 305, 11, 17),
-    "312 X 166 X 7 X 11 (W12X30)": (312, 166, 7, 11),
-    "312 X 102 X 7 X 11 (W12X22)": (312, 102, 7, 11),
-    "311 X 167 X 8 X 14 (W12x36)": (311, 167, 8, 14),
-    "310 X 254 X 9 X 16 (W12X58)": (310, 254, 9, 16),
-    "310 X 205 X 9 X 16 (W12X50)": (310, 205, 9, 16),
-    "310 X 165 X 6 X 10 (W12X26)": (310, 165, 6, 10),
-    "310 X 102 X 6 X 9 (W12X19)": (310, 102, 6, 9),
-    "307 X 305 X 10 X 15 (W12X65)": (307, 305, 10, 15),
-    "307 X 254 X 9 X 15 (W12X53)": (307, 254, 9, 15),
-    "307 X 204 X 9 X 15 (W12X45)": (307, 204, 9, 15),
-    "307 X 166 X 7 X 12 (W12x31)": (307, 166, 7, 12),
-    "305 X 102 X 6 X 7 (W12x16.5)": (305, 102, 6, 7),
-    "305 X 101 X 6 X 7 (W12X16)": (305, 101, 6, 7),
-    "304 X 165 X 6 X 10 (W12x27)": (304, 165, 6, 10),
-    "302 X 203 X 7 X 13 (W12X40)": (302, 203, 7, 13),
-    "302 X 101 X 5 X 6 (W12X14)": (302, 101, 5, 6),
-    "290 X 264 X 19 X 32 (W10X112)": (290, 264, 19, 32),
-    "282 X 262 X 17 X 28 (W10X100)": (282, 262, 17, 28),
-    "276 X 261 X 16 X 25 (W10x89)": (276, 261, 16, 25),
-    "274 X 262 X 15 X 25 (W10X88)": (274, 262, 15, 25),
-    "269 X 259 X 13 X 22 (W10X77)": (269, 259, 13, 22),
-    "267 X 258 X 13 X 21 (W10x72)": (267, 258, 13, 21),
-    "267 X 148 X 8 X 13 (W10X30)": (267, 148, 8, 13),
-    "264 X 257 X 12 X 19 (W10x66)": (264, 257, 12, 19),
-    "264 X 257 X 12 X 20 (W10X68)": (264, 257, 12, 20),
-    "262 X 147 X 7 X 11 (W10X26)": (262, 147, 7, 11),
-    "260 X 147 X 7 X 13 (W10x29)": (260, 147, 7, 13),
-    "259 X 257 X 11 X 17 (W10X60)": (259, 257, 11, 17),
-    "259 X 146 X 6 X 9 (W10X22)": (259, 146, 6, 9),
-    "259 X 102 X 6 X 10 (W10X19)": (259, 102, 6, 10),
-    "257 X 254 X 9 X 16 (W10X54)": (257, 254, 9, 16),
-    "257 X 204 X 9 X 16 (W10X45)": (257, 204, 9, 16),
-    "257 X 102 X 6 X 8 (W10X17)": (257, 102, 6, 8),
-    "256 X 146 X 6 X 11 (W10x25)": (256, 146, 6, 11),
-    "254 X 254 X 9 X 14 (W10X49)": (254, 254, 9, 14),
-    "254 X 102 X 6 X 7 (W10X15)": (254, 102, 6, 7),
-    "252 X 203 X 8 X 13 (W10X39)": (252, 203, 8, 13),
-    "251 X 146 X 6 X 9 (W10x21)": (251, 146, 6, 9),
-    "251 X 101 X 5 X 5 (W10X12)": (251, 101, 5, 5),
-    "251 X 100 X 5 X 5 (W10x11.5)": (251, 100, 5, 5),
-    "247 X 202 X 7 X 11 (W10X33)": (247, 202, 7, 11),
-    "229 X 210 X 14 X 24 (W8X67)": (229, 210, 14, 24),
-    "222 X 209 X 13 X 21 (W8X58)": (222, 209, 13, 21),
-    "216 X 206 X 10 X 17 (W8X48)": (216, 206, 10, 17),
-    "210 X 205 X 9 X 14 (W8X40)": (210, 205, 9, 14),
-    "210 X 134 X 6 X 10 (W8X21)": (210, 134, 6, 10),
-    "207 X 134 X 6 X 10 (W8x20)": (207, 134, 6, 10),
-    "207 X 133 X 6 X 8 (W8X18)": (207, 133, 6, 8),
-    "206 X 204 X 8 X 13 (W8X35)": (206, 204, 8, 13),
-    "206 X 102 X 6 X 8 (W8X15)": (206, 102, 6, 8),
-    "205 X 166 X 7 X 12 (W8X28)": (205, 166, 7, 12),
-    "203 X 203 X 7 X 11 (W8X31)": (203, 203, 7, 11),
-    "203 X 133 X 6 X 8 (W8x17)": (203, 133, 6, 8),
-    "203 X 102 X 6 X 6 (W8X13)": (203, 102, 6, 6),
-    "201 X 165 X 6 X 10 (W8X24)": (201, 165, 6, 10),
-    "200 X 100 X 4 X 5 (W8X10)": (200, 100, 4, 5),
-    "162 X 154 X 8 X 12 (W6X25)": (162, 154, 8, 12),
-    "160 X 102 X 7 X 10 (W6X16)": (160, 102, 7, 10),
-    "157 X 153 X 7 X 9 (W6X20)": (157, 153, 7, 9),
-    "153 X 102 X 6 X 7 (W6X12)": (153, 102, 6, 7),
-    "152 X 152 X 6 X 7 (W6X15)": (152, 152, 6, 7),
-    "152 X 152 X 6 X 7 (W6x15.5)": (152, 152, 6, 7),
-    "150 X 100 X 4 X 5 (W6X9)": (150, 100, 4, 5),
-    "148 X 100 X 4 X 5 (W6X8.5)": (148, 100, 4, 5),
-    "131 X 128 X 7 X 11 (W5X19)": (131, 128, 7, 11),
-    "130 X 128 X 7 X 11 (W5x18.5)": (130, 128, 7, 11),
-    "127 X 127 X 6 X 9 (W5X16)": (127, 127, 6, 9),
-    "106 X 103 X 7 X 9 (W4X13)": (106, 103, 7, 9)
-}
+def rerun_dependents(group):
+    st.rerun(INPUT_DEPENDENTS[group])
+
+
+def design_state():
+    """組合目前設計輸入 (全頁輸入 + 各片段輸入) 並取得引擎結果與檢核結果集 (僅重算變動輸入的下游節點)。"""
+    ss = st.session_state
+    p = dict(ss["base_inputs"])
+    table = get_section_table(p["db_key"])
+    beam_id = ss[f"beam_id_{p['db_key']}"]
+    p["d_b"], p["bf_b"], p["tw_b"], p["tf_b"] = table.dims(beam_id)
+    p["rh_beam"] = table.names[beam_id]
+    for k in ("target_drift", "n_v", "n_h", "ts_stiff", "bs_stiff", "d_c", "L_b", "mat_beam", "t_dp"):
+        p[k] = ss[k]
+    p["Fy_beam"] = STEEL_DB[p["mat_beam"]]["Fy"]
+    graph = ss.setdefault("design_graph", DesignGraph())
+    graph.set(**{k: p[k] for k in INPUTS})
+    return p, graph.result(), graph.checks()
+
+
+def sidebar_case(p):
+    """側欄設計轉為案例欄位 (同 batch.CASE_FIELDS)，供專案共用參數與計算書使用。"""
+    return dict(
+        db=p["db_key"], ic_profile=p["ic_profile"], ej_profile=p["ej_profile"], beam_profile=p["rh_beam"],
+        mat_ic=p["mat_ic_w"], mat_ej=p["mat_ej_w"], mat_beam=p["mat_beam"],
+        **{k: p[k] for k in ("E_GPa", "target_drift", "h_SYSC_mm", "h_IC_mm", "theta_deg", "ts_End",
+                             "n_v", "n_h", "ts_stiff", "bs_stiff", "d_c", "L_b", "t_dp")},
+    )
+
+
+@st.fragment(key="in_target")
+def target_inputs():
+    with st.expander("耐震目標", expanded=True):
+        st.number_input("目標層間側移角IDR: θd (%rad)", min_value=1.0, max_value=5.0, value=3.0, step=0.5,
+                        key="target_drift", on_change=rerun_dependents, args=("target",))
+
+
+STIFFENER_DEFAULTS = dict(n_v=1, n_h=2, ts_stiff=11.0, bs_stiff=99.0)
+
+
+@st.fragment(key="in_stiff")
+def stiffener_inputs():
+    with st.expander("加勁板配置"):
+        dep = dict(on_change=rerun_dependents, args=("stiff",))
+        for k, v in STIFFENER_DEFAULTS.items():  # 預設值先寫入 session，加勁板分頁的「套用」可改寫
+            st.session_state.setdefault(k, v)
+        st.number_input("縱向加勁板數量 nL", min_value=0, step=1, key="n_v", **dep)
+        st.number_input("橫向加勁板數量 nT", min_value=0, step=1, key="n_h", **dep)
+        st.number_input("加勁板厚度 ts (mm)", min_value=10.0, step=1.0, key="ts_stiff", **dep)
+        st.number_input("加勁板寬度 bs (mm)", min_value=90.0, step=9.0, key="bs_stiff", **dep)
+
+
+@st.fragment(key="in_frame")
+def frame_inputs(db_key):
+    table = get_section_table(db_key)
+    with st.expander("邊界梁柱構架尺寸"):
+        dep = dict(on_change=rerun_dependents, args=("frame",))
+        st.number_input("邊界柱深度 dc (mm)", value=500.0, step=50.0, key="d_c", **dep)
+        st.number_input("梁跨距 Lb (m)", value=6.0, step=0.1, key="L_b", **dep)
+        # 預設值先寫入 session，邊界梁分頁的「套用」可改寫 (邊界梁同樣跟隨選擇的資料庫)
+        for k, v in ((f"beam_id_{db_key}", len(table) - 1), ("mat_beam", "SN490B"), ("t_dp", 15.0)):
+            st.session_state.setdefault(k, v)
+        st.selectbox("邊界梁鋼材", list(STEEL_DB.keys()), key="mat_beam", **dep)
+        st.selectbox("選取邊界梁型鋼尺寸", range(len(table)), format_func=table.names.__getitem__,
+                     key=f"beam_id_{db_key}", **dep)
+        st.number_input("交會區貼板厚度 t_dp (mm)", step=1.0, key="t_dp", **dep)
+
 
 # ==========================================
 # 設計者輸入區
@@ -633,18 +210,23 @@ AISC_W_database = {
 st.sidebar.header("📝 設計輸入參數")
 
 # --- 新增：資料庫選擇器 ---
-db_choice = st.sidebar.radio("🗂️ 型鋼資料庫選擇", ["CNS 標準 (RH 型鋼)", "AISC 標準 (W 型鋼)"])
-current_db = CNS_RH_database if db_choice == "CNS 標準 (RH 型鋼)" else AISC_W_database
+mark("型錄與資料庫選擇")
+db_choice = st.sidebar.radio("🗂️ 型鋼資料庫選擇", list(DB_CHOICES))
+current_table = get_section_table(DB_CHOICES[db_choice])
+sec_name = current_table.names.__getitem__
 
-with st.sidebar.expander("耐震目標", expanded=True):
-    target_drift = st.number_input("目標層間側移角IDR: θd (%rad)", min_value=1.0, max_value=5.0, value=3.0, step=0.5)
+mark("側欄輸入")
+ss = st.session_state
+if "pending_design" in ss:  # 其他分頁選取的設計，須在側欄元件建立前寫入
+    ss.update(ss.pop("pending_design"))
+with st.sidebar:
+    target_inputs()
 
 with st.sidebar.expander("材料性質", expanded=True):
     mat_ic_w = st.selectbox("IC段鋼材", list(STEEL_DB.keys()), index=1)
     mat_ej_w = st.selectbox("EJ段鋼材", list(STEEL_DB.keys()), index=1)
     mat_stiff = st.selectbox("加勁板鋼材", list(STEEL_DB.keys()), index=1)
     E_GPa = st.number_input("楊氏模數 E (GPa)", value=200.0, step=1.0)
-    nu = 0.3
     
     Fy_IC = STEEL_DB[mat_ic_w]["Fy"]
     Ry_IC = STEEL_DB[mat_ic_w]["Ry"]
@@ -654,342 +236,852 @@ with st.sidebar.expander("材料性質", expanded=True):
 
 with st.sidebar.expander("高度與角度設定", expanded=True):
     h_SYSC_mm = st.number_input("間柱全高 h_SYSC (mm)", value=2600.0, step=10.0)
-    h_IC_mm = st.number_input("IC段高度 h_IC (mm)", value=750.0, step=10.0)
+    ss.setdefault("h_IC_mm", 750.0)
+    h_IC_mm = st.number_input("IC段高度 h_IC (mm)", step=10.0, key="h_IC_mm")
     
     # 動態讀取選擇的資料庫
-    default_ic_key = "488 X 300 X 11 X 18" if ("488 X 300 X 11 X 18" in current_db) else list(current_db.keys())[0]
-    ic_profile = st.selectbox("選取 IC 段型鋼斷面", list(current_db.keys()), index=list(current_db.keys()).index(default_ic_key))
-    d_IC, bf_IC, tw_IC, tf_IC = current_db[ic_profile]
+    # 預設值先寫入 session (不傳 index / value)，其他分頁可於下次重跑前改寫
+    ss.setdefault(f"ic_id_{DB_CHOICES[db_choice]}", current_table.ids.get("488 X 300 X 11 X 18", 0))
+    ic_id = st.selectbox("選取 IC 段型鋼斷面", range(len(current_table)), format_func=sec_name,
+                         key=f"ic_id_{DB_CHOICES[db_choice]}")
+    ic_profile = sec_name(ic_id)
+    d_IC, bf_IC, tw_IC, tf_IC = current_table.dims(ic_id)
 
     ts_End = st.number_input("端部加勁板厚度 ts_End (mm)", value=float(tf_IC), step=1.0)
     
-    h_EJ_mm = (h_SYSC_mm - h_IC_mm - 2 * ts_End) / 2.0
+    h_EJ_mm = ej_height(h_SYSC_mm, h_IC_mm, ts_End)
     st.info(f"單邊EJ段高度 $h_{{EJ}}$: **{to_sig_fig(h_EJ_mm)}** mm")
 
-    theta_deg = st.number_input("輸入錐形角度 θ (deg)", value=8.5, min_value=0.0, max_value=90.0, step=0.5)
-    theta_sol = math.radians(theta_deg)
+    ss.setdefault("theta_deg", 8.5)
+    theta_deg = st.number_input("輸入錐形角度 θ (deg)", min_value=0.0, max_value=90.0, step=0.5, key="theta_deg")
 
     # 根據輸入的 theta 篩選 EJ
-    d_EJ0_min_req = (d_IC + h_EJ_mm * math.tan(theta_sol)) * math.cos(theta_sol)
-    filtered_ej_options = [name for name, (d_v, bf_v, tw_v, tf_v) in current_db.items() if (abs(bf_v - bf_IC) <= 20 and d_v >= d_EJ0_min_req - 2.0)]
-    if not filtered_ej_options: 
-        filtered_ej_options = list(current_db.keys())
-    
-    default_ej_key = "616 X 308 X 20 X 34" if ("616 X 308 X 20 X 34" in filtered_ej_options) else filtered_ej_options[0]
-    
-    ej_profile = st.selectbox("選取 EJ 段型鋼斷面", filtered_ej_options, index=filtered_ej_options.index(default_ej_key))
-    d_EJ0, bf_EJ, tw_EJ, tf_EJ = current_db[ej_profile]
-
-with st.sidebar.expander("加勁板配置"):
-    n_v = st.number_input("縱向加勁板數量 nL", min_value=0, value=1, step=1)
-    n_h = st.number_input("橫向加勁板數量 nT", min_value=0, value=2, step=1)
-    ts_stiff = st.number_input("加勁板厚度 ts (mm)", min_value=10.0, value=11.0, step=1.0)
-    bs_stiff = st.number_input("加勁板寬度 bs (mm)", min_value=90.0, value=99.0, step=9.0)
-
-with st.sidebar.expander("邊界梁柱構架尺寸"):
-    d_c = st.number_input("邊界柱深度 dc (mm)", value=500.0, step=50.0)
-    L_b = st.number_input("梁跨距 Lb (m)", value=6.0, step=0.1)
-    mat_beam = st.selectbox("邊界梁鋼材", list(STEEL_DB.keys()), index=1)
+    d_EJ0_req = d_EJ0_min_req(d_IC, h_EJ_mm, theta_deg)
+    filtered_ej_ids = current_table.ej_candidates(bf_IC, d_EJ0_req - EJ_D_TOL).tolist()
+    if not filtered_ej_ids: 
+        filtered_ej_ids = list(range(len(current_table)))
     
-    # 邊界梁同樣跟隨選擇的資料庫
-    rh_beam = st.selectbox("選取邊界梁型鋼尺寸", list(current_db.keys()), index=len(current_db)-1)
-    d_b, bf_b, tw_b, tf_b = current_db[rh_beam]
+    default_ej_id = current_table.ids.get("616 X 308 X 20 X 34", -1)
+    default_ej_id = default_ej_id if default_ej_id in filtered_ej_ids else filtered_ej_ids[0]
     
-    t_dp = st.number_input("交會區貼板厚度 t_dp (mm)", value=15.0, step=1.0)
-    Fy_beam = STEEL_DB[mat_beam]["Fy"]
-    
-# ==========================================
-# 核心力學引擎 (串聯柔度法 + 精確積分)
-# ==========================================
-E = E_GPa * 1000.0
-nu = 0.3
-G = E / (2 * (1 + nu))
-theta_d = target_drift / 100.0
-
-d_EJ1 = d_IC
-d_EJ2 = d_EJ1 + 2 * h_EJ_mm * math.tan(theta_sol)
-
-# 1. 核心段性質與柔度 (f_IC)
-Ix_IC = (bf_IC * d_IC**3 - (bf_IC - tw_IC) * (d_IC - 2 * tf_IC)**3) / 12.0
-Av_IC = d_IC * tw_IC
-f_IC = h_IC_mm / (G * Av_IC) + h_IC_mm**3 / (12.0 * E * Ix_IC)
-
-# 2. 連接段兩端性質
-I_EJ1 = (bf_EJ * d_EJ1**3 - (bf_EJ - tw_EJ) * (d_EJ1 - 2 * tf_EJ)**3) / 12.0
-I_EJ2 = (bf_EJ * d_EJ2**3 - (bf_EJ - tw_EJ) * (d_EJ2 - 2 * tf_EJ)**3) / 12.0
-Av_EJ1 = d_EJ1 * tw_EJ
-Av_EJ2 = d_EJ2 * tw_EJ
-
-# 3. EJ 等效性質轉換 (積分精確解)
-Av_eq_EJ = (Av_EJ2 - Av_EJ1) / math.log(Av_EJ2 / Av_EJ1) if abs(Av_EJ2 - Av_EJ1) > 1e-5 else Av_EJ1
-
-L_half = h_SYSC_mm / 2.0
-b_val = math.sqrt(I_EJ1)
-a_val = math.sqrt(I_EJ2)
-alpha_user = 0.5 * h_IC_mm / (h_EJ_mm + ts_End)
-L0_core = 0.5 * h_IC_mm 
-
-den_part1 = (alpha_user**2) / (a_val * b_val)
-den_part2 = (1.0 + b_val/a_val + (2.0*b_val/(b_val-a_val)) * math.log(a_val/b_val)) / (b_val - a_val)**2 if abs(b_val-a_val) > 1e-5 else (1.0 / I_EJ1)
-
-I_eq_EJ = (alpha_user**2 + 1.0/3.0) / (den_part1 + den_part2)
-
-# 4. 連接段總柔度 (f_EJ)
-eta = h_IC_mm / h_SYSC_mm
-f_EJ_shear = ((1.0 - eta) * h_SYSC_mm) / (G * Av_eq_EJ)
-f_EJ_flex = (h_SYSC_mm**3 - h_IC_mm**3) / (12.0 * E * I_eq_EJ)
-f_EJ = f_EJ_shear + f_EJ_flex
-f_total = f_IC + f_EJ
-
-# 5. 系統總勁度
-K_EE = 1.0 / (2.0 * f_EJ) 
-Ke_IC = 1.0 / (h_IC_mm / (G * tw_IC * d_IC) + h_IC_mm**3 / (12 * E * Ix_IC))
-Kp_IC = 1.0 / (h_IC_mm / (0.02 * G * tw_IC * d_IC) + h_IC_mm**3 / (12 * E * Ix_IC))
-Ke_F = 1.0 / f_total 
-Kp_F = 1.0 / (1.0 / Kp_IC + 1.0 / K_EE) 
-
-theta_y = 0.6 * Fy_IC * tw_IC * d_IC / (Ke_F * h_SYSC_mm)
-theta_ed = (Ke_F / K_EE) * theta_y + (Kp_F / K_EE) * (theta_d - theta_y)
-
-# 強度與極限值
-Vn_IC = 0.6 * Fy_IC * tw_IC * d_IC
-Vmax = Omega_IC * Ry_IC * Vn_IC 
-
-# 1. 韌性檢核標準
-bf_ratio_limit = 0.38 * math.sqrt(E / (Ry_EJ * Fy_EJ))
-EJ_ratio_limit = 2.61 * math.sqrt(E / (Ry_EJ * Fy_EJ))
-
-# 2. LTB 放寬標準
-Iy_EJ2 = 1/12 * (tf_EJ * bf_EJ**3 * 2 + (d_EJ2 - 2 * tf_EJ) * tw_EJ**3)
-A_EJ2 = tf_EJ * bf_EJ * 2 + (d_EJ2 - 2 * tf_EJ) * tw_EJ
-ry_EJ2 = math.sqrt(Iy_EJ2 / A_EJ2)
-ho = d_EJ2 - tf_EJ
-J = (2 * bf_EJ * tf_EJ**3 + (d_EJ2 - 2 * tf_EJ) * tw_EJ**3) / 3
-Cw = Iy_EJ2 * ho**2 / 4
-Sx_EJ2 = (1/12 * (bf_EJ * d_EJ2**3 - (bf_EJ - tw_EJ) * (d_EJ2 - 2 * tf_EJ)**3)) / (d_EJ2/2)
-rts = math.sqrt(math.sqrt(Iy_EJ2 * Cw) / Sx_EJ2) if Sx_EJ2 > 0 else 0
-Lr_limit = 1.95 * rts * E / (0.7 * Fy_EJ) * math.sqrt(J / (Sx_EJ2 * ho) + math.sqrt((J / (Sx_EJ2 * ho))**2 + 6.76 * (0.7 * Fy_EJ / E)**2))
-
-# 3. 容量設計 (EJ 段與 IC 翼板)
-Vn_EJ_design = 0.9 * (0.6 * Fy_EJ * tw_EJ * d_EJ1)
-Zf_IC = bf_IC * tf_IC * (d_IC - tf_IC)
-Mn_IC_design = 0.9 * (Ry_IC * Zf_IC * Fy_IC)
-Zx_EJ2 = bf_EJ * tf_EJ * (d_EJ2 - tf_EJ) + tw_EJ * (d_EJ2 / 2 - tf_EJ)**2
-Mn_EJ_design = 0.9 * (Zx_EJ2 * Fy_EJ)
-
-# 4. 加勁板詳細參數
-gamma_d = (h_SYSC_mm / h_IC_mm) * (theta_d - theta_ed)
-gamma_y = (0.6 * Fy_IC) / G
-nL, nT = n_v, n_h
-ds_val = (d_IC - 2 * tf_IC) / (nL + 1.0) if nL > 0 else (d_IC - 2 * tf_IC)
-hs_val = h_IC_mm / (nT + 1.0) if nT > 0 else h_IC_mm
-alpha_s = ds_val / hs_val
-kc = (8.95 + 5.6 / (alpha_s**2)) if alpha_s >= 1.0 else (5.6 + 8.95 / (alpha_s**2))
-lambda_nw = (hs_val / tw_IC) * math.sqrt(0.6 * Fy_IC / (kc * E))
-hs_tw_limit = math.sqrt(8.5 * kc / (2 * gamma_d - gamma_y)) if (2 * gamma_d - gamma_y) > 0 else 200.0
-
-# 加勁剛度比需求
-rs_star_threshold = 2.0 if gamma_d > 0.12 else 1.0
-D_plate = E * tw_IC**3 / (12.0 * (1.0 - nu**2))
-Is_stiff = ts_stiff * bs_stiff**3 / 3.0
-rs_stiff = E * Is_stiff / (h_IC_mm * D_plate)
-alpha_s_log = np.log10(alpha_s) if alpha_s > 0 else 0
-rs_star = 152.7 * alpha_s_log**2 + 21.14 * alpha_s_log + 26.34
-rs_ratio = rs_stiff / rs_star
-
-# 根據配置逆推最大剪應變需求 gamma_u
-gamma_u = 0.5 * (8.5 * kc / ((hs_val / tw_IC) ** 2) + gamma_y)
-
-# 回推最大層間位移角 theta_u
-theta_u = theta_y + (gamma_u - gamma_y) * (h_IC_mm / h_SYSC_mm)
-
-# 邊界構架計算 
-L_b_mm = L_b * 1000.0
-Zx_beam = bf_b * tf_b * (d_b - tf_b) + tw_b * (d_b / 2 - tf_b)**2
-Mp_beam = Zx_beam * Fy_beam
-Vn_beam = 0.6 * Fy_beam * d_b * tw_b
-
-omega_beam = 1.1
-V_ult = omega_beam * Ry_IC * Vn_IC
-L_prime = (L_b_mm - d_EJ2 - d_c) / 2.0 
-M_b2 = 1.1 * Mp_beam
-M_b1 = (V_ult * (h_SYSC_mm / 2.0 + d_b / 2.0) - M_b2 * (d_EJ2 / (2.0 * L_prime))) / (1.0 + (d_EJ2 / (2.0 * L_prime)))
-V_b = (M_b1 + M_b2) / L_prime
-V_u_PZ = (V_ult * h_SYSC_mm / (d_EJ2 - tf_EJ)) - V_b
-V_n_PZ = 0.6 * Fy_beam * d_b * (tw_b + t_dp)
+    if ss.get(f"ej_id_{DB_CHOICES[db_choice]}") not in filtered_ej_ids:
+        ss[f"ej_id_{DB_CHOICES[db_choice]}"] = default_ej_id
+    ej_id = st.selectbox("選取 EJ 段型鋼斷面", filtered_ej_ids, format_func=sec_name, key=f"ej_id_{DB_CHOICES[db_choice]}")
+    ej_profile = sec_name(ej_id)
+    d_EJ0, bf_EJ, tw_EJ, tf_EJ = current_table.dims(ej_id)
 
-# ==========================================
-# 用鋼量與 KWR 計算 (kg)
-# ==========================================
-rho_steel = 7.85e-6
-W_IC = (2 * bf_IC * tf_IC + (d_IC - 2 * tf_IC) * tw_IC) * h_IC_mm * rho_steel
-W_EJ = 2 * (2 * bf_EJ * tf_EJ + ((d_EJ1 + d_EJ2) / 2.0 - 2 * tf_EJ) * tw_EJ) * h_EJ_mm * rho_steel
-W_ES = 2 * ((d_IC + 20.0) * max(bf_IC, bf_EJ) * ts_End) * rho_steel
-W_stiff = (2 * n_h * (d_IC - 2 * tf_IC) * bs_stiff * ts_stiff + 2 * n_v * h_IC_mm * bs_stiff * ts_stiff) * rho_steel
-W_total = W_IC + W_EJ + W_ES + W_stiff
-K_eff_kN_mm = Ke_F / 1000.0
-KWR = K_eff_kN_mm / W_total
+with st.sidebar:
+    stiffener_inputs()
+    frame_inputs(DB_CHOICES[db_choice])
+
+# 全頁輸入存入 session，供片段重跑時讀取
+st.session_state["base_inputs"] = dict(
+    db_choice=db_choice, db_key=DB_CHOICES[db_choice],
+    mat_ic_w=mat_ic_w, mat_ej_w=mat_ej_w, mat_stiff=mat_stiff, E_GPa=E_GPa,
+    Fy_IC=Fy_IC, Ry_IC=Ry_IC, Omega_IC=Omega_IC, Fy_EJ=Fy_EJ, Ry_EJ=Ry_EJ,
+    h_SYSC_mm=h_SYSC_mm, h_IC_mm=h_IC_mm, ts_End=ts_End, theta_deg=theta_deg,
+    ic_profile=ic_profile, d_IC=d_IC, bf_IC=bf_IC, tw_IC=tw_IC, tf_IC=tf_IC,
+    ej_profile=ej_profile, bf_EJ=bf_EJ, tw_EJ=tw_EJ, tf_EJ=tf_EJ,
+)
+mark("力學計算 (DesignGraph)")
+design_state()
 
 
 # ==========================================
-# 輸出分頁
+# 輸出分頁 (各分頁為獨立片段，核心力學引擎見 engine.py)
 # ==========================================
-tab1, tab2, tab3, tab4 = st.tabs(["⚙️韌性設計與容量設計", "🛡️加勁板設計", "🏗️邊界梁與交會區容量設計", "📐設計結果與示意圖"])
-
-with tab1:
+@st.fragment(key="tab_ductility")
+@profiled("分頁: 韌性設計")
+def ductility_tab():
+    _, _, checks = design_state()
     st.subheader("1. 韌性設計 (Ductility Design)")
-    detail_check("EJ段翼板寬厚比 λf", bf_EJ/(2*tf_EJ), bf_ratio_limit, note=r"\lambda_{f,md} = 0.38\sqrt{E / R_y F_y}")
-    detail_check("EJ段腹板寬厚比 λw", (d_EJ2-2*tf_EJ)/tw_EJ, EJ_ratio_limit, note=r"\lambda_{w,md} = 2.61\sqrt{E / R_y F_y}")
-    detail_check("未側撐長度 Lb", h_SYSC_mm, 10000, "mm", note=r"L_r")
-    
+    render_checks(checks, ("lambda_f", "lambda_w", "Lb"))
+
     st.divider()
     st.subheader("2. 容量設計 (Capacity Design)")
-    detail_check("EJ段剪力容量設計 (Vmax vs. φVn)", Vmax/1000, Vn_EJ_design/1000, "kN", note=r"\phi V_{n,EJ} = 0.9(0.6 F_y t_{w,EJ} d_{EJ1})")
-    detail_check("EJ段彎矩容量設計 (Mu vs. φMn)", (Vmax*h_SYSC_mm/2)/1e6, Mn_EJ_design/1e6, "kNm", note=r"M_u = V_{max}h_{TVSC}/2 \le \phi M_{n,EJ}")
-    detail_check("IC段彎矩容量設計 (Mu vs. φMn)", (Vmax*h_IC_mm/2)/1e6, Mn_IC_design/1e6, "kNm", note=r"M_{u,IC} = V_{max}h_{IC}/2 \le \phi M_{n,IC(flange)}")
+    render_checks(checks, ("EJ_shear", "EJ_moment", "IC_moment"))
 
-with tab2:
+
+@st.fragment(key="tab_stiff")
+@profiled("分頁: 加勁板設計")
+def stiffener_tab():
+    _, r, checks = design_state()
     st.subheader("3. 加勁板配置設計檢核")
-    st.info(f"IC段目標剪應變 γd: **{to_sig_fig(gamma_d * 100)}** %rad")
+    st.info(f"IC段目標剪應變 γd: **{to_sig_fig(r['gamma_d'] * 100)}** %rad")
     st.markdown(r"↳ $\gamma_d = \frac{h_{TVSC}}{h_{IC}}(\theta_d - \theta_{e,d})$")
-    detail_check("子板塊寬厚比 hs/tw", hs_val/tw_IC, hs_tw_limit, note=r"h_s/t_w \le \sqrt{8.5k_c / (2\gamma_d - \gamma_y)}")
-    detail_check("標準化寬厚比 λnw (上限)", lambda_nw, 0.6, note=r"\lambda_{nw} = \frac{h_s}{t_w}\sqrt{\frac{0.6F_y}{k_c E}} \le 0.6")
-    detail_check("標準化寬厚比 λnw (下限)", lambda_nw, 0.145, is_lower_bound=True, note=r"\lambda_{nw} \ge 0.145")
-    detail_check("最適加勁剛度比 rs/rs*", rs_ratio, rs_star_threshold, is_lower_bound=True, note=r"\gamma_s / \gamma_s^* \ge " + str(to_sig_fig(rs_star_threshold)))
+    render_checks(checks, ("hs_tw", "lambda_nw_max", "lambda_nw_min", "rs"))
     
     st.divider()
-    st.info(f"IC段最大剪應變 γu: **{to_sig_fig(gamma_u * 100)}** %rad (依據目前加勁板配置)")
+    st.info(f"IC段最大剪應變 γu: **{to_sig_fig(r['gamma_u'] * 100)}** %rad (依據目前加勁板配置)")
     st.markdown(r"↳ $\gamma_u = 0.5\left(\frac{8.5k_c}{(h_s/t_w)^2} + \gamma_y\right)$")
     
-    st.info(f"最大層間位移角IDR $\\theta_u$: **{to_sig_fig(theta_u * 100)}** %rad")
+    st.info(f"最大層間位移角IDR $\\theta_u$: **{to_sig_fig(r['theta_u'] * 100)}** %rad")
     st.markdown(r"↳ $\theta_u = \theta_y + (\gamma_u - \gamma_y) \frac{h_{IC}}{h_{SYSC}}$")
 
-with tab3:
+    st.divider()
+    st.subheader("🧮 加勁板配置建議")
+    best, stats = stiffener_layouts(r)
+    st.caption(f"窮舉 nL 0–{STIFFENER_GRID[0][-1]}、nT 0–{STIFFENER_GRID[1][-1]}、ts {STIFFENER_GRID[2][0]:g}–{STIFFENER_GRID[2][-1]:g} mm、"
+               f"bs {STIFFENER_GRID[3][0]:g}–{STIFFENER_GRID[3][-1]:g} mm 共 {stats['layouts']:,} 種配置，"
+               f"通過 {stats['passing']:,} 種；耗時 {to_sig_fig(stats['elapsed_s'] * 1e3)} ms")
+    if best["min_weight"] is None:
+        st.error("網格內沒有通過加勁板檢核的配置，請調整 IC 斷面、h_IC 或目標層間位移角。")
+        return
+    for col, (key, title) in zip(st.columns(2), (("min_weight", "最輕配置 (W_stiff 最小)"), ("max_gamma_u", "最大 γu / θu 配置"))):
+        b = best[key]
+        col.markdown(f"**{title}**\n\n"
+                     f"nL = **{b['n_v']}**、nT = **{b['n_h']}**、ts = **{b['ts_stiff']:g}** mm、bs = **{b['bs_stiff']:g}** mm\n\n"
+                     f"W_stiff {to_sig_fig(b['W_stiff'])} kg、γu {to_sig_fig(b['gamma_u'] * 100)} %rad、"
+                     f"θu {to_sig_fig(b['theta_u'] * 100)} %rad、檢核比 {to_sig_fig(b['ratio'])}")
+        if col.button("套用至側欄", key=f"apply_stiff_{key}"):
+            st.session_state["pending_design"] = {k: b[k] for k in STIFFENER_DEFAULTS}
+            st.rerun(scope="app")
+
+
+@st.fragment(key="tab_frame")
+@profiled("分頁: 邊界梁與交會區")
+def frame_tab():
+    p, r, checks = design_state()
     st.subheader("4. 邊界梁與交會區容量設計")
-    detail_check("邊界梁彎矩容量設計", M_b1/Mp_beam, 1.0, note=r"M_{b1} = \frac{V_{ult}(h_{TVSC}/2 + d_b/2) - M_{b2}(d_{EJ2}/2L')}{1 + d_{EJ2}/2L'}")
-    detail_check("邊界梁剪力容量設計", V_b/Vn_beam, 1.0, note=r"V_b = \frac{M_{b1} + M_{b2}}{L'}")
-    detail_check("交會區剪力容量設計", V_u_PZ/V_n_PZ, 1.0, note=r"V_{u,PZ} = \frac{V_{ult} h_{TVSC}}{d_{EJ2} - t_f} - V_b")
+    render_checks(checks, ("beam_moment", "beam_shear", "PZ_shear"))
 
-with tab4:
+    st.divider()
+    st.subheader("🧮 邊界梁與貼板建議")
+    best, _, stats = beam_selection(get_section_table(p["db_key"]), r, STEEL_DB, p["d_c"], p["L_b"])
+    st.caption(f"型錄 {stats['sections']} 個斷面 (相異幾何 {stats['geometries']} 種) × {stats['grades']} 種鋼材一次檢核 (M_b1/Mp、V_b/Vn)，"
+               f"通過 {stats['passing']} 組；貼板厚取交會區剪力所需值並進位至 {PLATE_STEP:g} mm；"
+               f"耗時 {to_sig_fig(stats['elapsed_s'] * 1e3)} ms")
+    st.dataframe([
+        {"鋼材": g, "最輕通過梁": b["name"], "單位重 (kg/m)": to_sig_fig(b["w_kg_m"]), "彎矩檢核比": to_sig_fig(b["ratio_moment"]),
+         "剪力檢核比": to_sig_fig(b["ratio_shear"]), "所需貼板 t_dp (mm)": f"{b['t_dp']:g}"} if b else
+        {"鋼材": g, "最輕通過梁": "型錄中無通過者"}
+        for g, b in best.items()
+    ], width="stretch", hide_index=True)
+    for col, (g, b) in zip(st.columns(len(best)), best.items()):
+        if b and col.button(f"套用 {g} 建議", key=f"apply_beam_{g}"):
+            st.session_state["pending_design"] = {f"beam_id_{p['db_key']}": b["id"], "mat_beam": g, "t_dp": b["t_dp"]}
+            st.rerun(scope="app")
+
+
+@st.fragment(key="tab_summary")
+@profiled("分頁: 設計結果與示意圖")
+def summary_tab():
+    p, r, checks = design_state()
     st.subheader("📊 完整設計檢核彙整")
     with st.expander("🔍 詳細計算數據", expanded=True):
-        col_l, col_r = st.columns(2)
-        with col_l:
-            detail_check("EJ段翼板寬厚比 λf", bf_EJ/(2*tf_EJ), bf_ratio_limit, note=r"\lambda_{f,md} = 0.38\sqrt{E / R_y F_y}")
-            detail_check("EJ段腹板寬厚比 λw", (d_EJ2-2*tf_EJ)/tw_EJ, EJ_ratio_limit, note=r"\lambda_{w,md} = 2.61\sqrt{E / R_y F_y}")
-            detail_check("未側撐長度 Lb", h_SYSC_mm, Lr_limit, "mm", note=r"L_r = 1.95 r_{ts} \frac{E}{0.7F_y} \sqrt{\dots}")
-            detail_check("EJ段剪力容量設計", Vmax/1000, Vn_EJ_design/1000, "kN", note=r"\phi V_{n,EJ} = 0.9(0.6 F_y t_{w,EJ} d_{EJ1})")
-            detail_check("EJ段彎矩容量設計", (Vmax*h_SYSC_mm/2)/1e6, Mn_EJ_design/1e6, "kN-m", note=r"M_u = V_{max}h_{TVSC}/2 \le \phi M_{n,EJ}")
-            detail_check("IC段彎矩容量設計", (Vmax*h_IC_mm/2)/1e6, Mn_IC_design/1e6, "kN-m", note=r"M_{u,IC} \le \phi M_{n,IC}")
-        with col_r:
-            detail_check("子板塊寬厚比 hs/tw", hs_val/tw_IC, hs_tw_limit, note=r"h_s/t_w \le \sqrt{8.5k_c / (2\gamma_d - \gamma_y)}")
-            detail_check("最適加勁剛度比 rs/rs*", rs_ratio, rs_star_threshold, is_lower_bound=True, note=r"\gamma_s / \gamma_s^* \ge " + str(to_sig_fig(rs_star_threshold)))
-            detail_check("邊界梁彎矩容量設計", M_b1/Mp_beam, 1.0, note=r"M_{b1} = \dots")
-            detail_check("邊界梁剪力容量設計", V_b/Vn_beam, 1.0, note=r"V_b = \frac{M_{b1} + M_{b2}}{L'}")
-            detail_check("交會區剪力容量設計", V_u_PZ/V_n_PZ, 1.0, note=r"V_{u,PZ} = \dots")
+        st.dataframe([
+            {"檢核項目": c["name"], "設計值": to_sig_fig(c["demand"]), "規範值": to_sig_fig(c["capacity"]),
+             "單位": c["unit"], "檢核比": to_sig_fig(c["ratio"]), "結果": "OK!" if c["ok"] else "NG!"}
+            for c in checks.values()
+        ], width="stretch", hide_index=True)
+        st.download_button(
+            "下載檢核結果 (JSON)",
+            lambda: checks_json(checks, db=p["db_choice"], IC=p["ic_profile"], EJ=p["ej_profile"], beam=p["rh_beam"],
+                                inputs={k: float(p[k]) for k in INPUTS}),
+            file_name="TP-SYSC_checks.json", mime="application/json",
+        )
 
     st.divider()
     st.subheader("📝 設計總覽 (Summary)")
     st.markdown(f"""
-    - **目前使用資料庫**: `{db_choice}`
-    - **IC段**: `{ic_profile}` ({mat_ic_w})
-    - **EJ段**: `{ej_profile}` ({mat_ej_w})
-    - **邊界梁**: `{rh_beam}` ({mat_beam})
-    - **最大剪應變 $\gamma_u$**: **{to_sig_fig(gamma_u * 100)}** %rad
-    - **最大層間位移角 $\\theta_u$**: **{to_sig_fig(theta_u * 100)}** %rad
-    - **標稱剪力強度 $V_{{y}}$**: **{to_sig_fig(Vn_IC/1000)}** kN
-    - **極限剪力強度 $V_{{max}}$**: **{to_sig_fig(Vmax/1000)}** kN
-    - **彈性側向勁度 $K_{{eff}}$**: **{to_sig_fig(K_eff_kN_mm)}** kN/mm
-    - **間柱總用鋼量**: **{to_sig_fig(W_total)}** kg
-    - **勁度重量比 KWR**: **{to_sig_fig(KWR)}**
+    - **目前使用資料庫**: `{p["db_choice"]}`
+    - **IC段**: `{p["ic_profile"]}` ({p["mat_ic_w"]})
+    - **EJ段**: `{p["ej_profile"]}` ({p["mat_ej_w"]})
+    - **邊界梁**: `{p["rh_beam"]}` ({p["mat_beam"]})
+    - **最大剪應變 $\gamma_u$**: **{to_sig_fig(r["gamma_u"] * 100)}** %rad
+    - **最大層間位移角 $\\theta_u$**: **{to_sig_fig(r["theta_u"] * 100)}** %rad
+    - **標稱剪力強度 $V_{{y}}$**: **{to_sig_fig(r["Vn_IC"]/1000)}** kN
+    - **極限剪力強度 $V_{{max}}$**: **{to_sig_fig(r["Vmax"]/1000)}** kN
+    - **彈性側向勁度 $K_{{eff}}$**: **{to_sig_fig(r["K_eff_kN_mm"])}** kN/mm
+    - **間柱總用鋼量**: **{to_sig_fig(r["W_total"])}** kg
+    - **勁度重量比 KWR**: **{to_sig_fig(r["KWR"])}**
     """)
 
-    # 示意圖
+    # 示意圖 (依幾何參數快取)
+    geometry = (p["L_b"], p["d_c"], p["d_b"], p["tf_b"], p["h_SYSC_mm"], r["h_EJ_mm"], p["ts_End"], p["h_IC_mm"],
+                r["d_EJ1"], r["d_EJ2"], p["tf_EJ"], p["d_IC"], p["tf_IC"], p["n_h"], p["n_v"])
+    with stage("Plotly 圖表"):
+        st.plotly_chart(build_schematic(*geometry), width="stretch")
+    col_svg, col_report = st.columns(2)
+    col_svg.download_button("下載示意圖 (SVG)", lambda: build_schematic_svg(*geometry), file_name="TP-SYSC.svg", mime="image/svg+xml")
+    col_report.download_button(
+        "下載計算書 (HTML，可由瀏覽器列印為 PDF)",
+        lambda: render_report(sidebar_case(p), {k: float(p[k]) for k in INPUTS}, r),
+        file_name="TP-SYSC_report.html", mime="text/html",
+    )
+
+
+@st.fragment(key="tab_opt")
+@profiled("分頁: 最佳化搜尋")
+def optimizer_tab():
+    p, _, _ = design_state()
+    st.subheader("🔎 型錄窮舉最佳化 (IC × EJ × 邊界梁)")
+    st.markdown("材料、E、θd、h_SYSC 與邊界構架尺寸沿用側欄設定；端部加勁板厚度取 IC 翼板厚 tf。")
+    with st.form("opt_form"):
+        col_a, col_b = st.columns(2)
+        with col_a:
+            opt_theta = st.slider("錐形角度 θ 範圍 (deg)", 0.0, 30.0, (2.0, 20.0), step=0.5)
+            opt_theta_step = st.number_input("θ 間距 (deg)", min_value=0.1, value=1.0, step=0.5)
+            opt_hic = st.slider("IC段高度 h_IC 範圍 (mm)", 100.0, float(max(p["h_SYSC_mm"] - 100.0, 200.0)), (500.0, 1000.0), step=10.0)
+            opt_hic_step = st.number_input("h_IC 間距 (mm)", min_value=5.0, value=50.0, step=10.0)
+        with col_b:
+            opt_nv_max = st.number_input("nL 上限", min_value=0, value=3, step=1)
+            opt_nh_max = st.number_input("nT 上限", min_value=0, value=6, step=1)
+            opt_ts = st.multiselect("加勁板厚度 ts 候選 (mm)", [10.0, 12.0, 14.0, 16.0, 18.0, 20.0, 22.0, 25.0], default=[10.0, 12.0, 14.0, 16.0, 20.0])
+            opt_bs = st.multiselect("加勁板寬度 bs 候選 (mm)", [90.0, 99.0, 108.0, 120.0, 135.0, 150.0, 180.0], default=[90.0, 99.0, 120.0, 150.0])
+        col_c, col_d = st.columns(2)
+        opt_rank = col_c.radio("排序目標", ["W_total", "KWR"], format_func=lambda k: "最輕 (W_total)" if k == "W_total" else "最大勁度重量比 (KWR)", horizontal=True)
+        opt_top = col_d.number_input("顯示前 N 名", min_value=1, max_value=200, value=20, step=1)
+        run_opt = st.form_submit_button("開始搜尋")
+
+    if run_opt:
+        if not opt_ts or not opt_bs:
+            st.warning("請至少選擇一個加勁板厚度與寬度。")
+        else:
+            # 搜尋條件存於 session，切換分頁或調整其他輸入時直接命中快取
+            st.session_state["opt_args"] = (
+                p["db_key"], p["mat_ic_w"], p["mat_ej_w"], p["mat_beam"],
+                p["E_GPa"], p["target_drift"], p["h_SYSC_mm"], p["d_c"], p["L_b"], p["t_dp"],
+                tuple(np.arange(opt_theta[0], opt_theta[1] + 1e-9, opt_theta_step)),
+                tuple(np.arange(opt_hic[0], opt_hic[1] + 1e-9, opt_hic_step)),
+                tuple(range(int(opt_nv_max) + 1)), tuple(range(int(opt_nh_max) + 1)),
+                tuple(sorted(opt_ts)), tuple(sorted(opt_bs)),
+                opt_rank, int(opt_top),
+            )
+
+    if "opt_args" in st.session_state:
+        *opt_args, opt_rank_by, opt_top_n = st.session_state["opt_args"]
+        with st.spinner("搜尋中..."):
+            opt_rows, opt_stats = cached_search(*opt_args, rank_by=opt_rank_by, top_n=opt_top_n)
+        st.caption(
+            f"斷面對 {opt_stats['pairs_total']} (相異幾何 {opt_stats['pairs_unique']}) → {opt_stats['pairs_kept']}；幾何候選 {opt_stats['geometry_candidates']}，"
+            f"核心段通過 {opt_stats['core_passing']}，實際檢核加勁板/邊界梁 {opt_stats['cores_checked']}；"
+            f"耗時 {to_sig_fig(opt_stats['elapsed_s'])} s"
+        )
+        if opt_rows:
+            st.dataframe(opt_rows, width="stretch")
+        else:
+            st.error("在搜尋範圍內找不到通過所有檢核的設計。")
+
+
+# ==========================================
+# 多目標前緣: 型錄全部 IC × 相容 EJ × θ × h_IC 的候選設計中，KWR / θu / W_total 的非支配解
+# 點選前緣上的點即將該設計 (IC、EJ、θ、h_IC) 載入側欄，於下次全頁重跑前寫入側欄元件
+# ==========================================
+PARETO_FREE = ("d_IC", "bf_IC", "tw_IC", "tf_IC", "bf_EJ", "tw_EJ", "tf_EJ", "ts_End", "theta_deg", "h_IC_mm")
+PARETO_CLOUD = 5000  # 背景 (通過檢核但被支配) 點數上限
+
+
+@st.cache_data(max_entries=8, ttl=CACHE_TTL_S, show_spinner=False)
+def cached_pareto(db_key, input_items, theta_grid, h_IC_grid):
+    """只回傳前緣與抽樣的背景點 (候選設計可達 10^6 組，不整批存入快取)。"""
+    cand, stats = candidate_designs(get_section_table(db_key), dict(input_items), theta_grid, h_IC_grid)
+    front, stats["sort_s"] = pareto_front(cand)
+    stats["front"] = len(front)
+    cloud = np.nonzero(cand["ok"])[0]
+    cloud = cloud[np.isin(cloud, front, invert=True)]
+    if len(cloud) > PARETO_CLOUD:
+        cloud = np.sort(np.random.default_rng(0).choice(cloud, PARETO_CLOUD, replace=False))
+
+    def pick(idx):
+        return {k: v[idx] for k, v in cand.items()}
+
+    return pick(front), pick(cloud), stats
+
+
+def build_pareto_figure(front, cloud, r, names):
+    """W_total–KWR 散佈圖，前緣點以 θu 著色 (WebGL)；customdata 為前緣索引 (延遲匯入 plotly)。"""
+    import plotly.graph_objects as go
+
     fig = go.Figure()
-    c_flange_ic, c_web_ic = "#FF9F0A", "#FFD60A"  # 橘黃色 (IC 翼板/腹板)
-    c_flange_ej, c_web_ej = "#0A84FF", "#5AC8FA"  # 藍色 (EJ 翼板/腹板)
-    c_stiff, c_end_plate, c_beam_web, c_beam_flange = "#32D74B", "#BF5AF2", "#636366", "#48484A"
-    c_pz_doubler, c_col = "#8E8E93", "#2C2C2E"
-    line_s = dict(color="white", width=0.0)
-
-    x_L, x_R = -L_b*1000/2, L_b*1000/2
-    y_end_bot_s = h_EJ_mm
-    y_end_bot_e = y_end_bot_s + ts_End
-    y_ic_b = y_end_bot_e
-    y_ic_t = y_ic_b + h_IC_mm
-    y_end_top_s = y_ic_t
-    y_end_top_e = y_end_top_s + ts_End
-    
-    # 繪製邊界柱與梁
-    fig.add_shape(type="rect", x0=x_L-d_c/2, x1=x_L+d_c/2, y0=-d_b, y1=h_SYSC_mm+d_b, fillcolor=c_col, opacity=0.3, line=line_s)
-    fig.add_shape(type="rect", x0=x_R-d_c/2, x1=x_R+d_c/2, y0=-d_b, y1=h_SYSC_mm+d_b, fillcolor=c_col, opacity=0.3, line=line_s)
-    def draw_beam(y_start, d_bm, tf_bm, is_top=False):
-        y_f1_s = y_start + (d_bm if is_top else -d_bm)
-        y_f1_e = y_f1_s + (tf_bm if not is_top else -tf_bm)
-        fig.add_shape(type="rect", x0=x_L+d_c/2, x1=x_R-d_c/2, y0=y_f1_s, y1=y_f1_e, fillcolor=c_beam_flange, line=line_s)
-        y_f2_s = y_start
-        y_f2_e = y_f2_s + (-tf_bm if not is_top else tf_bm)
-        fig.add_shape(type="rect", x0=x_L+d_c/2, x1=x_R-d_c/2, y0=y_f2_s, y1=y_f2_e, fillcolor=c_beam_flange, line=line_s)
-        fig.add_shape(type="rect", x0=x_L+d_c/2, x1=x_R-d_c/2, y0=y_f1_e, y1=y_f2_e, fillcolor=c_beam_web, line=line_s)
-    draw_beam(0, d_b, tf_b, is_top=False)
-    draw_beam(h_SYSC_mm, d_b, tf_b, is_top=True)
-
-    # 繪製 Panel Zone 交會區加勁板
-    for x_p in [-d_EJ2/2, d_EJ2/2]:
-        fig.add_shape(type="rect", x0=x_p-tf_EJ/2, x1=x_p+tf_EJ/2, y0=-d_b+tf_b, y1=-tf_b, fillcolor=c_flange_ej, line=dict(width=0))
-        fig.add_shape(type="rect", x0=x_p-tf_EJ/2, x1=x_p+tf_EJ/2, y0=h_SYSC_mm+tf_b, y1=h_SYSC_mm+d_b-tf_b, fillcolor=c_flange_ej, line=dict(width=0))
-    
-    fig.add_shape(type="rect", x0=-d_EJ2/2+tf_EJ/2, x1=d_EJ2/2-tf_EJ/2, y0=-d_b+tf_b, y1=-tf_b, fillcolor=c_pz_doubler, line=dict(width=0))
-    fig.add_shape(type="rect", x0=-d_EJ2/2+tf_EJ/2, x1=d_EJ2/2-tf_EJ/2, y0=h_SYSC_mm+tf_b, y1=h_SYSC_mm+d_b-tf_b, fillcolor=c_pz_doubler, line=dict(width=0))
-
-    # 繪製 EJ 段
-    def draw_ej(ys, ye, ds, de, tfv, cw, flip=False):
-        dsm, dlg = (de, ds) if flip else (ds, de)
-        ysm, ylg = (ye, ys) if flip else (ys, ye)
-        fig.add_trace(go.Scatter(mode='lines', x=[-dsm/2, -dsm/2+tfv, -dlg/2+tfv, -dlg/2, -dsm/2], y=[ysm, ysm, ylg, ylg, ysm], fill="toself", fillcolor=c_flange_ej, line=line_s, showlegend=False))
-        fig.add_trace(go.Scatter(mode='lines', x=[dsm/2-tfv, dsm/2, dlg/2, dlg/2-tfv, dsm/2-tfv], y=[ysm, ysm, ylg, ylg, ysm], fill="toself", fillcolor=c_flange_ej, line=line_s, showlegend=False))
-        fig.add_trace(go.Scatter(mode='lines', x=[-dsm/2+tfv, dsm/2-tfv, dlg/2-tfv, -dlg/2+tfv, -dsm/2+tfv], y=[ysm, ysm, ylg, ylg, ysm], fill="toself", fillcolor=cw, line=line_s, showlegend=False))
-        
-        # 新增中心切割虛線
-        fig.add_shape(type="line", x0=0, x1=0, y0=ysm, y1=ylg, line=dict(color="black", width=2.5, dash="dash"))
-
-    draw_ej(0, h_EJ_mm, d_EJ2, d_EJ1, tf_EJ, c_web_ej, flip=True)
-    draw_ej(h_SYSC_mm-h_EJ_mm, h_SYSC_mm, d_EJ1, d_EJ2, tf_EJ, c_web_ej, flip=False)
-
-    # 繪製 端部加勁板
-    w_end = d_IC + 20.0
-    fig.add_shape(type="rect", x0=-w_end/2, x1=w_end/2, y0=y_end_bot_s, y1=y_end_bot_e, fillcolor=c_end_plate, line=line_s)
-    fig.add_shape(type="rect", x0=-w_end/2, x1=w_end/2, y0=y_end_top_s, y1=y_end_top_e, fillcolor=c_end_plate, line=line_s)
-
-    # 繪製 IC 段 (拆分翼板與腹板)
-    fig.add_shape(type="rect", x0=-d_IC/2, x1=-d_IC/2+tf_IC, y0=y_ic_b, y1=y_ic_t, fillcolor=c_flange_ic, line=line_s)
-    fig.add_shape(type="rect", x0=d_IC/2-tf_IC, x1=d_IC/2, y0=y_ic_b, y1=y_ic_t, fillcolor=c_flange_ic, line=line_s)
-    fig.add_shape(type="rect", x0=-d_IC/2+tf_IC, x1=d_IC/2-tf_IC, y0=y_ic_b, y1=y_ic_t, fillcolor=c_web_ic, line=line_s)
-    
-    # 繪製 IC 段面外加勁板
-    hw_ic_net = d_IC - 2 * tf_IC
-    if nT > 0:
-        for i in range(1, int(nT) + 1):
-            yc = y_ic_b + i * (h_IC_mm / (nT + 1))
-            fig.add_shape(type="line", x0=-hw_ic_net/2, x1=hw_ic_net/2, y0=yc, y1=yc, line=dict(color=c_stiff, width=3.0))
-    if nL > 0:
-        for i in range(1, int(nL) + 1):
-            xc = -hw_ic_net/2 + i * (hw_ic_net / (nL + 1))
-            fig.add_shape(type="line", x0=xc, x1=xc, y0=y_ic_b, y1=y_ic_t, line=dict(color=c_stiff, width=3.0))
-
-    fig.update_layout(
-        height=700, 
-        template="plotly_dark", 
-        yaxis=dict(scaleanchor="x", scaleratio=1, showgrid=False, zeroline=False, showticklabels=False),
-        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-        margin=dict(l=10,r=10,t=10,b=10)
+    fig.add_trace(go.Scattergl(x=cloud["W_total"], y=cloud["KWR"], mode="markers", name="通過檢核 (被支配)",
+                               marker=dict(color="rgba(142,142,147,0.35)", size=4), hoverinfo="skip"))
+    fig.add_trace(go.Scattergl(
+        x=front["W_total"], y=front["KWR"], mode="markers", name="Pareto 前緣", customdata=np.arange(len(front["KWR"])),
+        marker=dict(color=front["theta_u"] * 100, colorscale="Viridis", size=8, colorbar=dict(title="θu (%rad)")),
+        hovertext=[f"IC {names[i]}<br>EJ {names[j]}<br>θ = {t:.1f}°, h_IC = {h:.0f} mm"
+                   for i, j, t, h in zip(front["ic_id"], front["ej_id"], front["theta_deg"], front["h_IC_mm"])],
+        hovertemplate="%{hovertext}<br>W = %{x:.0f} kg, KWR = %{y:.3g}<br>θu = %{marker.color:.2f} %rad<extra></extra>",
+    ))
+    fig.add_trace(go.Scatter(x=[r["W_total"]], y=[r["KWR"]], mode="markers", name="目前設計",
+                             marker=dict(symbol="star", size=16, color="#FF9F0A")))
+    fig.update_layout(height=600, template="plotly_dark", margin=dict(l=10, r=10, t=30, b=10), clickmode="event+select",
+                      xaxis_title="間柱總用鋼量 W_total (kg)", yaxis_title="勁度重量比 KWR", legend=dict(x=0.01, y=0.99))
+    return fig
+
+
+def load_pareto_design(front, db_key):
+    """散佈圖點選回呼: 選取的前緣設計暫存為 pending_design，由片段觸發全頁重跑後寫入側欄。"""
+    points = [pt for pt in st.session_state["pareto_chart"]["selection"]["points"] if pt.get("curve_number") == 1]
+    if points:
+        i = int(points[0]["customdata"])
+        st.session_state["pending_design"] = {
+            f"ic_id_{db_key}": int(front["ic_id"][i]), f"ej_id_{db_key}": int(front["ej_id"][i]),
+            "theta_deg": float(front["theta_deg"][i]), "h_IC_mm": float(front["h_IC_mm"][i]),
+        }
+
+
+@st.fragment(key="tab_pareto")
+@profiled("分頁: 多目標前緣")
+def pareto_tab():
+    if "pending_design" in st.session_state:
+        st.rerun(scope="app")
+    p, r, _ = design_state()
+    st.subheader("⚖️ 多目標設計前緣 (KWR ↑、θu ↑、W_total ↓)")
+    st.markdown("型錄中所有 IC 斷面搭配翼板寬與深度相容的 EJ 斷面，於 θ 與 h_IC 網格上計算；其餘輸入沿用側欄，端部加勁板厚取 IC 翼板厚。"
+                "以非支配排序 (分治法) 求出通過所有檢核的設計中無法再同時改善三項目標者，點選前緣上的點可載入側欄。")
+    with st.form("pareto_form"):
+        col_a, col_b = st.columns(2)
+        theta_range = col_a.slider("錐形角度 θ 範圍 (deg)", 0.0, 30.0, (0.0, 30.0), step=0.5)
+        theta_step = col_a.number_input("θ 間距 (deg)", min_value=0.1, value=1.0, step=0.5)
+        h_lo, h_hi = SWEEP_VARS["h_IC_mm"][1](p)
+        h_range = col_b.slider("IC段高度 h_IC 範圍 (mm)", float(h_lo), float(h_hi), (float(h_lo), float(h_hi)), step=10.0)
+        h_step = col_b.number_input("h_IC 間距 (mm)", min_value=5.0, value=50.0, step=10.0)
+        run = st.form_submit_button("計算前緣")
+
+    input_items = tuple((k, float(p[k])) for k in INPUTS if k not in PARETO_FREE)
+    if run:
+        st.session_state["pareto_args"] = (
+            p["db_key"], input_items,
+            tuple(np.arange(theta_range[0], theta_range[1] + 1e-9, theta_step)),
+            tuple(np.arange(h_range[0], h_range[1] + 1e-9, h_step)),
+        )
+    if "pareto_args" not in st.session_state:
+        return
+    db_key, items, *_ = st.session_state["pareto_args"]
+    with st.spinner("計算候選設計與前緣..."):
+        front, cloud, stats = cached_pareto(*st.session_state["pareto_args"])
+    st.caption(f"候選設計 {stats['candidates']:,} 組 (計算 {to_sig_fig(stats['elapsed_s'])} s)，通過所有檢核 {stats['passing']:,} 組，"
+               f"前緣 {stats['front']} 組 (非支配排序 {to_sig_fig(stats['sort_s'] * 1e3)} ms)")
+    if (db_key, items) != (p["db_key"], input_items):
+        st.warning("側欄設計已變更，以下為前次計算之前緣；請重新計算。")
+    if not stats["front"]:
+        st.error("在網格範圍內找不到通過所有檢核的設計。")
+        return
+    names = get_section_table(db_key).labels
+    with stage("Plotly 圖表"):
+        st.plotly_chart(build_pareto_figure(front, cloud, r, names), width="stretch", key="pareto_chart",
+                        on_select=lambda: load_pareto_design(front, db_key), selection_mode="points")
+    with st.expander(f"前緣設計 ({stats['front']} 組，依 KWR 排序)"):
+        st.dataframe([
+            {"IC": names[i], "EJ": names[j], "θ (deg)": float(t), "h_IC (mm)": float(h), "KWR": to_sig_fig(k),
+             "θu (%rad)": to_sig_fig(u * 100), "W_total (kg)": to_sig_fig(w), "K_eff (kN/mm)": to_sig_fig(ke)}
+            for i, j, t, h, k, u, w, ke in zip(front["ic_id"], front["ej_id"], front["theta_deg"], front["h_IC_mm"],
+                                                front["KWR"], front["theta_u"], front["W_total"], front["K_eff_kN_mm"])
+        ], width="stretch", hide_index=True)
+
+
+# ==========================================
+# 反算設計: 指定 Ke,F、θu 或 KWR 目標，對所有相容 EJ 斷面同時反求 θ 或 h_IC
+# 按下「反算」才求解；目標值預設取目前設計，側欄設計變更時重設
+# ==========================================
+INVERSE_VARS = ("theta_deg", "h_IC_mm")  # 標籤與預設範圍沿用 SWEEP_VARS
+INVERSE_TARGETS = {  # 名稱: (標籤, 倍率)
+    "K_eff_kN_mm": ("彈性側向勁度 Ke,F (kN/mm)", 1.0),
+    "theta_u": ("最大層間位移角 θu (%rad)", 100.0),
+    "KWR": ("勁度重量比 KWR", 1.0),
+}
+
+
+@st.cache_data(max_entries=32, ttl=CACHE_TTL_S, show_spinner=False)
+def cached_inverse(db_key, input_items, var, key, target, lo, hi):
+    """回傳 (EJ 斷面 id, 求解結果, 統計)；求解器本身依設計輸入另以 get_inverse_solver 快取。"""
+    ids, solver = get_inverse_solver(db_key, input_items)
+    out, stats = solver.solve(var, key, target, lo, hi)
+    return ids, out, stats
+
+
+@st.fragment(key="tab_inverse")
+@profiled("分頁: 反算設計")
+def inverse_tab():
+    p, r, _ = design_state()
+    st.subheader("🎯 反算設計 (指定目標反求 θ 或 h_IC)")
+    st.markdown("其餘輸入沿用側欄設定；對所有翼板寬相容的 EJ 斷面同時求根，列出範圍內達到目標的最小參數值。")
+    # 具名元件首次繪製後即保留其值，故設計 (含型錄) 變更時以目前設計值重設各目標
+    design = (p["db_key"], tuple((k, float(p[k])) for k in INPUTS))
+    if st.session_state.get("inv_design") != design:
+        st.session_state["inv_design"] = design
+        for k, (_, s) in INVERSE_TARGETS.items():
+            st.session_state[f"inv_target_{k}"] = float(to_sig_fig(r[k] * s))
+
+    col_v, col_k = st.columns(2)
+    var = col_v.radio("反算參數", INVERSE_VARS, format_func=lambda k: SWEEP_VARS[k][0], horizontal=True)
+    key = col_k.selectbox("目標量", list(INVERSE_TARGETS), format_func=lambda k: INVERSE_TARGETS[k][0])
+    label, scale = INVERSE_TARGETS[key]
+    with st.form("inv_form"):
+        col_t, col_r = st.columns([1, 2])
+        target = col_t.number_input(f"目標 {label}", min_value=0.0, format="%.4g", key=f"inv_target_{key}")
+        lo, hi = SWEEP_VARS[var][1](p)
+        lo, hi = col_r.slider(f"{SWEEP_VARS[var][0]} 搜尋範圍", float(min(lo, p[var])), float(max(hi, p[var])),
+                              (float(lo), float(hi)), key=f"inv_range_{var}")
+        run = st.form_submit_button("反算")
+
+    input_items = tuple((k, float(p[k])) for k in INPUTS if k not in ("bf_EJ", "tw_EJ", "tf_EJ"))
+    if run:
+        st.session_state["inv_args"] = (p["db_key"], input_items, var, key, float(target) / scale, float(lo), float(hi))
+    if "inv_args" not in st.session_state:
+        return
+    db_key, _, var, key, _, _, _ = st.session_state["inv_args"]
+    ids, out, stats = cached_inverse(*st.session_state["inv_args"])
+    if st.session_state["inv_args"][:2] != (p["db_key"], input_items):
+        st.warning("側欄設計已變更，以下為前次反算之結果；請重新反算。")
+    st.caption(f"EJ 候選 {stats['candidates']} 組，有解 {stats['solved']} 組，通過所有檢核 {int(out['ok'].sum())} 組；"
+               f"迭代 {stats['iterations']} 次，耗時 {to_sig_fig(stats['elapsed_s'] * 1000)} ms"
+               f"{' (沿用快取網格)' if stats['scan_cached'] else ''}")
+    solved = np.nonzero(np.isfinite(out["root"]))[0]
+    if not len(solved):
+        st.error("搜尋範圍內沒有任何 EJ 斷面可達到目標值，請調整目標或範圍。")
+        return
+    solved = solved[np.lexsort((out["W_total"][solved], ~out["ok"][solved]))]
+    st.dataframe([
+        {"EJ 斷面": get_section_table(db_key).labels[ids[i]], SWEEP_VARS[var][0]: to_sig_fig(out["root"][i], 4),
+         "Ke,F (kN/mm)": to_sig_fig(out["K_eff_kN_mm"][i]), "θu (%rad)": to_sig_fig(out["theta_u"][i] * 100),
+         "KWR": to_sig_fig(out["KWR"][i]), "W_total (kg)": to_sig_fig(out["W_total"][i]),
+         "控制檢核比": to_sig_fig(out["governing_ratio"][i]), "EJ 深度規則": "OK!" if out["depth_ok"][i] else "NG!",
+         "結果": "OK!" if out["ok"][i] else "NG!"}
+        for i in solved
+    ], width="stretch", hide_index=True)
+
+
+# ==========================================
+# 參數掃描: 任兩個數值輸入的二維網格，經 DesignGraph.sweep 一次向量化計算
+# 按下「計算掃描」才計算；網格與圖依設計輸入與掃描條件快取，通過/不通過邊界只以折線傳送
+# ==========================================
+SWEEP_VARS = {  # 名稱: (標籤, 預設範圍)
+    "theta_deg": ("錐形角度 θ (deg)", lambda p: (0.0, 30.0)),
+    "h_IC_mm": ("IC段高度 h_IC (mm)", lambda p: (0.1 * p["h_SYSC_mm"], 0.6 * p["h_SYSC_mm"])),
+    "h_SYSC_mm": ("間柱全高 h_SYSC (mm)", lambda p: (0.8 * p["h_SYSC_mm"], 1.2 * p["h_SYSC_mm"])),
+    "target_drift": ("目標層間側移角 θd (%rad)", lambda p: (1.0, 5.0)),
+    "ts_End": ("端部加勁板厚度 ts_End (mm)", lambda p: (0.5 * p["ts_End"], 2.0 * p["ts_End"])),
+    "n_v": ("縱向加勁板數量 nL", lambda p: (0.0, 6.0)),
+    "n_h": ("橫向加勁板數量 nT", lambda p: (0.0, 10.0)),
+    "ts_stiff": ("加勁板厚度 ts (mm)", lambda p: (10.0, 30.0)),
+    "bs_stiff": ("加勁板寬度 bs (mm)", lambda p: (90.0, 200.0)),
+    "d_c": ("邊界柱深度 dc (mm)", lambda p: (300.0, 1000.0)),
+    "L_b": ("梁跨距 Lb (m)", lambda p: (4.0, 10.0)),
+    "t_dp": ("交會區貼板厚度 t_dp (mm)", lambda p: (0.0, 40.0)),
+}
+SWEEP_COUNT_VARS = ("n_v", "n_h")  # 整數輸入，網格取整數值
+SWEEP_PLOTS = (  # (結果名稱, 標題, 倍率)
+    ("KWR", "勁度重量比 KWR", 1.0),
+    ("theta_u", "最大層間位移角 θu (%rad)", 100.0),
+    ("K_eff_kN_mm", "彈性側向勁度 Ke,F (kN/mm)", 1.0),
+    ("governing_ratio", "控制檢核比", 1.0),
+)
+SWEEP_GRID = 60  # 每軸預設點數
+
+
+def sweep_axis(name, lo, hi, n):
+    if name in SWEEP_COUNT_VARS:
+        return np.arange(math.ceil(lo), math.floor(hi) + 1, dtype=float)
+    return np.linspace(lo, hi, n)
+
+
+def contour_segments(x, y, z, level=1.0):
+    """z (len(y), len(x)) 於 level 的等值線 (marching squares，逐格線性內插)，回傳以 NaN 分隔線段的 (xs, ys)。
+
+    鞍點格依格心值決定連接方式；非有限值視為遠大於 level。
+    """
+    z = np.where(np.isfinite(z), z, np.inf) - level
+    with np.errstate(invalid="ignore"):
+        z = np.minimum(z, 1e12)
+    a, b, c, d = z[:-1, :-1], z[:-1, 1:], z[1:, 1:], z[1:, :-1]  # 左下、右下、右上、左上
+    x0, x1 = np.broadcast_to(x[None, :-1], a.shape), np.broadcast_to(x[None, 1:], a.shape)
+    y0, y1 = np.broadcast_to(y[:-1, None], a.shape), np.broadcast_to(y[1:, None], a.shape)
+
+    def cross(p, q):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (p < 0) != (q < 0), p / (p - q)
+
+    # 四邊 (下、右、上、左) 的穿越旗標與交點
+    (cb, tb), (cr, tr), (ct, tt), (cl, tl) = cross(a, b), cross(b, c), cross(d, c), cross(a, d)
+    edges = np.stack([cb, cr, ct, cl])
+    px = np.stack([x0 + tb * (x1 - x0), x1, x0 + tt * (x1 - x0), x0])
+    py = np.stack([y0, y0 + tr * (y1 - y0), y1, y0 + tl * (y1 - y0)])
+    n = edges.sum(axis=0)
+    pairs = []
+    i, j = np.nonzero(n == 2)
+    first = np.argmax(edges[:, i, j], axis=0)
+    second = 3 - np.argmax(edges[::-1, i, j], axis=0)
+    pairs.append((first, second, i, j))
+    i, j = np.nonzero(n == 4)
+    center_same = ((a + b + c + d)[i, j] < 0) == (a[i, j] < 0)  # 格心與左下角同側: 切開右下、左上角
+    for e1, e2 in (((0, 1), (0, 3)), ((2, 3), (2, 1))):
+        pairs.append((np.where(center_same, e1[0], e2[0]), np.where(center_same, e1[1], e2[1]), i, j))
+    xs, ys = [], []
+    for e1, e2, i, j in pairs:
+        nan = np.full(len(i), np.nan)
+        xs.append(np.column_stack([px[e1, i, j], px[e2, i, j], nan]).ravel())
+        ys.append(np.column_stack([py[e1, i, j], py[e2, i, j], nan]).ravel())
+    return np.concatenate(xs), np.concatenate(ys)
+
+
+def build_sweep_figure(x_name, x, y_name, y, res):
+    """2×2 熱圖 (KWR, θu, Ke,F, 控制檢核比)，每張圖疊上檢核比 = 1 的通過/不通過邊界 (延遲匯入 plotly)。
+
+    熱圖以 float32 傳送；邊界於伺服器端算成折線 (只含穿越格的線段)，不重複傳送整張檢核比網格。
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    gov = np.asarray(res["governing_ratio"])
+    bx, by = contour_segments(x, y, gov)
+    fig = make_subplots(rows=2, cols=2, subplot_titles=[t for _, t, _ in SWEEP_PLOTS],
+                        horizontal_spacing=0.12, vertical_spacing=0.12)
+    for i, (key, title, scale) in enumerate(SWEEP_PLOTS):
+        row, col = divmod(i, 2)
+        z = np.where(np.isfinite(gov), gov, np.nan) if key == "governing_ratio" else np.broadcast_to(res[key], gov.shape) * scale
+        fig.add_trace(go.Heatmap(
+            x=x.astype(np.float32), y=y.astype(np.float32), z=z.astype(np.float32),
+            colorscale="RdYlGn_r" if key == "governing_ratio" else "Viridis",
+            zmin=0.0 if key == "governing_ratio" else None, zmax=2.0 if key == "governing_ratio" else None,
+            colorbar=dict(len=0.42, x=0.45 if col == 0 else 1.0, y=0.79 if row == 0 else 0.21),
+            hovertemplate=f"{x_name}=%{{x:.4g}}<br>{y_name}=%{{y:.4g}}<br>%{{z:.4g}}<extra></extra>",
+        ), row=row + 1, col=col + 1)
+        fig.add_trace(go.Scatter(x=bx.astype(np.float32), y=by.astype(np.float32), mode="lines", hoverinfo="skip",
+                                 line=dict(color="white", width=2.5)), row=row + 1, col=col + 1)
+        fig.update_xaxes(title_text=SWEEP_VARS[x_name][0], row=row + 1, col=col + 1)
+        fig.update_yaxes(title_text=SWEEP_VARS[y_name][0], row=row + 1, col=col + 1)
+    fig.update_layout(height=900, template="plotly_dark", showlegend=False, margin=dict(l=10, r=10, t=40, b=10))
+    return fig
+
+
+@st.cache_data(max_entries=8, ttl=CACHE_TTL_S, show_spinner=False)
+def cached_sweep(input_items, x_name, x_range, y_name, y_range, n_grid):
+    """依設計輸入與掃描條件快取網格計算與熱圖，回傳 (figure, 統計)。"""
+    x = sweep_axis(x_name, *x_range, n_grid)
+    y = sweep_axis(y_name, *y_range, n_grid)
+    res = DesignGraph(**dict(input_items)).sweep(**{x_name: x[None, :], y_name: y[:, None]})
+    res["governing_ratio"] = np.broadcast_to(governing_ratio(res), (len(y), len(x)))
+    stats = dict(nx=len(x), ny=len(y), passing=int((res["governing_ratio"] <= 1.0).sum()))
+    return build_sweep_figure(x_name, x, y_name, y, res), stats
+
+
+@st.fragment(key="tab_sweep")
+@profiled("分頁: 參數掃描")
+def sweep_tab():
+    p, _, _ = design_state()
+    st.subheader("🗺️ 參數掃描 (二維網格)")
+    st.markdown("其餘輸入沿用側欄設定；白色線為控制檢核比 = 1 的通過/不通過邊界 (檢核比 ≤ 1 的區域通過所有檢核)。")
+    names = list(SWEEP_VARS)
+    col_x, col_y = st.columns(2)
+    x_name = col_x.selectbox("X 軸參數", names, index=names.index("theta_deg"), format_func=lambda k: SWEEP_VARS[k][0])
+    y_name = col_y.selectbox("Y 軸參數", [k for k in names if k != x_name], format_func=lambda k: SWEEP_VARS[k][0],
+                             index=[k for k in names if k != x_name].index("h_IC_mm") if x_name != "h_IC_mm" else 0)
+    with st.form("sweep_form"):
+        col_xr, col_yr, col_n = st.columns([2, 2, 1])
+        x_lo, x_hi = SWEEP_VARS[x_name][1](p)
+        y_lo, y_hi = SWEEP_VARS[y_name][1](p)
+        x_range = col_xr.slider(f"{SWEEP_VARS[x_name][0]} 範圍", float(min(x_lo, p[x_name])), float(max(x_hi, p[x_name])),
+                                (float(x_lo), float(x_hi)), key=f"sweep_x_{x_name}")
+        y_range = col_yr.slider(f"{SWEEP_VARS[y_name][0]} 範圍", float(min(y_lo, p[y_name])), float(max(y_hi, p[y_name])),
+                                (float(y_lo), float(y_hi)), key=f"sweep_y_{y_name}")
+        n_grid = col_n.number_input("每軸點數", min_value=10, max_value=400, value=SWEEP_GRID, step=10)
+        run = st.form_submit_button("計算掃描")
+
+    input_items = tuple((k, float(p[k])) for k in INPUTS)
+    if run:
+        st.session_state["sweep_args"] = (input_items, x_name, tuple(x_range), y_name, tuple(y_range), int(n_grid))
+    if "sweep_args" not in st.session_state:
+        return
+    with st.spinner("計算網格..."):
+        fig, stats = cached_sweep(*st.session_state["sweep_args"])
+    st.caption(f"網格 {stats['nx']} × {stats['ny']} = {stats['nx'] * stats['ny']} 組設計，通過所有檢核 {stats['passing']} 組")
+    if st.session_state["sweep_args"][0] != input_items:
+        st.warning("側欄設計已變更，以下為前次掃描之結果；請重新計算。")
+    with stage("Plotly 圖表"):
+        st.plotly_chart(fig, width="stretch")
+
+
+@st.fragment(key="tab_mc")
+@profiled("分頁: 可靠度分析")
+def reliability_tab():
+    p, _, _ = design_state()
+    st.subheader("🎲 Monte Carlo 可靠度分析")
+    st.markdown("以目前設計為標稱值，對 Fy、E 與各構材 tw、tf 抽樣；分塊計算並逐塊累計失效次數，記憶體用量與樣本數無關。")
+    with st.form("mc_form"):
+        col_a, col_b, col_c = st.columns(3)
+        mc_n = col_a.select_slider("樣本數", [10**4, 10**5, 10**6, 3 * 10**6, 10**7], value=10**6,
+                                   format_func=lambda n: f"{n:,}")
+        mc_seed = col_a.number_input("亂數種子", min_value=0, value=0, step=1)
+        cov_fy = col_b.number_input("Fy 變異係數 (對數常態)", min_value=0.0, max_value=0.5, value=DEFAULT_SCATTER["Fy_IC"][2], step=0.01)
+        cov_e = col_b.number_input("E 變異係數 (常態)", min_value=0.0, max_value=0.5, value=DEFAULT_SCATTER["E_GPa"][2], step=0.01)
+        cov_t = col_c.number_input("板厚 tw、tf 變異係數 (常態)", min_value=0.0, max_value=0.5, value=DEFAULT_SCATTER["tw_IC"][2], step=0.01)
+        run_mc = st.form_submit_button("開始模擬")
+
+    if run_mc:
+        scatter = {k: (dist, bias, cov_fy if k.startswith("Fy") else cov_e if k == "E_GPa" else cov_t)
+                   for k, (dist, bias, _) in DEFAULT_SCATTER.items()}
+        st.session_state["mc_args"] = (tuple((k, float(p[k])) for k in INPUTS), tuple(scatter.items()), int(mc_n), int(mc_seed))
+
+    if "mc_args" in st.session_state:
+        with st.spinner("模擬中..."):
+            mc, mc_stats = cached_monte_carlo(*st.session_state["mc_args"])
+        st.caption(f"{mc_stats['samples']:,} 組樣本，每塊 {mc_stats['chunk']:,} 組；耗時 {to_sig_fig(mc_stats['elapsed_s'])} s")
+        if st.session_state["mc_args"][0] != tuple((k, float(p[k])) for k in INPUTS):
+            st.warning("側欄設計已變更，以下為前次模擬之設計結果；請重新開始模擬。")
+        st.dataframe([
+            {"檢核項目": CHECK_INFO[k][0] if k in CHECK_INFO else "任一檢核 (系統)", "失效機率 Pf": f"{v['pf']:.3e}",
+             "標準誤": f"{v['std_err']:.1e}", "可靠度指標 β": to_sig_fig(v["beta"]) if np.isfinite(v["beta"]) else ("∞" if v["beta"] > 0 else "-∞"),
+             "平均檢核比": to_sig_fig(v["mean_ratio"])}
+            for k, v in mc.items()
+        ], width="stretch", hide_index=True)
+
+
+# ==========================================
+# 遲滯迴圈: 雙線性骨架 (Ke,F / Kp,F / Vn) 於 AISC 341 遞增振幅加載歷程下的往復反應
+# 按下「計算遲滯迴圈」才計算；依骨架參數與加載設定快取
+# ==========================================
+HYSTERESIS_KEYS = ("Ke_F", "Kp_F", "Vn_IC", "h_SYSC_mm", "theta_u")
+
+
+def build_hysteresis_figure(theta, force, theta_y, Vn):
+    """剪力–層間位移角迴圈 (WebGL 繪製) 與降伏點標示 (延遲匯入 plotly)。"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Scattergl(x=theta * 100, y=force, mode="lines", line=dict(color="#0A84FF", width=1.5),
+                                 hovertemplate="θ=%{x:.3f} %rad<br>V=%{y:.4g} kN<extra></extra>"))
+    fig.add_trace(go.Scatter(x=[theta_y * 100, -theta_y * 100], y=[Vn, -Vn], mode="markers",
+                             marker=dict(color="#FF9F0A", size=9), name="降伏點", hoverinfo="skip"))
+    fig.update_layout(height=520, template="plotly_dark", showlegend=False, margin=dict(l=10, r=10, t=30, b=10),
+                      xaxis_title="層間位移角 θ (%rad)", yaxis_title="剪力 V (kN)")
+    return fig
+
+
+@st.cache_data(max_entries=16, ttl=CACHE_TTL_S, show_spinner=False)
+def cached_hysteresis(current, theta_max, points_per_quarter, hardening):
+    """current 為 HYSTERESIS_KEYS 的值；theta_max 為 None 時加載至 θu。回傳 (圖, 各圈列表, 累積消散能量, 統計)。"""
+    r = dict(zip(HYSTERESIS_KEYS, current))
+    hy, stats = hysteresis(r, theta_max=theta_max, points_per_quarter=points_per_quarter, hardening=hardening, trace=True)
+    fig = build_hysteresis_figure(hy["theta"], hy["force"][0], hy["theta_y"][0], r["Vn_IC"] / 1000)
+    rows = [
+        {"圈": i + 1, "振幅 (%rad)": to_sig_fig(a * 100), "消散能量 (kN-m)": to_sig_fig(e),
+         "等效阻尼比 ξeq": f"{x:.1%}" if np.isfinite(x) else "-", "≤ θu": "OK!" if ok else "NG!"}
+        for i, (a, e, x, ok) in enumerate(zip(hy["amplitude"], hy["energy"][0], hy["damping"][0], hy["reached"][0]))
+    ]
+    return fig, rows, float(hy["energy"][0].sum()), stats
+
+
+@st.fragment(key="tab_hyst")
+@profiled("分頁: 遲滯迴圈")
+def hysteresis_tab():
+    _, r, _ = design_state()
+    st.subheader("🔁 往復載重遲滯迴圈")
+    st.markdown("依 AISC 341 K2.4b 遞增振幅加載歷程 (每級之後以 0.01 rad 遞增) 加載至 θu；"
+                "骨架為 Ke,F 與 Kp,F 的雙線性移動硬化模型，降伏剪力取 Vn,IC。")
+    with st.form("hyst_form"):
+        col_a, col_b, col_c = st.columns(3)
+        # 預設 0 = 加載至目前設計的 θu (不以設計值作為具名元件的預設，避免切換設計後沿用舊值)
+        theta_max = col_a.number_input("最大層間位移角 (%rad，0 = θu)", min_value=0.0, value=0.0, step=0.5,
+                                       key="hyst_theta_max") / 100.0
+        n_q = col_b.select_slider("每 1/4 圈步數", [8, 16, 32, 64, 128, 256], value=POINTS_PER_QUARTER, key="hyst_points")
+        hardening = col_c.toggle("降伏後移動硬化 (Kp,F)", value=True, key="hyst_hardening",
+                                 help="關閉時降伏後勁度取 0 (彈性–完全塑性)")
+        run = st.form_submit_button("計算遲滯迴圈")
+
+    current = tuple(float(r[k]) for k in HYSTERESIS_KEYS)
+    if run:
+        st.session_state["hyst_args"] = (current, float(theta_max) if theta_max > 0 else None, int(n_q), bool(hardening))
+    if "hyst_args" not in st.session_state:
+        return
+    fig, rows, energy, stats = cached_hysteresis(*st.session_state["hyst_args"])
+    st.caption(f"{stats['cycles']} 圈、{stats['steps']:,} 步 ({stats['segments']} 個單調加載段)；耗時 {to_sig_fig(stats['elapsed_s'] * 1000)} ms")
+    if st.session_state["hyst_args"][0] != current:
+        st.warning("側欄設計已變更，以下為前次計算之遲滯迴圈；請重新計算。")
+    with stage("Plotly 圖表"):
+        st.plotly_chart(fig, width="stretch")
+    st.dataframe(rows, width="stretch", hide_index=True)
+    st.markdown(f"累積消散能量 **{to_sig_fig(energy)}** kN-m")
+
+
+# ==========================================
+# 側推曲線: 候選設計組 (相容 EJ × θ × h_IC) 的單調骨架，疊圖只傳各曲線頂點 (WebGL)
+# 按下「計算側推曲線」才計算；圖與 npz 依設計輸入與網格快取
+# ==========================================
+BACKBONE_KEYS = ("Ke_F", "Kp_F", "Vn_IC", "Vmax", "h_SYSC_mm", "theta_u")
+
+
+def build_pushover_figure(cand, r):
+    """通過 / 未通過的候選曲線各為一條以 NaN 分隔的 Scattergl 路徑 (float32)，目前設計另以粗線標示 (延遲匯入 plotly)。"""
+    import plotly.graph_objects as go
+
+    theta, V = backbone(cand)
+    fig = go.Figure()
+    for mask, color, name in ((~cand["ok"], "rgba(142,142,147,0.25)", "未通過"), (cand["ok"], "rgba(10,132,255,0.35)", "通過所有檢核")):
+        x, y = polyline(theta[mask] * 100, V[mask])
+        fig.add_trace(go.Scattergl(x=x.astype(np.float32), y=y.astype(np.float32), mode="lines",
+                                   line=dict(color=color, width=1), name=f"{name} ({int(mask.sum())})", hoverinfo="skip"))
+    x, y = backbone(r)
+    fig.add_trace(go.Scattergl(x=x[0] * 100, y=y[0], mode="lines+markers", line=dict(color="#FF9F0A", width=4), name="目前設計"))
+    fig.update_layout(height=600, template="plotly_dark", margin=dict(l=10, r=10, t=30, b=10),
+                      xaxis_title="層間位移角 θ (%rad)", yaxis_title="剪力 V (kN)", legend=dict(x=0.01, y=0.99))
+    return fig
+
+
+@st.cache_data(max_entries=8, ttl=CACHE_TTL_S, show_spinner=False)
+def cached_pushover_figure(db_key, input_items, theta_grid, h_IC_grid, current):
+    """側推疊圖依候選設計組條件與目前設計的骨架參數 (current: BACKBONE_KEYS 的值) 快取。"""
+    cand = pushover_candidates(db_key, input_items, theta_grid, h_IC_grid)
+    return build_pushover_figure(cand, dict(zip(BACKBONE_KEYS, current)))
+
+
+@st.cache_data(max_entries=8, ttl=CACHE_TTL_S, show_spinner=False)
+def cached_pushover_npz(db_key, input_items, theta_grid, h_IC_grid, n_points):
+    cand = pushover_candidates(db_key, input_items, theta_grid, h_IC_grid)
+    labels = get_section_table(db_key).labels
+    return pushover_npz(cand, n_points, ej_profile=np.array([labels[i] for i in cand["ej_id"]]),
+                        theta_deg=cand["theta_deg"], h_IC_mm=cand["h_IC_mm"], ok=cand["ok"])
+
+
+@st.fragment(key="tab_push")
+@profiled("分頁: 側推曲線")
+def pushover_tab():
+    p, r, _ = design_state()
+    st.subheader("📈 單調側推曲線 (候選設計組)")
+    st.markdown("目前 IC 斷面搭配所有翼板寬相容的 EJ 斷面，於 θ 與 h_IC 網格上一次計算；"
+                "骨架為 V = min(Ke,F·h·θ, Vn + Kp,F·h·(θ − θy), Vmax)，畫至各設計的 θu。")
+    with st.form("push_form"):
+        col_t, col_h, col_n = st.columns(3)
+        theta_range = col_t.slider("錐形角度 θ 範圍 (deg)", 0.0, 30.0, (0.0, 30.0), step=0.5, key="push_theta")
+        n_theta = col_t.number_input("θ 點數", min_value=2, max_value=200, value=31, step=1, key="push_n_theta")
+        h_lo, h_hi = SWEEP_VARS["h_IC_mm"][1](p)
+        h_range = col_h.slider("IC段高度 h_IC 範圍 (mm)", float(h_lo), float(h_hi), (float(h_lo), float(h_hi)), key="push_h")
+        n_h = col_h.number_input("h_IC 點數", min_value=1, max_value=100, value=8, step=1, key="push_n_h")
+        n_points = col_n.number_input("輸出每條曲線點數", min_value=10, max_value=5000, value=N_POINTS, step=50, key="push_points")
+        run = st.form_submit_button("計算側推曲線")
+
+    input_items = tuple((k, float(p[k])) for k in INPUTS if k not in ("bf_EJ", "tw_EJ", "tf_EJ", "theta_deg", "h_IC_mm"))
+    current = tuple(float(r[k]) for k in BACKBONE_KEYS)
+    if run:
+        st.session_state["push_args"] = (p["db_key"], input_items, tuple(np.linspace(*theta_range, int(n_theta))),
+                                         tuple(np.linspace(*h_range, int(n_h))), int(n_points))
+    if "push_args" not in st.session_state:
+        return
+    *grid_args, n_points = st.session_state["push_args"]
+    with st.spinner("計算候選設計..."):
+        cand = pushover_candidates(*grid_args)
+        fig = cached_pushover_figure(*grid_args, current)
+    st.caption(f"候選設計 {len(cand['ok']):,} 組，通過所有檢核 (含 EJ 深度規則) {int(cand['ok'].sum()):,} 組")
+    if tuple(grid_args[:2]) != (p["db_key"], input_items):
+        st.warning("側欄設計已變更，以下為前次計算之候選設計組；請重新計算。")
+    with stage("Plotly 圖表"):
+        st.plotly_chart(fig, width="stretch")
+    st.download_button(
+        f"下載側推曲線 (npz，每條 {n_points} 點 + 頂點)",
+        lambda: cached_pushover_npz(*grid_args, n_points),
+        file_name="TP-SYSC_pushover.npz", mime="application/octet-stream",
     )
-    st.plotly_chart(fig, use_container_width=True)
 
 
+# ==========================================
+# 專案模式: 多樓層、多跨的 TP-SYSC 單元表，空白欄位沿用側欄設計
+# 每個 session 保留一個 Project，只重算變動的單元並增量維護合計
+# ==========================================
+PROJECT_COLUMNS = ("story", "bay", "h_SYSC_mm", "L_b", "d_c", "beam_profile")
+
+
+def example_units(n_story, n_bay, p):
+    """範例單元表: 底層較高，跨距依跨別交替。"""
+    import pandas as pd
+
+    rows = [
+        dict(story=f"{s}F", bay=f"B{b}", h_SYSC_mm=p["h_SYSC_mm"] + (400.0 if s == 1 else 0.0),
+             L_b=p["L_b"] + (1.0 if b % 2 else 0.0), d_c=None, beam_profile=None)
+        for s in range(1, n_story + 1) for b in range(1, n_bay + 1)
+    ]
+    return pd.DataFrame(rows, columns=PROJECT_COLUMNS)
+
 
+@st.fragment(key="tab_project")
+@profiled("分頁: 專案模式")
+def project_tab():
+    p, _, _ = design_state()
+    ss = st.session_state
+    st.subheader("🏢 專案模式 (多組間柱單元)")
+    st.markdown("每列為一組單元，空白欄位沿用側欄設計；修改單元或側欄參數時只重算受影響的單元，全專案與各樓層合計以增減量更新。")
+    col_s, col_b, col_go = st.columns([1, 1, 2], vertical_alignment="bottom")
+    n_story = col_s.number_input("樓層數", min_value=1, max_value=100, value=10, step=1)
+    n_bay = col_b.number_input("每層單元數", min_value=1, max_value=50, value=5, step=1)
+    if col_go.button("建立範例專案"):
+        ss["project_units"] = example_units(int(n_story), int(n_bay), p)
+        ss.pop("project_editor", None)
+    if "project_units" not in ss:  # 分頁每次重跑都會執行，專案待使用者建立後才計算
+        st.info("請先建立範例專案 (之後可於表格中增刪、修改單元)。")
+        return
+
+    table = get_section_table(p["db_key"])
+    units = st.data_editor(
+        ss["project_units"], num_rows="dynamic", key="project_editor", width="stretch",
+        column_config={
+            "story": st.column_config.TextColumn("樓層"), "bay": st.column_config.TextColumn("跨"),
+            "h_SYSC_mm": st.column_config.NumberColumn("h_SYSC (mm)", min_value=0.0),
+            "L_b": st.column_config.NumberColumn("Lb (m)", min_value=0.0),
+            "d_c": st.column_config.NumberColumn("dc (mm)", min_value=0.0),
+            "beam_profile": st.column_config.SelectboxColumn("邊界梁", options=table.names),
+        },
+    )
+    project = ss.setdefault("project", Project())
+    project.set_shared(**sidebar_case(p))
+    project.sync({key: row.to_dict() for key, row in units.iterrows()})
+    rows = project.rows()
 
+    t = project.totals
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("單元數", t["units"])
+    col2.metric("通過所有檢核", f"{t['passing']} / {t['units']}")
+    col3.metric("總用鋼量 (t)", to_sig_fig(t["W_total"] / 1000))
+    col4.metric("側向勁度合計 (kN/mm)", to_sig_fig(t["K_eff_kN_mm"]))
+    st.caption(f"本次重算 {len(project.last_recomputed)} 組單元" + (f"，{t['errors']} 組輸入有誤" if t["errors"] else ""))
+    st.download_button(
+        "匯出全專案計算書 (zip，每組單元一份 HTML + 索引)",
+        lambda: reports_zip([dict(project.case(key), id=f"{row['story']}-{project.units[key].get('bay', key)}") for key, row in rows]),
+        file_name="TP-SYSC_project_reports.zip", mime="application/zip",
+    )
 
+    st.dataframe([
+        {"樓層": story, "單元數": s["units"], "通過": s["passing"], "樓層勁度 (kN/mm)": to_sig_fig(s["K_eff_kN_mm"]),
+         "用鋼量 (kg)": to_sig_fig(s["W_total"])}
+        for story, s in project.stories.items()
+    ], width="stretch", hide_index=True)
+    with st.expander("各單元結果"):
+        st.dataframe([
+            {"樓層": row["story"], "跨": project.units[key].get("bay", ""), "邊界梁": row["beam_profile"],
+             "Ke,F (kN/mm)": to_sig_fig(row["K_eff_kN_mm"]), "θu (%rad)": to_sig_fig(row["theta_u"] * 100),
+             "W_total (kg)": to_sig_fig(row["W_total"]), "控制檢核比": to_sig_fig(row["governing_ratio"]),
+             "結果": "OK!" if row["pass"] else "NG!"} if not row.get("error") else
+            {"樓層": row["story"], "跨": project.units[key].get("bay", ""), "邊界梁": row.get("beam_profile", ""), "結果": row["error"]}
+            for key, row in rows
+        ], width="stretch", hide_index=True)
 
 
+mark("分頁")
+tab1, tab2, tab3, tab4, tab_opt, tab_pareto, tab_inv, tab_sweep, tab_mc, tab_hyst, tab_push, tab_proj = st.tabs(["⚙️韌性設計與容量設計", "🛡️加勁板設計", "🏗️邊界梁與交會區容量設計", "📐設計結果與示意圖", "🔎最佳化搜尋", "⚖️多目標前緣", "🎯反算設計", "🗺️參數掃描", "🎲可靠度分析", "🔁遲滯迴圈", "📈側推曲線", "🏢專案模式"])
+with tab1:
+    ductility_tab()
+with tab2:
+    stiffener_tab()
+with tab3:
+    frame_tab()
+with tab4:
+    summary_tab()
+with tab_opt:
+    optimizer_tab()
+with tab_pareto:
+    pareto_tab()
+with tab_inv:
+    inverse_tab()
+with tab_sweep:
+    sweep_tab()
+with tab_mc:
+    reliability_tab()
+with tab_hyst:
+    hysteresis_tab()
+with tab_push:
+    pushover_tab()
+with tab_proj:
+    project_tab()
 
+# 效能剖析: 環境變數 TPSYSC_PROFILE=1 或網址加上 ?dev=1 顯示開關
+if "dev" in st.query_params:
+    st.sidebar.toggle("⏱️ 效能剖析", key="profile_toggle")
+end_rerun()
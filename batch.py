@@ -0,0 +1,182 @@
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+
+import numpy as np
+
+from engine import INPUTS, CHECKS, evaluate, check_ratios, governing_ratio
+from sections import STEEL_DB, get_table
+
+# ==========================================
+# 無介面批次計算 (CLI): 讀入 CSV / JSONL 設計案例，分塊交給行程池向量化計算，
+# 依輸入順序串流寫出 CSV / JSONL。僅匯入 engine / sections，不觸發 Streamlit
+#   python batch.py cases.csv results.csv --workers 8
+# ==========================================
+# 案例欄位與預設值 (與 app.py 側欄預設一致；None 表示必填或另行推得)
+CASE_FIELDS = {
+    "id": None,
+    "db": "CNS",
+    "ic_profile": None, "ej_profile": None, "beam_profile": None,
+    "mat_ic": "SN490B", "mat_ej": "SN490B", "mat_beam": "SN490B",
+    "E_GPa": 200.0, "target_drift": 3.0,
+    "h_SYSC_mm": 2600.0, "h_IC_mm": 750.0, "theta_deg": 8.5,
+    "ts_End": None,  # 預設取 IC 翼板厚 tf
+    "n_v": 1, "n_h": 2, "ts_stiff": 11.0, "bs_stiff": 99.0,
+    "d_c": 500.0, "L_b": 6.0, "t_dp": 15.0,
+}
+
+OUTPUT_KEYS = (
+    "h_EJ_mm", "d_EJ2", "K_eff_kN_mm", "theta_y", "gamma_d", "gamma_u", "theta_u",
+    "Vn_IC", "Vmax", "W_core", "W_stiff", "W_total", "KWR",
+)
+RATIO_KEYS = tuple(f"ratio_{key}" for key, *_ in CHECKS)
+RESULT_FIELDS = tuple(CASE_FIELDS) + OUTPUT_KEYS + RATIO_KEYS + ("governing_ratio", "pass", "error")
+
+
+def read_cases(path):
+    """逐筆讀取案例 (副檔名 .jsonl / .json 為 JSON Lines，其餘視為 CSV；'-' 為標準輸入，視為 CSV)。"""
+    with nullcontext(sys.stdin) if path == "-" else open(path, newline="", encoding="utf-8-sig") as f:
+        if file_format(path) == "jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def case_inputs(case):
+    """案例 (欄位可缺，空字串視同未填) 轉為 engine 輸入；型鋼名稱或材料不存在時丟出 KeyError，數值有誤時丟出 ValueError / TypeError。"""
+    c = dict(CASE_FIELDS)
+    c.update({k: v for k, v in case.items() if k in CASE_FIELDS and v not in ("", None)})
+    table = get_table(c["db"])
+    mat_ic, mat_ej, mat_beam = STEEL_DB[c["mat_ic"]], STEEL_DB[c["mat_ej"]], STEEL_DB[c["mat_beam"]]
+    d_IC, bf_IC, tw_IC, tf_IC = table.dims(table.id(c["ic_profile"]))
+    _, bf_EJ, tw_EJ, tf_EJ = table.dims(table.id(c["ej_profile"]))
+    d_b, bf_b, tw_b, tf_b = table.dims(table.id(c["beam_profile"]))
+
+    def num(k):
+        return float(c[k])
+
+    return c, dict(
+        d_IC=d_IC, bf_IC=bf_IC, tw_IC=tw_IC, tf_IC=tf_IC, bf_EJ=bf_EJ, tw_EJ=tw_EJ, tf_EJ=tf_EJ,
+        d_b=d_b, bf_b=bf_b, tw_b=tw_b, tf_b=tf_b,
+        Fy_IC=mat_ic["Fy"], Ry_IC=mat_ic["Ry"], Omega_IC=mat_ic["Omega"],
+        Fy_EJ=mat_ej["Fy"], Ry_EJ=mat_ej["Ry"], Fy_beam=mat_beam["Fy"],
+        E_GPa=num("E_GPa"), target_drift=num("target_drift"),
+        h_SYSC_mm=num("h_SYSC_mm"), h_IC_mm=num("h_IC_mm"),
+        ts_End=tf_IC if c["ts_End"] is None else num("ts_End"), theta_deg=num("theta_deg"),
+        n_v=num("n_v"), n_h=num("n_h"), ts_stiff=num("ts_stiff"), bs_stiff=num("bs_stiff"),
+        d_c=num("d_c"), L_b=num("L_b"), t_dp=num("t_dp"),
+    )
+
+
+def run_chunk(cases):
+    """計算一塊案例 (整塊一次 broadcast)，回傳與輸入同序的結果列 (數值輸入欄位為 float，與輸入檔格式無關)。"""
+    rows, good, columns = [], [], {k: [] for k in INPUTS}
+    for case in cases:
+        try:
+            c, inputs = case_inputs(case)
+        except (KeyError, ValueError, TypeError) as e:  # TypeError: 非純量欄位值 (如 JSONL 的 [1])
+            rows.append(dict({k: case.get(k, "") for k in CASE_FIELDS}, error=f"{type(e).__name__}: {e}"))
+            continue
+        rows.append({k: inputs[k] if k in inputs else c[k] for k in CASE_FIELDS})
+        good.append(len(rows) - 1)
+        for k in INPUTS:
+            columns[k].append(inputs[k])
+    if not good:
+        return rows
+
+    r = evaluate(**{k: np.array(v, dtype=float) for k, v in columns.items()})
+    r.update({f"ratio_{k}": v for k, v in check_ratios(r).items()})
+    r["governing_ratio"] = governing_ratio(r)
+    n = len(good)
+    out = {k: np.broadcast_to(r[k], (n,)).tolist() for k in OUTPUT_KEYS + RATIO_KEYS + ("governing_ratio",)}
+    out["pass"] = [g <= 1.0 for g in out["governing_ratio"]]
+    for j, i in enumerate(good):
+        rows[i].update({k: v[j] for k, v in out.items()})
+    return rows
+
+
+def _json_value(v):
+    return None if isinstance(v, float) and not np.isfinite(v) else v
+
+
+def format_rows(rows, fmt):
+    """結果列序列化為文字 (CSV 不含表頭)；在工作行程內執行，主行程只負責依序寫出。"""
+    if fmt == "jsonl":
+        return "".join(json.dumps({k: _json_value(v) for k, v in row.items()}, ensure_ascii=False) + "\n" for row in rows)
+    buf = io.StringIO()
+    csv.DictWriter(buf, fieldnames=RESULT_FIELDS, restval="").writerows(rows)
+    return buf.getvalue()
+
+
+def process_chunk(cases, fmt):
+    rows = run_chunk(cases)
+    return len(rows), format_rows(rows, fmt)
+
+
+def _chunks(iterable, size):
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def map_chunks(func, chunks, workers=None, *args):
+    """依輸入順序產出 func(chunk, *args)；多行程時最多 2 × workers 塊在途，記憶體用量與案例總數無關。"""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield func(chunk, *args)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk, *args))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_batch(cases, fmt="csv", workers=None, chunk_size=2048):
+    """依輸入順序產出 (筆數, 序列化文字)。"""
+    yield from map_chunks(process_chunk, _chunks(cases, chunk_size), workers, fmt)
+
+
+def file_format(path):
+    return "jsonl" if path.endswith((".jsonl", ".json")) else "csv"
+
+
+def write_results(blocks, path, fmt):
+    """串流寫出 run_batch 的結果 ('-' 為標準輸出)，回傳總筆數。"""
+    n = 0
+    with nullcontext(sys.stdout) if path == "-" else open(path, "w", newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            csv.DictWriter(f, fieldnames=RESULT_FIELDS).writeheader()
+        for count, text in blocks:
+            f.write(text)
+            n += count
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TP-SYSC 批次計算 (CSV / JSONL 輸入與輸出)")
+    parser.add_argument("cases", help="案例檔 (.csv 或 .jsonl，'-' 為標準輸入)")
+    parser.add_argument("output", help="結果檔 (.csv 或 .jsonl，'-' 為標準輸出)")
+    parser.add_argument("--workers", type=int, default=None, help="行程數 (預設為 CPU 核心數，1 為不開行程池)")
+    parser.add_argument("--chunk", type=int, default=2048, help="每塊案例數")
+    args = parser.parse_args(argv)
+    fmt = file_format(args.output)
+    n = write_results(run_batch(read_cases(args.cases), fmt, args.workers, args.chunk), args.output, fmt)
+    print(f"{n} cases -> {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
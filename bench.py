@@ -0,0 +1,204 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from functools import partial
+
+import numpy as np
+
+from batch import case_inputs
+from engine import evaluate, evaluate_one, d_EJ0_min_req, ej_height
+from formatting import to_sig_fig
+from sections import EJ_D_TOL, get_table
+
+# ==========================================
+# 效能量測: 各項分別計時，結果附加至 JSON 歷史檔並與前一筆比較
+#   python bench.py                     # 全部項目
+#   python bench.py --quick --only engine
+# 歷史檔每筆記錄 commit、Python / numpy 版本、--quick 與執行的項目組，以及各項 {最佳, 中位數, 每筆} 秒數
+# 只與 --quick 及項目組皆相同的紀錄比較 (快速量測的重複次數與批次大小不同，不可互比)
+# ==========================================
+HISTORY = "bench_history.json"
+BASE_CASE = dict(ic_profile="488 X 300 X 11 X 18", ej_profile="616 X 308 X 20 X 34", beam_profile="616 X 308 X 20 X 34")
+BATCH_SIZES = (10**3, 10**4, 10**5, 10**6)
+REGRESSION = 1.2  # 最佳時間較前一筆慢 20% 以上即標示
+
+
+def timed(func, repeat=5, number=1):
+    """回傳 repeat 次量測的每次呼叫秒數 (每次量測連續呼叫 number 回取平均)。"""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - t0) / number)
+    return times
+
+
+def record(times, items=1):
+    best = min(times)
+    return dict(best_s=best, median_s=float(np.median(times)), repeat=len(times), items=items, per_item_s=best / items)
+
+
+def base_inputs():
+    return case_inputs(BASE_CASE)[1]
+
+
+def bench_engine(quick):
+    p = base_inputs()
+    out = {"engine_scalar": record(timed(lambda: evaluate_one(**p), 5, 50 if quick else 200))}
+    rng = np.random.default_rng(0)
+    for n in BATCH_SIZES[:-1] if quick else BATCH_SIZES:
+        x = dict(p, theta_deg=rng.uniform(0.0, 25.0, n), h_IC_mm=rng.uniform(500.0, 1200.0, n), L_b=rng.uniform(4.0, 10.0, n))
+        out[f"engine_batch_{n:.0e}"] = record(timed(partial(evaluate, **x), 3 if n >= 10**5 else 5), n)
+    return out
+
+
+def _ej_filter_single(table, bf, d_min):
+    return [table.ej_candidates(b, m) for b, m in zip(bf, d_min)]
+
+
+def bench_ej_filter(quick):
+    """每個 IC 斷面於 θ = 8.5° 的 EJ 候選查詢: 逐筆 ej_candidates 與一次 ej_candidates_batch。"""
+    out = {}
+    for label, table in (("cns", get_table("CNS")), ("aisc", get_table("AISC"))):
+        d, bf, tf = table["d"], table["bf"], table["tf"]
+        d_min = d_EJ0_min_req(d, ej_height(2600.0, 750.0, tf), 8.5) - EJ_D_TOL
+        n = len(table)
+        out[f"ej_filter_{label}_single"] = record(
+            timed(partial(_ej_filter_single, table, bf, d_min), 3 if quick else 5), n)
+        out[f"ej_filter_{label}_batch"] = record(timed(partial(table.ej_candidates_batch, bf, d_min), 5, 20), n)
+    return out
+
+
+def bench_sig_fig(quick):
+    n = 10**4 if quick else 10**5
+    values = (np.random.default_rng(0).lognormal(0.0, 4.0, n) * np.where(np.arange(n) % 7 == 0, -1.0, 1.0)).tolist()
+    return {"to_sig_fig": record(timed(lambda: [to_sig_fig(v) for v in values], 3 if quick else 5), n)}
+
+
+def bench_plotly(quick):
+    """示意圖 (圖層幾何 + Plotly 圖) 與 200 × 200 熱圖的建圖時間 (不含瀏覽器端繪製)。"""
+    import plotly.graph_objects as go
+
+    from schematic import schematic_layers, schematic_figure
+
+    p = base_inputs()
+    r = evaluate_one(**p)
+    geometry = (p["L_b"], p["d_c"], p["d_b"], p["tf_b"], p["h_SYSC_mm"], r["h_EJ_mm"], p["ts_End"], p["h_IC_mm"],
+                r["d_EJ1"], r["d_EJ2"], p["tf_EJ"], p["d_IC"], p["tf_IC"], p["n_h"], p["n_v"])
+    z = np.random.default_rng(0).random((200, 200))
+    repeat = 3 if quick else 10
+    return {
+        "schematic_layers": record(timed(lambda: schematic_layers(*geometry), repeat, 20)),
+        "schematic_figure": record(timed(lambda: schematic_figure(schematic_layers(*geometry)), repeat)),
+        "plotly_heatmap_200": record(timed(lambda: go.Figure(go.Heatmap(z=z)), repeat)),
+    }
+
+
+def bench_apptest(quick):
+    """以 Streamlit AppTest 無介面執行 app.py: 首次執行 (冷) 與同一 session 再次全頁重跑 (快取已熱)。"""
+    from streamlit.testing.v1 import AppTest
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+    apps = []
+
+    def cold():
+        apps.append(AppTest.from_file(path, default_timeout=120).run())
+
+    out = {"apptest_cold": record(timed(cold, 1 if quick else 3))}
+    at = apps[-1]
+    if at.exception:
+        raise RuntimeError(f"app.py 執行失敗: {at.exception[0].value}")
+    out["apptest_rerun"] = record(timed(at.run, 3 if quick else 5))
+    return out
+
+
+BENCHMARKS = {
+    "engine": bench_engine,
+    "ej_filter": bench_ej_filter,
+    "sig_fig": bench_sig_fig,
+    "plotly": bench_plotly,
+    "apptest": bench_apptest,
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def comparable(entry, quick, benchmarks):
+    """歷史紀錄是否與此次量測設定相同 (--quick 與執行的項目組)；舊格式未記錄項目組者不比較。"""
+    return entry.get("quick") == quick and entry.get("benchmarks") == list(benchmarks)
+
+
+def previous_results(history, name, quick=False, benchmarks=tuple(BENCHMARKS)):
+    """歷史中設定相同 (見 comparable) 且含該項目的最近一筆結果。"""
+    for entry in reversed(history):
+        if comparable(entry, quick, benchmarks) and name in entry["results"]:
+            return entry["results"][name]
+    return None
+
+
+def report(results, history, quick=False, benchmarks=tuple(BENCHMARKS)):
+    """逐項列出最佳時間與前次 (同設定) 比較，回傳退步項目名稱。"""
+    slower = []
+    print(f"{'項目':28s} {'最佳':>12s} {'每筆':>12s} {'前次':>12s} {'比值':>7s}")
+    for name, r in results.items():
+        prev = previous_results(history, name, quick, benchmarks)
+        ratio = r["best_s"] / prev["best_s"] if prev else None
+        flag = ""
+        if ratio is not None and ratio > REGRESSION:
+            slower.append(name)
+            flag = "  ← 退步"
+        prev_text = f"{prev['best_s'] * 1e3:10.3f}ms" if prev else f"{'-':>12s}"
+        ratio_text = f"{ratio:7.2f}" if ratio is not None else f"{'-':>7s}"
+        print(f"{name:28s} {r['best_s'] * 1e3:10.3f}ms {r['per_item_s'] * 1e6:10.3f}µs {prev_text} {ratio_text}{flag}")
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TP-SYSC 效能量測 (結果附加至 JSON 歷史檔)")
+    parser.add_argument("--only", nargs="*", choices=list(BENCHMARKS), help="只執行指定項目 (預設全部)")
+    parser.add_argument("--quick", action="store_true", help="較少重複次數，批次計算最大 10^5 筆")
+    parser.add_argument("--history", default=HISTORY, help=f"歷史檔路徑 (預設 {HISTORY})")
+    parser.add_argument("--label", default="", help="此次量測的附註 (如版本或機器名稱)")
+    parser.add_argument("--no-save", action="store_true", help="只顯示結果，不寫入歷史檔")
+    args = parser.parse_args(argv)
+
+    benchmarks = [name for name in BENCHMARKS if not args.only or name in args.only]
+    results = {}
+    for name in benchmarks:
+        print(f"[{name}] ...", file=sys.stderr)
+        results.update(BENCHMARKS[name](args.quick))
+
+    history = load_history(args.history)
+    slower = report(results, history, args.quick, benchmarks)
+    if not args.no_save:
+        history.append(dict(
+            time=datetime.now(timezone.utc).isoformat(timespec="seconds"), commit=git_commit(), label=args.label,
+            quick=args.quick, benchmarks=benchmarks, python=platform.python_version(), numpy=np.__version__,
+            machine=platform.machine(), cpus=os.cpu_count(), results=results,
+        ))
+        with open(args.history, "w", encoding="utf-8") as f:
+            json.dump(history, f, ensure_ascii=False, indent=1)
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
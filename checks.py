@@ -0,0 +1,47 @@
+import json
+
+from engine import CHECKS
+
+# ==========================================
+# 檢核結果模型: 每項檢核只計算一次，各分頁依代號取用並批次呈現
+# 名稱、單位換算與公式 (LaTeX) 依 engine.CHECKS 的代號對應
+# ==========================================
+CHECK_INFO = {
+    "lambda_f": ("EJ段翼板寬厚比 λf", "", 1.0, r"\lambda_{f,md} = 0.38\sqrt{E / R_y F_y}"),
+    "lambda_w": ("EJ段腹板寬厚比 λw", "", 1.0, r"\lambda_{w,md} = 2.61\sqrt{E / R_y F_y}"),
+    "Lb": ("未側撐長度 Lb", "mm", 1.0, r"L_r = 1.95 r_{ts} \frac{E}{0.7F_y} \sqrt{\dots}"),
+    "EJ_shear": ("EJ段剪力容量設計 (Vmax vs. φVn)", "kN", 1e-3, r"\phi V_{n,EJ} = 0.9(0.6 F_y t_{w,EJ} d_{EJ1})"),
+    "EJ_moment": ("EJ段彎矩容量設計 (Mu vs. φMn)", "kN-m", 1e-6, r"M_u = V_{max}h_{TVSC}/2 \le \phi M_{n,EJ}"),
+    "IC_moment": ("IC段彎矩容量設計 (Mu vs. φMn)", "kN-m", 1e-6, r"M_{u,IC} = V_{max}h_{IC}/2 \le \phi M_{n,IC(flange)}"),
+    "hs_tw": ("子板塊寬厚比 hs/tw", "", 1.0, r"h_s/t_w \le \sqrt{8.5k_c / (2\gamma_d - \gamma_y)}"),
+    "lambda_nw_max": ("標準化寬厚比 λnw (上限)", "", 1.0, r"\lambda_{nw} = \frac{h_s}{t_w}\sqrt{\frac{0.6F_y}{k_c E}} \le 0.6"),
+    "lambda_nw_min": ("標準化寬厚比 λnw (下限)", "", 1.0, r"\lambda_{nw} \ge 0.145"),
+    "rs": ("最適加勁剛度比 rs/rs*", "", 1.0, r"\gamma_s / \gamma_s^* \ge {rs_star}"),
+    "beam_moment": ("邊界梁彎矩容量設計", "kN-m", 1e-6, r"M_{b1} = \frac{V_{ult}(h_{TVSC}/2 + d_b/2) - M_{b2}(d_{EJ2}/2L')}{1 + d_{EJ2}/2L'}"),
+    "beam_shear": ("邊界梁剪力容量設計", "kN", 1e-3, r"V_b = \frac{M_{b1} + M_{b2}}{L'}"),
+    "PZ_shear": ("交會區剪力容量設計", "kN", 1e-3, r"V_{u,PZ} = \frac{V_{ult} h_{TVSC}}{d_{EJ2} - t_f} - V_b"),
+}
+
+
+def check_results(r):
+    """由 engine.summarize 結果建立 {代號: 檢核結果}，依 CHECKS 順序排列。"""
+    out = {}
+    for key, dem, cap, lower, stage in CHECKS:
+        name, unit, scale, formula = CHECK_INFO[key]
+        ratio = r[f"ratio_{key}"]
+        out[key] = dict(
+            key=key, name=name, stage=stage, unit=unit,
+            demand=r[dem] * scale, capacity=r[cap] * scale, lower_bound=lower,
+            ratio=ratio, ok=bool(ratio <= 1.0),
+            formula=formula.replace("{rs_star}", f"{r['rs_star_threshold']:.2f}"),
+        )
+    return out
+
+
+def checks_json(results, **meta):
+    """檢核結果輸出為 JSON 字串 (非有限值以 null 表示)。"""
+    rows = [
+        {k: (v if not isinstance(v, float) or abs(v) < float("inf") else None) for k, v in c.items()}
+        for c in results.values()
+    ]
+    return json.dumps(dict(meta, checks=rows), ensure_ascii=False, indent=2, allow_nan=False)
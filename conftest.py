@@ -0,0 +1 @@
+# 測試以專案根目錄為匯入路徑 (各模組為頂層模組)
@@ -0,0 +1,347 @@
+import numpy as np
+
+# ==========================================
+# 核心力學引擎 (串聯柔度法 + 精確積分) — 向量化版本
+# 所有輸入皆可為純量或 NumPy 陣列，依 broadcasting 規則一次計算整批設計
+# ==========================================
+NU = 0.3
+RHO_STEEL = 7.85e-6
+OMEGA_BEAM = 1.1
+
+# 引擎輸入 (名稱與 app.py 側欄變數一致)
+INPUTS = (
+    "d_IC", "bf_IC", "tw_IC", "tf_IC",
+    "bf_EJ", "tw_EJ", "tf_EJ",
+    "d_b", "bf_b", "tw_b", "tf_b",
+    "Fy_IC", "Ry_IC", "Omega_IC", "Fy_EJ", "Ry_EJ", "Fy_beam",
+    "E_GPa", "target_drift",
+    "h_SYSC_mm", "h_IC_mm", "ts_End", "theta_deg",
+    "n_v", "n_h", "ts_stiff", "bs_stiff",
+    "d_c", "L_b", "t_dp",
+)
+
+# 檢核項目: (代號, 設計值, 規範值, 是否為下限, 所屬計算階段)
+CHECKS = (
+    ("lambda_f", "lambda_f", "bf_ratio_limit", False, "core"),
+    ("lambda_w", "lambda_w", "EJ_ratio_limit", False, "core"),
+    ("Lb", "h_SYSC_mm", "Lr_limit", False, "core"),
+    ("EJ_shear", "Vmax", "Vn_EJ_design", False, "core"),
+    ("EJ_moment", "Mu_EJ", "Mn_EJ_design", False, "core"),
+    ("IC_moment", "Mu_IC", "Mn_IC_design", False, "core"),
+    ("hs_tw", "hs_tw", "hs_tw_limit", False, "stiffener"),
+    ("lambda_nw_max", "lambda_nw", "lambda_nw_max", False, "stiffener"),
+    ("lambda_nw_min", "lambda_nw", "lambda_nw_min", True, "stiffener"),
+    ("rs", "rs_ratio", "rs_star_threshold", True, "stiffener"),
+    ("beam_moment", "M_b1", "Mp_beam", False, "frame"),
+    ("beam_shear", "V_b", "Vn_beam", False, "frame"),
+    ("PZ_shear", "V_u_PZ", "V_n_PZ", False, "frame"),
+)
+
+
+def ej_height(h_SYSC_mm, h_IC_mm, ts_End):
+    return (h_SYSC_mm - h_IC_mm - 2 * ts_End) / 2.0
+
+
+def d_EJ0_min_req(d_IC, h_EJ_mm, theta_deg):
+    theta_sol = np.radians(theta_deg)
+    return (d_IC + h_EJ_mm * np.tan(theta_sol)) * np.cos(theta_sol)
+
+
+def _I_strong(bf, d, tw, tf):
+    return (bf * d**3 - (bf - tw) * (d - 2 * tf)**3) / 12.0
+
+
+# ==========================================
+# 計算節點: 每個節點為一個函式，參數名即其相依的量，區域變數即其產出的量
+# 各階段依拓樸順序串接節點；graph.DesignGraph 以同一組節點做增量重算
+# ==========================================
+def materials(E_GPa, Fy_IC):
+    E = E_GPa * 1000.0
+    G = E / (2 * (1 + NU))
+    gamma_y = (0.6 * Fy_IC) / G
+    return dict(locals())
+
+
+def geometry(d_IC, h_SYSC_mm, h_IC_mm, ts_End, theta_deg):
+    h_EJ_mm = ej_height(h_SYSC_mm, h_IC_mm, ts_End)
+    theta_sol = np.radians(theta_deg)
+    tan_t = np.tan(theta_sol)
+    d_EJ1 = d_IC
+    d_EJ2 = d_EJ1 + 2 * h_EJ_mm * tan_t
+    eta = h_IC_mm / h_SYSC_mm
+    return dict(locals())
+
+
+def ic_section(d_IC, bf_IC, tw_IC, tf_IC):
+    """核心段強軸慣性矩 (型錄斷面可改由 SectionTable 的 Ix 欄給定，見 run_nodes)。"""
+    Ix_IC = _I_strong(bf_IC, d_IC, tw_IC, tf_IC)
+    return dict(locals())
+
+
+def ic_flexibility(d_IC, tw_IC, tf_IC, Ix_IC, h_IC_mm, E, G):
+    """核心段性質與柔度 (f_IC)。"""
+    Av_IC = d_IC * tw_IC
+    flex_IC = h_IC_mm**3 / (12.0 * E * Ix_IC)
+    f_IC = h_IC_mm / (G * Av_IC) + flex_IC
+    hw_IC = d_IC - 2 * tf_IC
+    return dict(locals())
+
+
+def ej_flexibility(bf_EJ, tw_EJ, tf_EJ, d_EJ1, d_EJ2, h_SYSC_mm, h_IC_mm, h_EJ_mm, ts_End, eta, E, G):
+    """連接段等效性質 (積分精確解，近等斷面取展開式) 與總柔度 (f_EJ)。"""
+    I_EJ1 = _I_strong(bf_EJ, d_EJ1, tw_EJ, tf_EJ)
+    I_EJ2 = _I_strong(bf_EJ, d_EJ2, tw_EJ, tf_EJ)
+    Av_EJ1 = d_EJ1 * tw_EJ
+    Av_EJ2 = d_EJ2 * tw_EJ
+
+    dAv = Av_EJ2 - Av_EJ1
+    Av_eq_EJ = np.where(np.abs(dAv) > 1e-5, dAv / np.log(Av_EJ2 / Av_EJ1), Av_EJ1)
+
+    b_val = np.sqrt(I_EJ1)
+    a_val = np.sqrt(I_EJ2)
+    alpha_user = 0.5 * h_IC_mm / (h_EJ_mm + ts_End)
+    den_part1 = alpha_user**2 / (a_val * b_val)
+    dba = b_val - a_val
+    # 近等斷面時封閉解相消誤差大 (約 ε / x³)，改用級數 ∫ s² / (b + x·b·s)² ds = Σ (k+1)(-x)^k / (k+3) / b²
+    x_ab = -dba / b_val
+    den_part2 = np.where(
+        np.abs(x_ab) > 1e-2,
+        (1.0 + b_val / a_val + (2.0 * b_val / dba) * np.log(a_val / b_val)) / dba**2,
+        sum((k + 1) * (-x_ab)**k / (k + 3) for k in range(6)) / I_EJ1,
+    )
+    I_eq_EJ = (alpha_user**2 + 1.0 / 3.0) / (den_part1 + den_part2)
+
+    f_EJ_shear = ((1.0 - eta) * h_SYSC_mm) / (G * Av_eq_EJ)
+    f_EJ_flex = (h_SYSC_mm**3 - h_IC_mm**3) / (12.0 * E * I_eq_EJ)
+    f_EJ = f_EJ_shear + f_EJ_flex
+    return dict(locals())
+
+
+def stiffness(f_IC, f_EJ, flex_IC, Av_IC, h_IC_mm, G):
+    """系統總勁度。"""
+    f_total = f_IC + f_EJ
+    K_EE = 1.0 / (2.0 * f_EJ)
+    Ke_IC = 1.0 / f_IC
+    Kp_IC = 1.0 / (h_IC_mm / (0.02 * G * Av_IC) + flex_IC)
+    Ke_F = 1.0 / f_total
+    Kp_F = 1.0 / (1.0 / Kp_IC + 1.0 / K_EE)
+    K_eff_kN_mm = Ke_F / 1000.0
+    return dict(locals())
+
+
+def strength(d_IC, tw_IC, Fy_IC, Ry_IC, Omega_IC):
+    """強度與極限值。"""
+    Vn_IC = 0.6 * Fy_IC * tw_IC * d_IC
+    Vmax = Omega_IC * Ry_IC * Vn_IC
+    V_ult = OMEGA_BEAM * Ry_IC * Vn_IC
+    return dict(locals())
+
+
+def drift(Vn_IC, Ke_F, Kp_F, K_EE, target_drift, h_SYSC_mm, h_IC_mm):
+    """降伏層間位移角與 IC 段剪應變需求。"""
+    theta_d = target_drift / 100.0
+    theta_y = Vn_IC / (Ke_F * h_SYSC_mm)
+    theta_ed = (Ke_F / K_EE) * theta_y + (Kp_F / K_EE) * (theta_d - theta_y)
+    gamma_d = (h_SYSC_mm / h_IC_mm) * (theta_d - theta_ed)
+    return dict(locals())
+
+
+def ej_slenderness(bf_EJ, tw_EJ, tf_EJ, d_EJ2, I_EJ2, Fy_EJ, Ry_EJ, E):
+    """韌性檢核標準與 LTB 放寬標準。"""
+    lambda_f = bf_EJ / (2 * tf_EJ)
+    lambda_w = (d_EJ2 - 2 * tf_EJ) / tw_EJ
+    sq_ej = np.sqrt(E / (Ry_EJ * Fy_EJ))
+    bf_ratio_limit = 0.38 * sq_ej
+    EJ_ratio_limit = 2.61 * sq_ej
+
+    hw_EJ2 = d_EJ2 - 2 * tf_EJ
+    Iy_EJ2 = (tf_EJ * bf_EJ**3 * 2 + hw_EJ2 * tw_EJ**3) / 12.0
+    A_EJ2 = tf_EJ * bf_EJ * 2 + hw_EJ2 * tw_EJ
+    ry_EJ2 = np.sqrt(Iy_EJ2 / A_EJ2)
+    ho = d_EJ2 - tf_EJ
+    J = (2 * bf_EJ * tf_EJ**3 + hw_EJ2 * tw_EJ**3) / 3
+    Cw = Iy_EJ2 * ho**2 / 4
+    Sx_EJ2 = I_EJ2 / (d_EJ2 / 2)
+    rts = np.where(Sx_EJ2 > 0, np.sqrt(np.sqrt(Iy_EJ2 * Cw) / Sx_EJ2), 0.0)
+    Fy_EJ_07 = 0.7 * Fy_EJ
+    J_ratio = J / (Sx_EJ2 * ho)
+    Lr_limit = 1.95 * rts * E / Fy_EJ_07 * np.sqrt(J_ratio + np.sqrt(J_ratio**2 + 6.76 * (Fy_EJ_07 / E)**2))
+    return dict(locals())
+
+
+def capacity(d_IC, bf_IC, tf_IC, bf_EJ, tw_EJ, tf_EJ, d_EJ1, d_EJ2,
+             Fy_IC, Ry_IC, Fy_EJ, Vmax, h_SYSC_mm, h_IC_mm):
+    """容量設計 (EJ 段與 IC 翼板)。"""
+    Vn_EJ_design = 0.9 * (0.6 * Fy_EJ * tw_EJ * d_EJ1)
+    Zf_IC = bf_IC * tf_IC * (d_IC - tf_IC)
+    Mn_IC_design = 0.9 * (Ry_IC * Zf_IC * Fy_IC)
+    Zx_EJ2 = bf_EJ * tf_EJ * (d_EJ2 - tf_EJ) + tw_EJ * (d_EJ2 / 2 - tf_EJ)**2
+    Mn_EJ_design = 0.9 * (Zx_EJ2 * Fy_EJ)
+    Mu_EJ = Vmax * h_SYSC_mm / 2
+    Mu_IC = Vmax * h_IC_mm / 2
+    return dict(locals())
+
+
+def core_weight(d_IC, bf_IC, tw_IC, tf_IC, bf_EJ, tw_EJ, tf_EJ, d_EJ1, d_EJ2, hw_IC, h_IC_mm, h_EJ_mm, ts_End):
+    """用鋼量 (不含加勁板, kg)。"""
+    W_IC = (2 * bf_IC * tf_IC + hw_IC * tw_IC) * h_IC_mm * RHO_STEEL
+    W_EJ = 2 * (2 * bf_EJ * tf_EJ + ((d_EJ1 + d_EJ2) / 2.0 - 2 * tf_EJ) * tw_EJ) * h_EJ_mm * RHO_STEEL
+    W_ES = 2 * ((d_IC + 20.0) * np.maximum(bf_IC, bf_EJ) * ts_End) * RHO_STEEL
+    W_core = W_IC + W_EJ + W_ES
+    return dict(locals())
+
+
+def stiffener_layout(tw_IC, hw_IC, Fy_IC, E, h_IC_mm, n_v, n_h, ts_stiff, bs_stiff):
+    """加勁板配置之寬厚比、加勁剛度比與用鋼量 (與位移需求無關)。"""
+    ds_val = hw_IC / (np.maximum(n_v, 0) + 1.0)
+    hs_val = h_IC_mm / (np.maximum(n_h, 0) + 1.0)
+    alpha_s = ds_val / hs_val
+    kc = np.where(alpha_s >= 1.0, 8.95 + 5.6 / alpha_s**2, 5.6 + 8.95 / alpha_s**2)
+    hs_tw = hs_val / tw_IC
+    lambda_nw = hs_tw * np.sqrt(0.6 * Fy_IC / (kc * E))
+    lambda_nw_max = np.full_like(lambda_nw, 0.6)
+    lambda_nw_min = np.full_like(lambda_nw, 0.145)
+
+    D_plate = E * tw_IC**3 / (12.0 * (1.0 - NU**2))
+    Is_stiff = ts_stiff * bs_stiff**3 / 3.0
+    rs_stiff = E * Is_stiff / (h_IC_mm * D_plate)
+    alpha_s_log = np.where(alpha_s > 0, np.log10(alpha_s), 0.0)
+    rs_star = 152.7 * alpha_s_log**2 + 21.14 * alpha_s_log + 26.34
+    rs_ratio = rs_stiff / rs_star
+
+    W_stiff = (2 * n_h * hw_IC + 2 * n_v * h_IC_mm) * bs_stiff * ts_stiff * RHO_STEEL
+    return dict(locals())
+
+
+def stiffener_demand(kc, hs_tw, gamma_d, gamma_y, theta_y, h_SYSC_mm, h_IC_mm):
+    """寬厚比上限、加勁剛度比需求，並依配置逆推 gamma_u 與 theta_u。"""
+    g_den = 2 * gamma_d - gamma_y
+    hs_tw_limit = np.where(g_den > 0, np.sqrt(8.5 * kc / g_den), 200.0)
+    rs_star_threshold = np.where(gamma_d > 0.12, 2.0, 1.0)
+    gamma_u = 0.5 * (8.5 * kc / hs_tw**2 + gamma_y)
+    theta_u = theta_y + (gamma_u - gamma_y) * (h_IC_mm / h_SYSC_mm)
+    return dict(locals())
+
+
+def beam_section(d_b, bf_b, tw_b, tf_b):
+    """邊界梁塑性斷面模數 (型錄斷面可改由 SectionTable 的 Zx 欄給定，見 run_nodes)。"""
+    Zx_beam = bf_b * tf_b * (d_b - tf_b) + tw_b * (d_b / 2 - tf_b)**2
+    return dict(locals())
+
+
+def beam_capacity(d_b, tw_b, Zx_beam, Fy_beam, t_dp):
+    """邊界梁與交會區容量。"""
+    Mp_beam = Zx_beam * Fy_beam
+    Vn_beam = 0.6 * Fy_beam * d_b * tw_b
+    M_b2 = 1.1 * Mp_beam
+    V_n_PZ = 0.6 * Fy_beam * d_b * (tw_b + t_dp)
+    return dict(locals())
+
+
+def frame_demand(d_b, d_c, L_b, M_b2, V_ult, h_SYSC_mm, d_EJ2, tf_EJ):
+    """邊界梁彎矩、剪力與交會區剪力需求 (M_b2 → M_b1 → V_b → V_u_PZ)。"""
+    L_b_mm = L_b * 1000.0
+    L_prime = (L_b_mm - d_EJ2 - d_c) / 2.0
+    r_L = d_EJ2 / (2.0 * L_prime)
+    M_b1 = (V_ult * (h_SYSC_mm / 2.0 + d_b / 2.0) - M_b2 * r_L) / (1.0 + r_L)
+    V_b = (M_b1 + M_b2) / L_prime
+    V_u_PZ = (V_ult * h_SYSC_mm / (d_EJ2 - tf_EJ)) - V_b
+    return dict(locals())
+
+
+def totals(W_core, W_stiff, K_eff_kN_mm):
+    W_total = W_core + W_stiff
+    KWR = K_eff_kN_mm / W_total
+    return dict(locals())
+
+
+CORE_NODES = (materials, geometry, ic_section, ic_flexibility, ej_flexibility, stiffness, strength, drift,
+              ej_slenderness, capacity, core_weight)
+STIFFENER_NODES = (stiffener_layout, stiffener_demand)
+FRAME_NODES = (beam_section, beam_capacity, frame_demand)
+NODES = CORE_NODES + STIFFENER_NODES + FRAME_NODES + (totals,)
+
+
+def node_io(node):
+    """節點的 (相依量, 產出量) 名稱。"""
+    code = node.__code__
+    return code.co_varnames[:code.co_argcount], code.co_varnames[code.co_argcount:code.co_nlocals]
+
+
+def run_nodes(nodes, values, given=None):
+    """依序計算節點並併入 values (輸入一律轉為浮點陣列，純量為 0 維)。
+
+    given 為預先給定的中間量 (如型錄斷面直接取 SectionTable 的 Ix、Zx 欄)，值為 None 者忽略；
+    產出量全部已給定的節點不計算。斷面尺寸經擾動或非型錄斷面時不可給定。
+    """
+    given = {k: v for k, v in (given or {}).items() if v is not None}
+    r = {k: np.asarray(v, dtype=float) for k, v in dict(values, **given).items()}
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for node in nodes:
+            if given and set(node_io(node)[1]) <= given.keys():
+                continue
+            r.update(node(**{k: r[k] for k in node_io(node)[0]}))
+    return r
+
+
+def core_stage(d_IC, bf_IC, tw_IC, tf_IC, bf_EJ, tw_EJ, tf_EJ,
+               Fy_IC, Ry_IC, Omega_IC, Fy_EJ, Ry_EJ, E_GPa, target_drift,
+               h_SYSC_mm, h_IC_mm, ts_End, theta_deg, Ix_IC=None):
+    """IC/EJ 段勁度、韌性與容量設計 (與加勁板、邊界梁無關)；Ix_IC 為型錄給定值 (選用)。"""
+    values = dict(locals())
+    return run_nodes(CORE_NODES, values, dict(Ix_IC=values.pop("Ix_IC")))
+
+
+def stiffener_stage(tw_IC, hw_IC, Fy_IC, E, gamma_d, gamma_y, theta_y,
+                    h_SYSC_mm, h_IC_mm, n_v, n_h, ts_stiff, bs_stiff):
+    """IC 段加勁板配置檢核 (僅經由 gamma_d 與核心段相依)。"""
+    return run_nodes(STIFFENER_NODES, dict(locals()))
+
+
+def frame_stage(d_b, bf_b, tw_b, tf_b, Fy_beam, t_dp, d_c, L_b,
+                V_ult, h_SYSC_mm, d_EJ2, tf_EJ, Zx_beam=None):
+    """邊界梁與交會區容量設計 (僅經由 V_ult, d_EJ2, tf_EJ 與核心段相依)；Zx_beam 為型錄給定值 (選用)。"""
+    values = dict(locals())
+    return run_nodes(FRAME_NODES, values, dict(Zx_beam=values.pop("Zx_beam")))
+
+
+def evaluate(d_IC, bf_IC, tw_IC, tf_IC, bf_EJ, tw_EJ, tf_EJ, d_b, bf_b, tw_b, tf_b,
+             Fy_IC, Ry_IC, Omega_IC, Fy_EJ, Ry_EJ, Fy_beam, E_GPa, target_drift,
+             h_SYSC_mm, h_IC_mm, ts_End, theta_deg, n_v, n_h, ts_stiff, bs_stiff,
+             d_c, L_b, t_dp, Ix_IC=None, Zx_beam=None):
+    """一次 broadcast 計算所有中間量與檢核值，回傳 {名稱: 陣列}；Ix_IC、Zx_beam 為型錄給定值 (選用)。"""
+    values = dict(locals())
+    return run_nodes(NODES, values, dict(Ix_IC=values.pop("Ix_IC"), Zx_beam=values.pop("Zx_beam")))
+
+
+def check_ratios(r, stage=None):
+    """各檢核之需求/容量比 (≤ 1.0 即通過；下限檢核取倒數)。"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            key: (r[cap] / r[dem]) if lower else (r[dem] / r[cap])
+            for key, dem, cap, lower, stg in CHECKS
+            if stage is None or stg == stage
+        }
+
+
+def governing_ratio(r, stage=None):
+    ratios = check_ratios(r, stage)
+    gov = np.maximum.reduce(np.broadcast_arrays(*ratios.values()))
+    return np.where(np.isnan(gov), np.inf, gov)
+
+
+def passes_all(r, stage=None):
+    return governing_ratio(r, stage) <= 1.0
+
+
+def evaluate_one(**inputs):
+    """單一設計 (純量輸入) 的便利包裝，回傳 Python float。"""
+    return summarize(evaluate(**inputs))
+
+
+def summarize(r):
+    """evaluate 結果 (純量) 加上各檢核比，轉為 Python float。"""
+    r = dict(r)
+    r.update({f"ratio_{k}": v for k, v in check_ratios(r).items()})
+    r["governing_ratio"] = governing_ratio(r)
+    return {k: float(v) for k, v in r.items() if np.ndim(v) == 0}
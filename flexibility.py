@@ -0,0 +1,171 @@
+import time
+from functools import cache
+from itertools import pairwise
+
+import numpy as np
+
+from engine import NU, _I_strong
+
+# ==========================================
+# 一般變斷面 EJ 段柔度積分 (Gauss–Legendre 數值積分，向量化)
+# s ∈ [0, 1] 由 IC 端 (d_EJ1) 量至梁端 (d_EJ2)，α = 0.5 h_IC / (h_EJ + ts_End)
+#   1 / Av_eq = ∫ 1 / Av(s) ds
+#   I_eq = ∫ (α² + s²) ds / ∫ (α² + s²) / I(s) ds
+# engine.ej_flexibility 的封閉解即 Av(s) 線性、√I(s) 線性時的上式
+# ==========================================
+GL_ORDER = 16
+
+
+@cache
+def gauss_legendre(n):
+    """[0, 1] 區間上 n 點 Gauss–Legendre 節點與權重 (唯讀，依 n 快取)。"""
+    x, w = np.polynomial.legendre.leggauss(n)
+    s, w = 0.5 * (x + 1.0), 0.5 * w
+    s.flags.writeable = w.flags.writeable = False
+    return s, w
+
+
+def gl_integrate(func, n=GL_ORDER, breaks=()):
+    """∫₀¹ func(s) ds，func 接受 (..., n) 節點陣列並回傳同形狀陣列。
+
+    breaks 為不連續點 (純量或每組設計一個陣列)，各子區間分別積分以保持精度。
+    """
+    s0, w0 = gauss_legendre(n)
+    edges = [0.0, *breaks, 1.0]
+    total = 0.0
+    for lo, hi in pairwise(edges):
+        lo, hi = np.asarray(lo, dtype=float)[..., None], np.asarray(hi, dtype=float)[..., None]
+        total = total + np.sum(func(lo + (hi - lo) * s0) * (hi - lo) * w0, axis=-1)
+    return total
+
+
+# 深度與翼板寬沿 s 的分布: 名稱 -> (函式(s, d1, d2, bf, **參數) -> (d, bf), 不連續點函式)
+def _linear(s, d1, d2, bf, **_):
+    return d1 + (d2 - d1) * s, bf
+
+
+def _parabolic(s, d1, d2, bf, **_):
+    return d1 + (d2 - d1) * s**2, bf
+
+
+def _stepped(s, d1, d2, bf, s_step=0.5, **_):
+    return np.where(s < s_step, d1, d2), bf
+
+
+def _flange_taper(s, d1, d2, bf, bf_ratio=1.5, **_):
+    return d1 + (d2 - d1) * s, bf * (1.0 + (bf_ratio - 1.0) * s)
+
+
+PROFILES = {
+    "linear": (_linear, lambda **_: ()),
+    "parabolic": (_parabolic, lambda **_: ()),
+    "stepped": (_stepped, lambda s_step=0.5, **_: (s_step,)),
+    "flange_taper": (_flange_taper, lambda **_: ()),
+}
+
+
+def _col(x):
+    return np.asarray(x, dtype=float)[..., None]
+
+
+def ej_equivalent(bf_EJ, tw_EJ, tf_EJ, d_EJ1, d_EJ2, h_IC_mm, h_EJ_mm, ts_End,
+                  profile="linear", n=GL_ORDER, **params):
+    """EJ 段等效剪力面積 Av_eq 與等效慣性矩 I_eq (各輸入可為陣列，依 broadcasting 批次計算)。
+
+    params 為分布參數: stepped 的 s_step (變斷面位置)、flange_taper 的 bf_ratio (梁端 / IC 端翼板寬)。
+    """
+    shape_fn, breaks_fn = PROFILES[profile]
+    alpha = _col(0.5 * np.asarray(h_IC_mm, dtype=float) / (np.asarray(h_EJ_mm, dtype=float) + ts_End))
+    d1, d2, bf, tw, tf = _col(d_EJ1), _col(d_EJ2), _col(bf_EJ), _col(tw_EJ), _col(tf_EJ)
+    prm = {k: _col(v) if np.ndim(v) else v for k, v in params.items()}
+    breaks = breaks_fn(**params)
+
+    def section(s):
+        d, b = shape_fn(s, d1, d2, bf, **prm)
+        return d * tw, _I_strong(b, d, tw, tf)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Av_eq = 1.0 / gl_integrate(lambda s: 1.0 / section(s)[0], n, breaks)
+        I_eq = (alpha[..., 0]**2 + 1.0 / 3.0) / gl_integrate(lambda s: (alpha**2 + s**2) / section(s)[1], n, breaks)
+    return Av_eq, I_eq
+
+
+def ej_flexibility(bf_EJ, tw_EJ, tf_EJ, d_EJ1, d_EJ2, h_SYSC_mm, h_IC_mm, h_EJ_mm, ts_End, E_GPa,
+                   profile="linear", n=GL_ORDER, **params):
+    """EJ 段總柔度 f_EJ (剪力 + 撓曲)，公式與 engine.ej_flexibility 相同，僅等效性質改為數值積分。"""
+    E = np.asarray(E_GPa, dtype=float) * 1000.0
+    G = E / (2 * (1 + NU))
+    Av_eq, I_eq = ej_equivalent(bf_EJ, tw_EJ, tf_EJ, d_EJ1, d_EJ2, h_IC_mm, h_EJ_mm, ts_End, profile, n, **params)
+    eta = h_IC_mm / h_SYSC_mm
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return ((1.0 - eta) * h_SYSC_mm) / (G * Av_eq) + (h_SYSC_mm**3 - h_IC_mm**3) / (12.0 * E * I_eq)
+
+
+def closed_form_check(bf_EJ, tw_EJ, tf_EJ, d_EJ1, d_EJ2, h_IC_mm, h_EJ_mm, ts_End, n=GL_ORDER):
+    """以封閉解的假設 (Av 線性、√I 線性) 數值積分，回傳 (Av_eq, I_eq) 供與 engine 封閉解比對。"""
+    alpha = _col(0.5 * np.asarray(h_IC_mm, dtype=float) / (np.asarray(h_EJ_mm, dtype=float) + ts_End))
+    Av1, Av2 = _col(d_EJ1 * tw_EJ), _col(d_EJ2 * tw_EJ)
+    r1 = _col(np.sqrt(_I_strong(bf_EJ, d_EJ1, tw_EJ, tf_EJ)))
+    r2 = _col(np.sqrt(_I_strong(bf_EJ, d_EJ2, tw_EJ, tf_EJ)))
+    Av_eq = 1.0 / gl_integrate(lambda s: 1.0 / (Av1 + (Av2 - Av1) * s), n)
+    I_eq = (alpha[..., 0]**2 + 1.0 / 3.0) / gl_integrate(lambda s: (alpha**2 + s**2) / (r1 + (r2 - r1) * s)**2, n)
+    return Av_eq, I_eq
+
+
+def quad_comparison(cases, n=GL_ORDER, profile="linear", **params):
+    """同一組設計以 Gauss–Legendre (向量化) 與 scipy.integrate.quad (逐筆) 計算 I_eq，回傳時間與最大相對誤差。
+
+    cases 為 {bf_EJ, tw_EJ, tf_EJ, d_EJ1, d_EJ2, h_IC_mm, h_EJ_mm, ts_End: 一維陣列}。
+    """
+    from scipy.integrate import quad
+
+    t0 = time.perf_counter()
+    _, I_gl = ej_equivalent(**cases, profile=profile, n=n, **params)
+    t_gl = time.perf_counter() - t0
+
+    shape_fn, breaks_fn = PROFILES[profile]
+    t0 = time.perf_counter()
+    I_quad = np.empty(len(cases["d_EJ1"]))
+    for i in range(len(I_quad)):
+        c = {k: float(v[i]) for k, v in cases.items()}
+        alpha = 0.5 * c["h_IC_mm"] / (c["h_EJ_mm"] + c["ts_End"])
+
+        def integrand(s, c=c, alpha=alpha):
+            d, b = shape_fn(s, c["d_EJ1"], c["d_EJ2"], c["bf_EJ"], **params)
+            return (alpha**2 + s**2) / _I_strong(b, d, c["tw_EJ"], c["tf_EJ"])
+
+        I_quad[i] = (alpha**2 + 1.0 / 3.0) / quad(integrand, 0.0, 1.0, points=breaks_fn(**params) or None)[0]
+    t_quad = time.perf_counter() - t0
+    return dict(cases=len(I_quad), gauss_s=t_gl, quad_s=t_quad, speedup=t_quad / t_gl,
+                max_rel_err=float(np.max(np.abs(I_gl / I_quad - 1.0))))
+
+
+def random_cases(m, seed=0):
+    """由 CNS 型錄隨機組合 m 組 IC/EJ 與幾何 (比對與效能量測用)。"""
+    from engine import core_stage
+    from sections import get_table
+
+    table = get_table("CNS")
+    rng = np.random.default_rng(seed)
+    i, j = rng.integers(0, len(table), m), rng.integers(0, len(table), m)
+    d, bf, tw, tf = table["d"], table["bf"], table["tw"], table["tf"]
+    h_IC = rng.uniform(500.0, 1200.0, m)
+    core = core_stage(d[i], bf[i], tw[i], tf[i], bf[j], tw[j], tf[j], 325, 1.2, 1.3, 325, 1.2, 200.0, 3.0,
+                      2600.0, h_IC, tf[i], rng.uniform(0.0, 25.0, m))
+    cases = dict(bf_EJ=bf[j], tw_EJ=tw[j], tf_EJ=tf[j], d_EJ1=core["d_EJ1"], d_EJ2=core["d_EJ2"],
+                 h_IC_mm=h_IC, h_EJ_mm=core["h_EJ_mm"], ts_End=tf[i])
+    return cases, core
+
+
+if __name__ == "__main__":
+    cases, core = random_cases(1000)
+    Av, I = closed_form_check(**cases, n=32)
+    print(f"封閉解假設 (√I 線性) 數值積分 vs engine 封閉解: Av 最大相對誤差 {np.max(np.abs(Av / core['Av_eq_EJ'] - 1)):.1e}，"
+          f"I 最大相對誤差 {np.max(np.abs(I / core['I_eq_EJ'] - 1)):.1e}")
+    Av, I = ej_equivalent(**cases)
+    print(f"實際斷面線性漸變 vs engine 封閉解: I 相對差異 中位數 {np.median(np.abs(I / core['I_eq_EJ'] - 1)):.2%}，"
+          f"最大 {np.max(np.abs(I / core['I_eq_EJ'] - 1)):.2%}")
+    for profile, params in (("linear", {}), ("parabolic", {}), ("stepped", {"s_step": 0.4}), ("flange_taper", {"bf_ratio": 1.3})):
+        r = quad_comparison(cases, profile=profile, **params)
+        print(f"{profile:13s} {r['cases']} 組: Gauss–Legendre {r['gauss_s'] * 1e3:.2f} ms，quad {r['quad_s'] * 1e3:.1f} ms "
+              f"(×{r['speedup']:.0f})，最大相對誤差 {r['max_rel_err']:.1e}")
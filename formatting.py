@@ -0,0 +1,30 @@
+import math
+
+import numpy as np
+
+# ==========================================
+# 數值顯示格式 (3位有效數字轉換)；不依賴 Streamlit，可單獨匯入量測
+# ==========================================
+
+
+def to_sig_fig(val, sig_figs=3):
+    if val == 0 or np.isnan(val) or np.isinf(val):
+        return "0.00"
+    try:
+        val_abs = abs(float(val))
+        order = int(math.floor(math.log10(val_abs)))
+        decimals = sig_figs - 1 - order
+        rounded = round(val_abs, decimals)
+        
+        new_order = int(math.floor(math.log10(rounded))) if rounded != 0 else 0
+        if new_order > order:
+            decimals = sig_figs - 1 - new_order
+            
+        if decimals <= 0:
+            result = str(int(round(rounded, 0)))
+        else:
+            fmt = f"{{:.{decimals}f}}"
+            result = fmt.format(rounded)
+        return "-" + result if val < 0 else result
+    except:
+        return str(val)
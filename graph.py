@@ -0,0 +1,80 @@
+import numpy as np
+
+from checks import check_results
+from engine import NODES, node_io, run_nodes, summarize
+
+# ==========================================
+# 增量相依圖 (DAG): 節點 = engine 的計算節點，邊 = 節點參數名對應到產出該量的節點
+# 變更輸入時只重算其下游節點；what-if 掃描僅以陣列重算下游，上游維持記憶值
+# ==========================================
+
+
+class DesignGraph:
+    def __init__(self, nodes=NODES, **inputs):
+        self.nodes = tuple(nodes)
+        self.io = {node: node_io(node) for node in self.nodes}
+        users = {}
+        for node in self.nodes:
+            for name in self.io[node][0]:
+                users.setdefault(name, []).append(node)
+        # nodes 已依拓樸順序排列，反向累積每個節點的所有下游節點
+        below = {}
+        for node in reversed(self.nodes):
+            below[node] = set().union(*({user} | below[user] for out in self.io[node][1] for user in users.get(out, ())))
+        self.downstream = {
+            name: set().union(*({node} | below[node] for node in used_by))
+            for name, used_by in users.items()
+        }
+        self.values = {}
+        self.dirty = set(self.nodes)
+        self.last_recomputed = ()
+        self._summary = None
+        self._checks = None
+        if inputs:
+            self.set(**inputs)
+
+    def set(self, **inputs):
+        """更新輸入，僅將值有變動者的下游節點標記為待重算。"""
+        for name, value in inputs.items():
+            value = np.asarray(value, dtype=float)
+            old = self.values.get(name)
+            if old is not None and old.shape == value.shape and np.array_equal(old, value):
+                continue
+            self.values[name] = value
+            self.dirty |= self.downstream.get(name, set())
+            self._summary = self._checks = None
+        return self
+
+    def _refresh(self):
+        todo = [node for node in self.nodes if node in self.dirty]
+        self.values = run_nodes(todo, self.values)
+        self.dirty.clear()
+        self.last_recomputed = tuple(node.__name__ for node in todo)
+
+    def result(self):
+        """目前設計的純量結果 (與 engine.evaluate_one 相同格式)，未變動時直接回傳記憶值。"""
+        if self.dirty or self._summary is None:
+            self._refresh()
+            self._summary = summarize(self.values)
+        return self._summary
+
+    def checks(self):
+        """目前設計的檢核結果集 (checks.check_results)，與 result() 同步記憶。"""
+        r = self.result()
+        if self._checks is None:
+            self._checks = check_results(r)
+        return self._checks
+
+    def __getitem__(self, name):
+        if self.dirty:
+            self._refresh()
+        return self.values[name]
+
+    def sweep(self, **values):
+        """what-if: 指定輸入改為陣列 (彼此 broadcast，如 θ[:, None] 與 h_IC[None, :] 成二維網格)，
+        其他輸入固定，回傳 {名稱: 陣列}；僅重算這些輸入的下游節點。"""
+        if self.dirty:
+            self._refresh()
+        below = set().union(*(self.downstream.get(name, ()) for name in values))
+        todo = [node for node in self.nodes if node in below]
+        return run_nodes(todo, dict(self.values, **values))
@@ -0,0 +1,101 @@
+import time
+from itertools import pairwise
+
+import numpy as np
+
+# ==========================================
+# 往復載重遲滯迴圈: 由 Ke,F / Kp,F / Vn,IC 雙線性骨架 (移動硬化) 模擬層間位移角加載歷程
+# 以層間位移角 θ 為變數: 彈性勁度 k1 = Ke,F·h_SYSC、降伏後勁度 k2 = Kp,F·h_SYSC (N/rad)
+# 移動硬化下剪力恆位於帶狀邊界 k2·θ ± Vn(1 - k2/k1) 之間；單調加載段內「先彈性、觸界後沿界」，
+# 故每一段的各步可一次以 clip(彈性試算, 下界, 上界) 算出，Python 迴圈只走反轉點 (段數)，與步數無關
+# ==========================================
+# AISC 341 K2.4b 加載歷程: (層間位移角, 圈數)，之後每級增加 0.01 rad、各 2 圈
+AISC_PROTOCOL = ((0.00375, 6), (0.005, 6), (0.0075, 6), (0.01, 4), (0.015, 2), (0.02, 2), (0.03, 2), (0.04, 2))
+PROTOCOL_INCREMENT = 0.01
+POINTS_PER_QUARTER = 64
+CHUNK_STEPS = 20_000_000  # 每塊 (設計數 × 步數) 上限，控制記憶體用量
+
+
+def cycle_amplitudes(theta_max, protocol=AISC_PROTOCOL, increment=PROTOCOL_INCREMENT):
+    """θmax 以內的各圈振幅 (rad)；θmax 小於第一級時只做一圈 θmax。"""
+    amps = [a for a, n in protocol for _ in range(n) if a <= theta_max]
+    a = protocol[-1][0] + increment
+    while a <= theta_max + 1e-12:
+        amps += [a, a]
+        a += increment
+    return np.array(amps or [theta_max], dtype=float)
+
+
+def drift_history(amps, points_per_quarter=POINTS_PER_QUARTER):
+    """各圈 0 → +a → 0 → -a → 0 的三角波位移角歷程，回傳 (θ (n + 1,), 反轉點索引)。"""
+    q = int(points_per_quarter)
+    u = np.arange(4 * q) / q
+    tri = np.where(u < 1, u, np.where(u < 3, 2 - u, u - 4))
+    theta = np.append((amps[:, None] * tri[None, :]).ravel(), 0.0)
+    start = np.arange(len(amps)) * 4 * q
+    reversals = np.concatenate(([0], np.ravel(np.column_stack((start + q, start + 3 * q))), [len(theta) - 1]))
+    return theta, reversals
+
+
+def _column(v, m):
+    return np.broadcast_to(np.asarray(v, dtype=float), (m,))[:, None]
+
+
+def bilinear_response(theta, reversals, k1, k2, Vy):
+    """雙線性移動硬化剪力歷程 (m, n + 1)，k1、k2、Vy 為 (m,) 陣列。"""
+    r = Vy * (1.0 - k2 / k1)
+    F = np.empty((len(k1), len(theta)))
+    F[:, 0] = 0.0
+    k1, k2, r = k1[:, None], k2[:, None], r[:, None]
+    for s, e in pairwise(reversals):
+        th = theta[s + 1:e + 1]
+        trial = F[:, s:s + 1] + k1 * (th - theta[s])
+        F[:, s + 1:e + 1] = np.clip(trial, k2 * th - r, k2 * th + r)
+    return F
+
+
+def hysteresis(r, theta_max=None, protocol=AISC_PROTOCOL, points_per_quarter=POINTS_PER_QUARTER,
+               hardening=True, trace=False, chunk_steps=CHUNK_STEPS):
+    """對 engine 結果 r (純量或 m 組設計) 施加遞增振幅加載歷程，回傳 ({...}, 統計)。
+
+    θmax 預設為各設計 θu 的最大值；各圈振幅超過該設計 θu 者標記為未達 (reached = False)。
+    回傳: amplitude (c,) rad、energy (m, c) 每圈消散能量 kN-m、damping (m, c) 等效阻尼比
+    ξeq = E_D / (4π E_so)，E_so = (F⁺θ⁺ + F⁻θ⁻) h / 4；trace=True 時另含 theta (n + 1,) 與 force (m, n + 1) kN。
+    hardening=False 時降伏後勁度取 0 (彈性–完全塑性)。
+    """
+    t0 = time.perf_counter()
+    m = max(np.size(r[k]) for k in ("Ke_F", "Kp_F", "Vn_IC", "h_SYSC_mm", "theta_u"))
+    h = _column(r["h_SYSC_mm"], m)[:, 0]
+    k1 = _column(r["Ke_F"], m)[:, 0] * h
+    k2 = _column(r["Kp_F"], m)[:, 0] * h if hardening else np.zeros(m)
+    Vy = _column(r["Vn_IC"], m)[:, 0]
+    theta_u = _column(r["theta_u"], m)[:, 0]
+    if theta_max is None:
+        theta_max = float(np.nanmax(theta_u))
+
+    amps = cycle_amplitudes(theta_max, protocol)
+    theta, reversals = drift_history(amps, points_per_quarter)
+    q, c = int(points_per_quarter), len(amps)
+    cycle_start = np.arange(c) * 4 * q
+    pos, neg = cycle_start + q, cycle_start + 3 * q
+    dtheta = np.diff(theta)
+
+    energy, damping = np.empty((m, c)), np.empty((m, c))
+    force = np.empty((m, len(theta))) if trace else None
+    rows = max(int(chunk_steps // len(theta)), 1)
+    for i in range(0, m, rows):
+        sl = slice(i, min(i + rows, m))
+        F = bilinear_response(theta, reversals, k1[sl], k2[sl], Vy[sl])
+        work = 0.5 * (F[:, 1:] + F[:, :-1]) * dtheta * h[sl, None]  # N·mm
+        energy[sl] = np.add.reduceat(work, cycle_start, axis=1) * 1e-6
+        E_so = (F[:, pos] * theta[pos] + F[:, neg] * theta[neg]) * h[sl, None] / 4.0 * 1e-6
+        with np.errstate(divide="ignore", invalid="ignore"):
+            damping[sl] = energy[sl] / (4.0 * np.pi * E_so)
+        if trace:
+            force[sl] = F * 1e-3
+    out = dict(amplitude=amps, energy=energy, damping=damping, reached=amps[None, :] <= theta_u[:, None] + 1e-12,
+               theta_y=Vy / k1, hardening=hardening)
+    if trace:
+        out.update(theta=theta, force=force)
+    return out, dict(designs=m, cycles=c, steps=len(theta) - 1, segments=len(reversals) - 1,
+                     elapsed_s=time.perf_counter() - t0)
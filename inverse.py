@@ -0,0 +1,115 @@
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from engine import d_EJ0_min_req, governing_ratio
+from graph import DesignGraph
+from sections import EJ_D_TOL
+
+# ==========================================
+# 反算設計: 指定目標 (Ke,F、θu 或 KWR)，反求 θ 或 h_IC
+# 所有 EJ 候選斷面一起向量化求根: 先以粗網格掃描找出括號區間，再以 Illinois 修正試位法
+# (與 brentq 同屬有括號保證的超線性求根法，但可對整欄陣列同步迭代) 收斂
+# 粗網格與目標值無關，依 (變數, 目標量, 範圍) 快取，相近的目標值查詢不需重新掃描；
+# 求解器可能為多個 session 共用 (app.get_inverse_solver)，故快取只保留最近 MAX_SCANS 組 (LRU)
+# ==========================================
+N_SCAN = 41
+MAX_SCANS = 16
+X_RTOL = 1e-9
+MAX_ITER = 60
+REPORT_KEYS = ("h_EJ_mm", "d_EJ2", "K_eff_kN_mm", "theta_u", "KWR", "W_total")
+
+
+class InverseSolver:
+    """固定目前設計的其他輸入，對一組 EJ 候選斷面同時反算單一變數。
+
+    inputs 為 engine.evaluate 的純量輸入 (其中 EJ 斷面尺寸會被候選斷面取代)，
+    candidates 為 {bf_EJ, tw_EJ, tf_EJ, d_EJ0: 一維陣列}。
+    """
+
+    def __init__(self, inputs, candidates, n_scan=N_SCAN, max_scans=MAX_SCANS):
+        self.inputs = dict(inputs)
+        self.d_EJ0 = np.asarray(candidates["d_EJ0"], dtype=float)
+        self.m = len(self.d_EJ0)
+        self.n_scan = n_scan
+        ej = {k: np.asarray(candidates[k], dtype=float)[:, None] for k in ("bf_EJ", "tw_EJ", "tf_EJ")}
+        self.graph = DesignGraph(**dict(self.inputs, **ej))
+        self.graph["W_total"]  # 先算好與變數無關的上游節點
+        self.max_scans = max_scans
+        self._scans = OrderedDict()
+
+    def _column(self, res, key, shape):
+        return np.broadcast_to(res[key], shape)
+
+    def scan(self, var, key, lo, hi):
+        """粗網格 x (n_scan,) 與各候選斷面的目標量 y (m, n_scan)；回傳 (x, y, 是否命中快取)。"""
+        cache_key = (var, key, float(lo), float(hi))
+        hit = cache_key in self._scans
+        if hit:
+            self._scans.move_to_end(cache_key)
+        else:
+            x = np.linspace(lo, hi, self.n_scan)
+            y = self._column(self.graph.sweep(**{var: x[None, :]}), key, (self.m, self.n_scan)).copy()
+            self._scans[cache_key] = (x, y)
+            while len(self._scans) > self.max_scans:
+                self._scans.popitem(last=False)
+        return (*self._scans[cache_key], hit)
+
+    def brackets(self, var, key, target, lo, hi):
+        """由快取網格取每個候選斷面的第一個變號區間 (a, b, f(a), f(b))；無解者為 NaN。"""
+        x, y, hit = self.scan(var, key, lo, hi)
+        f = y - target
+        ok = np.isfinite(f[:, :-1]) & np.isfinite(f[:, 1:])
+        cross = ok & ((f[:, :-1] == 0) | (np.signbit(f[:, :-1]) != np.signbit(f[:, 1:])))
+        found = cross.any(axis=1)
+        j = np.argmax(cross, axis=1)
+        rows = np.arange(self.m)
+        a, b = np.where(found, x[j], np.nan), np.where(found, x[j + 1], np.nan)
+        fa, fb = np.where(found, f[rows, j], np.nan), np.where(found, f[rows, j + 1], np.nan)
+        return a, b, fa, fb, hit
+
+    def _objective(self, var, key, target, x):
+        return self._column(self.graph.sweep(**{var: x[:, None]}), key, (self.m, 1))[:, 0] - target
+
+    def solve(self, var, key, target, lo, hi, x_rtol=X_RTOL, max_iter=MAX_ITER):
+        """回傳 ({root, converged, 深度規則, 控制檢核比, REPORT_KEYS...: (m,) 陣列}, 統計)。
+
+        root 為 [lo, hi] 內使 key = target 的最小 var 值；區間內無解者為 NaN。
+        """
+        t0 = time.perf_counter()
+        a, b, fa, fb, hit = self.brackets(var, key, target, lo, hi)
+        active = np.isfinite(a) & (fa != 0)
+        root = np.where(fa == 0, a, b)
+        xtol = x_rtol * (hi - lo)
+        n_iter = 0
+        while active.any() and n_iter < max_iter:
+            n_iter += 1
+            with np.errstate(divide="ignore", invalid="ignore"):
+                c = b - fb * (b - a) / (fb - fa)
+            c = np.where(active & np.isfinite(c), c, np.where(np.isfinite(a), 0.5 * (a + b), lo))
+            fc = self._objective(var, key, target, c)
+            # Illinois: 根落在 [b, c] 時舊端點 b 移至 a；否則保留 a 但將 f(a) 減半，避免單側停滯
+            flip = np.signbit(fc) != np.signbit(fb)
+            a, fa = np.where(active & flip, b, a), np.where(active & flip, fb, np.where(active, 0.5 * fa, fa))
+            b, fb = np.where(active, c, b), np.where(active, fc, fb)
+            root = np.where(active, c, root)
+            active &= (fc != 0) & (np.abs(b - a) > xtol)
+
+        x = np.where(np.isfinite(root), root, lo)
+        res = self.graph.sweep(**{var: x[:, None]})
+        out = {k: np.where(np.isfinite(root), self._column(res, k, (self.m, 1))[:, 0], np.nan) for k in REPORT_KEYS}
+        out["root"] = root
+        out["converged"] = np.isfinite(root) & ~active
+        theta = x if var == "theta_deg" else self.inputs["theta_deg"]
+        out["depth_ok"] = self.d_EJ0 >= d_EJ0_min_req(self.inputs["d_IC"], out["h_EJ_mm"], theta) - EJ_D_TOL
+        out["governing_ratio"] = np.where(np.isfinite(root), np.broadcast_to(governing_ratio(res), (self.m, 1))[:, 0], np.inf)
+        out["ok"] = out["converged"] & out["depth_ok"] & (out["governing_ratio"] <= 1.0)
+        return out, dict(candidates=self.m, solved=int(np.isfinite(root).sum()), iterations=n_iter,
+                         scan_cached=hit, elapsed_s=time.perf_counter() - t0)
+
+
+def ej_candidates(table, bf_IC):
+    """與 IC 翼板寬相容的所有 EJ 候選斷面 (相異幾何；深度規則依反算結果另行判定)，回傳 (ids, candidates)。"""
+    ids = table.ej_candidates(bf_IC, -np.inf, unique=True)
+    return ids, dict(bf_EJ=table["bf"][ids], tw_EJ=table["tw"][ids], tf_EJ=table["tf"][ids], d_EJ0=table["d"][ids])
@@ -0,0 +1,202 @@
+import heapq
+import time
+
+import numpy as np
+
+from engine import (core_stage, stiffener_stage, frame_stage, passes_all, check_ratios, governing_ratio, evaluate_one,
+                    d_EJ0_min_req, ej_height)
+from sections import EJ_D_TOL
+
+# ==========================================
+# 型錄窮舉最佳化 (IC × EJ × 邊界梁 × 幾何網格 × 加勁板網格)
+# 策略: 先以單一斷面 / 斷面對規則剪枝，再以分支界限 (branch and bound)
+# 依目標值由佳至劣逐批檢核加勁板與邊界梁，直到無法再改善前 N 名為止
+# ==========================================
+RANK_KEYS = {"W_total": False, "KWR": True}  # 目標 -> 是否越大越好
+# 加勁板配置網格 (與側欄輸入下限、間距一致): nL、nT、ts (mm)、bs (mm)
+STIFFENER_GRID = (range(7), range(13), tuple(np.arange(10.0, 26.0, 1.0)), tuple(np.arange(90.0, 181.0, 9.0)))
+PLATE_STEP = 1.0  # 交會區貼板厚度進位間距 (mm)
+
+
+def _stiffener_grid(n_v_grid, n_h_grid, ts_grid, bs_grid):
+    nv, nh, ts, bs = np.meshgrid(n_v_grid, n_h_grid, ts_grid, bs_grid, indexing="ij")
+    return nv.ravel().astype(float), nh.ravel().astype(float), ts.ravel().astype(float), bs.ravel().astype(float)
+
+
+def stiffener_layouts(r, n_v_grid=STIFFENER_GRID[0], n_h_grid=STIFFENER_GRID[1], ts_grid=STIFFENER_GRID[2],
+                      bs_grid=STIFFENER_GRID[3]):
+    """目前核心段 (r 為 engine.summarize 格式) 下窮舉加勁板配置網格，一次向量化檢核。
+
+    γd 經由 hs/tw 上限與核心段相依，故只需核心段結果。回傳 ({"min_weight": 配置, "max_gamma_u": 配置}, 統計)；
+    前者為通過者中 W_stiff 最小 (同重取 γu 大者)，後者為 γu 最大 (同 γu 取 W_stiff 小者)。
+    θu 隨 γu 單調遞增，γu 最大的配置同時使 θu 最大。無通過者時配置為 None。
+    """
+    t0 = time.perf_counter()
+    nv, nh, ts, bs = _stiffener_grid(n_v_grid, n_h_grid, ts_grid, bs_grid)
+    stf = stiffener_stage(r["tw_IC"], r["hw_IC"], r["Fy_IC"], r["E"], r["gamma_d"], r["gamma_y"], r["theta_y"],
+                          r["h_SYSC_mm"], r["h_IC_mm"], nv, nh, ts, bs)
+    ratio = governing_ratio(stf, "stiffener")
+    W, gamma_u, theta_u = (np.broadcast_to(stf[k], ratio.shape) for k in ("W_stiff", "gamma_u", "theta_u"))
+    idx = np.nonzero(ratio <= 1.0)[0]
+
+    def layout(i):
+        return dict(n_v=int(nv[i]), n_h=int(nh[i]), ts_stiff=float(ts[i]), bs_stiff=float(bs[i]),
+                    W_stiff=float(W[i]), gamma_u=float(gamma_u[i]), theta_u=float(theta_u[i]), ratio=float(ratio[i]))
+
+    best = dict(min_weight=None, max_gamma_u=None)
+    if len(idx):
+        best["min_weight"] = layout(idx[np.lexsort((-gamma_u[idx], W[idx]))[0]])
+        best["max_gamma_u"] = layout(idx[np.lexsort((W[idx], -gamma_u[idx]))[0]])
+    return best, dict(layouts=len(nv), passing=len(idx), elapsed_s=time.perf_counter() - t0)
+
+
+def beam_selection(table, r, grades, d_c, L_b, plate_step=PLATE_STEP):
+    """目前間柱設計 (r 為 engine.summarize 格式) 下，型錄全部斷面 × 各鋼材等級一次檢核邊界梁。
+
+    梁彎矩 (M_b1/Mp) 與剪力 (V_b/Vn) 檢核與貼板無關；交會區所需貼板厚
+    t_dp = V_u,PZ / (0.6 Fy d_b) − tw_b，進位至 plate_step 且不小於 0。grades 為 {名稱: STEEL_DB 材料}。
+    只檢核相異幾何的代表斷面；回傳 ({名稱: 最輕 (單位重最小) 的通過梁，無者為 None}, {ids: 代表斷面 id,
+    ok, t_dp: (等級數, 代表斷面數)}, 統計)。
+    """
+    t0 = time.perf_counter()
+    names = list(grades)
+    u = table.unique_ids  # 相異幾何的代表斷面，別名於顯示時展開
+    Fy = np.array([grades[g]["Fy"] for g in names], dtype=float)[:, None]
+    d, tw, w = table["d"][u][None, :], table["tw"][u][None, :], table["w_kg_m"][u]
+    fr = frame_stage(d, table["bf"][u][None, :], tw, table["tf"][u][None, :], Fy, 0.0, d_c, L_b,
+                     r["V_ult"], r["h_SYSC_mm"], r["d_EJ2"], r["tf_EJ"], Zx_beam=table["Zx"][u][None, :])
+    ratios = check_ratios(fr, "frame")
+    ok = (ratios["beam_moment"] <= 1.0) & (ratios["beam_shear"] <= 1.0)
+    t_exact = np.maximum(fr["V_u_PZ"] / (0.6 * Fy * d) - tw, 0.0)
+    t_dp = np.ceil(t_exact / plate_step - 1e-9) * plate_step
+
+    best = {}
+    for g, name in enumerate(names):
+        i = int(np.argmin(np.where(ok[g], w, np.inf)))
+        best[name] = dict(
+            id=int(u[i]), name=table.labels[u[i]], w_kg_m=float(w[i]), ratio_moment=float(ratios["beam_moment"][g, i]),
+            ratio_shear=float(ratios["beam_shear"][g, i]), t_dp=float(t_dp[g, i]), t_dp_exact=float(t_exact[g, i]),
+        ) if ok[g].any() else None
+    stats = dict(sections=len(table), geometries=len(u), grades=len(names), passing=int(ok.sum()),
+                 elapsed_s=time.perf_counter() - t0)
+    return best, dict(ids=u, ok=ok, t_dp=t_dp), stats
+
+
+def search(table, mat_ic, mat_ej, mat_beam, E_GPa, target_drift, h_SYSC_mm, d_c, L_b, t_dp,
+           theta_grid, h_IC_grid, n_v_grid, n_h_grid, ts_grid, bs_grid,
+           rank_by="W_total", top_n=10, batch=512):
+    """回傳 (前 N 名設計列表, 各剪枝階段統計)。
+
+    table 為 sections.SectionTable，mat_* 為 STEEL_DB 的材料字典，端板厚 ts_End 取 tf_IC。
+    """
+    t0 = time.perf_counter()
+    maximize = RANK_KEYS[rank_by]
+    names = table.labels  # 相同幾何的別名一併列出
+    d, bf, tw, tf = table["d"], table["bf"], table["tw"], table["tf"]
+    rep = table.representative  # 只窮舉相異幾何，別名不重複計算
+    n_sec, n_geo = len(names), len(table.unique_ids)
+    E = E_GPa * 1000.0
+    theta_grid = np.asarray(theta_grid, dtype=float)
+    h_IC_grid = np.asarray(h_IC_grid, dtype=float)
+    stats = {"sections": n_sec, "geometries": n_geo, "pairs_total": n_sec * n_sec, "pairs_unique": n_geo * n_geo}
+
+    # 1. 單一斷面剪枝
+    Vmax = mat_ic["Omega"] * mat_ic["Ry"] * 0.6 * mat_ic["Fy"] * tw * d
+    ej_ok = (table["lambda_f"] <= 0.38 * np.sqrt(E / (mat_ej["Ry"] * mat_ej["Fy"]))) & rep
+    phiVn_unit = 0.9 * 0.6 * mat_ej["Fy"]  # φVn,EJ = phiVn_unit * tw_EJ * d_IC
+    tw_ej_max = tw[ej_ok].max() if ej_ok.any() else 0.0
+    ic_ok = (Vmax <= phiVn_unit * tw_ej_max * d) & rep
+    Mn_IC = 0.9 * mat_ic["Ry"] * table["Zf"] * mat_ic["Fy"]
+    ic_h_ok = (Vmax[:, None] * h_IC_grid[None, :] / 2 <= Mn_IC[:, None]) & ic_ok[:, None]
+    ic_h_ok &= ej_height(h_SYSC_mm, h_IC_grid[None, :], tf[:, None]) > 0
+    stats["ic_kept"] = int(ic_h_ok.any(axis=1).sum())
+    stats["ej_kept"] = int(ej_ok.sum())
+
+    # 2. 展開 IC × theta × h_IC，以 bf 排序索引批次查詢相容 EJ (翼板寬 + 最小深度規則)
+    i_ic, k_t, k_h = np.nonzero(ic_h_ok[:, None, :] & np.ones(len(theta_grid), dtype=bool)[None, :, None])
+    h_EJ = ej_height(h_SYSC_mm, h_IC_grid[k_h], tf[i_ic])
+    d_min = d_EJ0_min_req(d[i_ic], h_EJ, theta_grid[k_t]) - EJ_D_TOL
+    q, ej = table.ej_candidates_batch(bf[i_ic], d_min, unique=True)
+    ic = i_ic[q]
+
+    # 3. IC/EJ 斷面對剪枝 (EJ 翼板寬厚比 + EJ 剪力容量)
+    keep = ej_ok[ej] & (Vmax[ic] <= phiVn_unit * tw[ej] * d[ic])
+    ic, ej, theta, h_IC = ic[keep], ej[keep], theta_grid[k_t[q[keep]]], h_IC_grid[k_h[q[keep]]]
+    stats["pairs_kept"] = len(np.unique(ic * n_sec + ej))
+    stats["geometry_candidates"] = len(ic)
+
+    # 4. 核心段勁度與檢核 (與加勁板、邊界梁無關)
+    core = core_stage(d[ic], bf[ic], tw[ic], tf[ic], bf[ej], tw[ej], tf[ej],
+                      mat_ic["Fy"], mat_ic["Ry"], mat_ic["Omega"], mat_ej["Fy"], mat_ej["Ry"],
+                      E_GPa, target_drift, h_SYSC_mm, h_IC, tf[ic], theta, Ix_IC=table["Ix"][ic])
+    ok = passes_all(core, "core")
+    sel = np.nonzero(ok)[0]
+    stats["core_passing"] = len(sel)
+
+    # 5. 分支界限: 加勁板用鋼量 ≥ 0，故 W_core 為 W_total 下界、K/W_core 為 KWR 上界
+    bound = -core["K_eff_kN_mm"][sel] / core["W_core"][sel] if maximize else core["W_core"][sel]
+    order = np.argsort(bound, kind="stable")
+    sel, bound = sel[order], bound[order]
+
+    nv, nh, ts, bs = _stiffener_grid(n_v_grid, n_h_grid, ts_grid, bs_grid)
+    beam_order = table.unique_ids[np.argsort(table["A"][table.unique_ids], kind="stable")]
+
+    heap = []  # (-score, idx) 以 score 越小越好
+    checked = 0
+    for s0 in range(0, len(sel), batch):
+        if len(heap) >= top_n and bound[s0] >= -heap[0][0]:
+            break
+        rows = sel[s0:s0 + batch]
+        checked += len(rows)
+
+        def col(k, rows=rows):
+            return np.asarray(core[k])[rows][:, None] if np.ndim(core[k]) else core[k]
+
+        stf = stiffener_stage(tw[ic[rows]][:, None], col("hw_IC"), mat_ic["Fy"], core["E"],
+                              col("gamma_d"), col("gamma_y"), col("theta_y"),
+                              h_SYSC_mm, col("h_IC_mm"), nv[None, :], nh[None, :], ts[None, :], bs[None, :])
+        s_ok = passes_all(stf, "stiffener")
+        W_s = np.where(s_ok, stf["W_stiff"], np.inf)
+        k_s = np.argmin(W_s, axis=1)
+        has_s = s_ok.any(axis=1)
+
+        fr = frame_stage(d[beam_order][None, :], bf[beam_order][None, :], tw[beam_order][None, :], tf[beam_order][None, :],
+                         mat_beam["Fy"], t_dp, d_c, L_b, col("V_ult"), h_SYSC_mm, col("d_EJ2"), tf[ej[rows]][:, None],
+                         Zx_beam=table["Zx"][beam_order][None, :])
+        b_ok = passes_all(fr, "frame")
+        k_b = np.argmax(b_ok, axis=1)
+        has_b = b_ok.any(axis=1)
+
+        W_tot = core["W_core"][rows] + W_s[np.arange(len(rows)), k_s]
+        score = -core["K_eff_kN_mm"][rows] / W_tot if maximize else W_tot
+        for j in np.nonzero(has_s & has_b)[0]:
+            item = (-score[j], int(rows[j]), int(k_s[j]), int(beam_order[k_b[j]]))
+            if len(heap) < top_n:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+    stats["cores_checked"] = checked
+
+    results = []
+    for _, row, k_s, k_b in sorted(heap, reverse=True):
+        inputs = dict(
+            d_IC=d[ic[row]], bf_IC=bf[ic[row]], tw_IC=tw[ic[row]], tf_IC=tf[ic[row]],
+            bf_EJ=bf[ej[row]], tw_EJ=tw[ej[row]], tf_EJ=tf[ej[row]],
+            d_b=d[k_b], bf_b=bf[k_b], tw_b=tw[k_b], tf_b=tf[k_b],
+            Fy_IC=mat_ic["Fy"], Ry_IC=mat_ic["Ry"], Omega_IC=mat_ic["Omega"],
+            Fy_EJ=mat_ej["Fy"], Ry_EJ=mat_ej["Ry"], Fy_beam=mat_beam["Fy"],
+            E_GPa=E_GPa, target_drift=target_drift, h_SYSC_mm=h_SYSC_mm, h_IC_mm=h_IC[row],
+            ts_End=tf[ic[row]], theta_deg=theta[row],
+            n_v=nv[k_s], n_h=nh[k_s], ts_stiff=ts[k_s], bs_stiff=bs[k_s],
+            d_c=d_c, L_b=L_b, t_dp=t_dp,
+        )
+        r = evaluate_one(**inputs)
+        results.append({
+            "IC": names[ic[row]], "EJ": names[ej[row]], "梁": names[k_b],
+            "θ (deg)": float(theta[row]), "h_IC (mm)": float(h_IC[row]),
+            "nL": int(nv[k_s]), "nT": int(nh[k_s]), "ts (mm)": float(ts[k_s]), "bs (mm)": float(bs[k_s]),
+            "W_total (kg)": r["W_total"], "KWR": r["KWR"], "K_eff (kN/mm)": r["K_eff_kN_mm"],
+            "θu (%rad)": r["theta_u"] * 100, "最大檢核比": r["governing_ratio"],
+        })
+    stats["elapsed_s"] = time.perf_counter() - t0
+    return results, stats
@@ -0,0 +1,125 @@
+import time
+
+import numpy as np
+
+from engine import evaluate, governing_ratio, d_EJ0_min_req, ej_height
+from sections import EJ_D_TOL
+
+# ==========================================
+# 多目標 (Pareto) 前緣: 大量候選設計 (IC × EJ × θ × h_IC) 的非支配解
+# 各目標轉為名次並依字典序由佳至劣排序後，「被支配」等價於「排在前面的某點其餘目標皆不劣」；
+# 以分治法 (Kung / Jensen) 逐層合併: 第 L 層將相鄰兩塊 (各 2^L 點) 配對，前塊對後塊查詢，
+# 每層是整個陣列的一次排序 + 累積最大值，共 log2(n) 層，O(n log² n)，不做 O(n²) 兩兩比較
+# 已被支配的點不可能再支配其他點以外的點 (支配具遞移性)，逐層剔除以縮小陣列
+# ==========================================
+OBJECTIVES = {"KWR": True, "theta_u": True, "W_total": False}  # 目標 -> 是否越大越好
+CHUNK = 1 << 17  # 候選設計每塊筆數 (engine.evaluate 的中間量約 130 個陣列)
+MAX_POINTS = 1 << 21  # 排序鍵 (塊, 名次, 位置) 各 21 位元，合併於一個 int64
+
+
+def _ranks(v):
+    """稠密名次 (相同值同名次)。"""
+    return np.unique(v, return_inverse=True)[1].astype(np.int64)
+
+
+def _dominated_sorted(b, c):
+    """b、c 為已依第一目標由佳至劣排序的名次 (越大越好)；回傳各點之前是否有 b、c 皆不小的點。"""
+    n = len(b)
+    dominated = np.zeros(n, dtype=bool)
+    if n < 2:
+        return dominated
+    bits = max(int(n - 1).bit_length(), 1)
+    low = (1 << bits) - 1
+    nb = b.max() - b  # 升冪排序即 b 由大到小
+    M = int(c.max()) + 2  # 各塊的累積最大值以 塊號 × M 墊高，避免跨塊
+    cur = np.arange(n, dtype=np.int64)
+    level = 0
+    while (1 << level) < n and len(cur) > 1:
+        # 鍵 = (塊, b 由大到小, 位置)；前一層各子塊已有序，stable (timsort) 只需合併相鄰兩段
+        key = ((cur >> (level + 1)) << (2 * bits)) | (nb[cur] << bits) | cur
+        key.sort(kind="stable")
+        cur = key & low
+        pair = cur >> (level + 1)
+        right = ((cur >> level) & 1).astype(bool)
+        # b 相同時依位置排序，前塊的點先出現，故「b 不小」的前塊點都已計入累積最大值
+        best = np.maximum.accumulate(np.where(right, pair * M - 1, pair * M + c[cur])) - pair * M
+        hit = right & (best >= c[cur])
+        dominated[cur[hit]] = True
+        cur = cur[~hit]
+        level += 1
+    return dominated
+
+
+def non_dominated(points, maximize=None):
+    """(n, k) 目標值 (k = 2 或 3) 的非支配遮罩；maximize 為各目標是否越大越好 (預設皆是)。
+
+    完全相同的點彼此不支配，一併保留；含 NaN 的點視為被支配。
+    """
+    x = np.asarray(points, dtype=float)
+    n, k = x.shape
+    if k not in (2, 3):
+        raise ValueError(f"僅支援 2 或 3 個目標 (收到 {k} 個)")
+    if maximize is not None:
+        x = np.where(np.asarray(maximize, dtype=bool), x, -x)
+    mask = np.zeros(n, dtype=bool)
+    finite = np.nonzero(np.isfinite(x).all(axis=1))[0]
+    if len(finite) == 0:
+        return mask
+    if len(finite) > MAX_POINTS:
+        raise ValueError(f"候選點超過 {MAX_POINTS} 組")
+    r = np.column_stack([_ranks(x[finite, j]) for j in range(k)])
+    bits = max(int(len(finite) - 1).bit_length(), 1)
+    key = np.zeros(len(finite), dtype=np.int64)
+    for j in range(k):  # 各名次合併為單一鍵，一次 argsort 即為字典序 (由佳至劣)
+        key = (key << bits) | (r[:, j].max() - r[:, j])
+    order = np.argsort(key, kind="stable")
+    r, key = r[order], key[order]
+    new = np.r_[True, key[1:] != key[:-1]]  # 與前一點不同者為一組相同點的代表
+    u = r[new]
+    dominated = _dominated_sorted(u[:, 1], u[:, 2] if k == 3 else np.zeros(len(u), dtype=np.int64))
+    mask[finite[order]] = ~dominated[np.cumsum(new) - 1]
+    return mask
+
+
+def candidate_designs(table, inputs, theta_grid, h_IC_grid, chunk=CHUNK):
+    """所有 IC 斷面 × θ × h_IC 與其相容 EJ 斷面 (翼板寬 + 最小深度規則) 的設計組，端板厚取 tf_IC；只取相異幾何。
+
+    inputs 為其餘 engine 輸入 (材料、E、θd、h_SYSC、加勁板、邊界梁等純量)；分塊計算，只保留目標值與檢核結果。
+    回傳 ({ic_id, ej_id, theta_deg, h_IC_mm, K_eff_kN_mm, 各目標, ok}, 統計)。
+    """
+    t0 = time.perf_counter()
+    d, bf, tw, tf = table["d"], table["bf"], table["tw"], table["tf"]
+    theta_grid = np.asarray(theta_grid, dtype=float)
+    h_IC_grid = np.asarray(h_IC_grid, dtype=float)
+    i_ic, k_t, k_h = (v.ravel() for v in np.meshgrid(table.unique_ids, np.arange(len(theta_grid)),
+                                                    np.arange(len(h_IC_grid)), indexing="ij"))
+    h_EJ = ej_height(inputs["h_SYSC_mm"], h_IC_grid[k_h], tf[i_ic])
+    q, ej = table.ej_candidates_batch(bf[i_ic], d_EJ0_min_req(d[i_ic], h_EJ, theta_grid[k_t]) - EJ_D_TOL, unique=True)
+    keep = h_EJ[q] > 0
+    q, ej = q[keep], ej[keep]
+    ic, theta, h_IC = i_ic[q], theta_grid[k_t[q]], h_IC_grid[k_h[q]]
+
+    keys = ("K_eff_kN_mm",) + tuple(OBJECTIVES)
+    out = {k: np.empty(len(ic)) for k in keys}
+    out["ok"] = np.empty(len(ic), dtype=bool)
+    for s in range(0, len(ic), chunk):
+        sl = slice(s, s + chunk)
+        i, j = ic[sl], ej[sl]
+        res = evaluate(**dict(inputs, d_IC=d[i], bf_IC=bf[i], tw_IC=tw[i], tf_IC=tf[i], ts_End=tf[i],
+                              bf_EJ=bf[j], tw_EJ=tw[j], tf_EJ=tf[j], theta_deg=theta[sl], h_IC_mm=h_IC[sl], Ix_IC=table["Ix"][i]))
+        for k in keys:
+            out[k][sl] = res[k]
+        out["ok"][sl] = governing_ratio(res) <= 1.0
+    out.update(ic_id=ic, ej_id=ej, theta_deg=theta, h_IC_mm=h_IC)
+    return out, dict(candidates=len(ic), passing=int(out["ok"].sum()), elapsed_s=time.perf_counter() - t0)
+
+
+def pareto_front(cand, objectives=OBJECTIVES):
+    """通過所有檢核的候選設計中的非支配解，回傳 (索引 (依第一目標由佳至劣), 排序耗時 s)。"""
+    t0 = time.perf_counter()
+    idx = np.nonzero(cand["ok"])[0]
+    keys = list(objectives)
+    front = idx[non_dominated(np.column_stack([cand[k][idx] for k in keys]), [objectives[k] for k in keys])]
+    first = cand[keys[0]][front]
+    front = front[np.argsort(-first if objectives[keys[0]] else first, kind="stable")]
+    return front, time.perf_counter() - t0
@@ -0,0 +1,198 @@
+import os
+import time
+import warnings
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# ==========================================
+# 逐階段效能剖析 (選用): 環境變數 TPSYSC_PROFILE=1，或網址加上 ?dev=1 後於側欄開啟
+# 每次重跑記錄各階段耗時 (巢狀階段為獨佔時間)、送出的元素數與訊息位元組數，
+# 每個 session 保留最近 HISTORY_LEN 次；片段單獨重跑時以該片段為一筆記錄
+# 元素數與位元組數取自送往瀏覽器的 ForwardMsg，未啟用時不安裝任何攔截
+# 攔截點為 Streamlit 內部的 ScriptRunContext._enqueue (非公開 API，於 TESTED_STREAMLIT 版本驗證)；
+# 該屬性不存在時發出警告並只記錄耗時，元素數與位元組數不計
+# ==========================================
+ENV_VAR = "TPSYSC_PROFILE"
+TESTED_STREAMLIT = "1.65.0"
+HISTORY_LEN = 20
+OTHER = "其他 (未分段)"
+
+
+def env_enabled():
+    return os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+class RerunProfile:
+    """一次重跑的各階段統計: {階段: [秒, 元素數, 位元組數]}，依首次出現順序。"""
+
+    def __init__(self, label):
+        self.label = label
+        self.stages = {}
+        self._stack = []  # [階段, 本段開始時間, 是否為 mark]
+        self._t0 = time.perf_counter()
+
+    def _stat(self, name):
+        return self.stages.setdefault(name, [0.0, 0, 0])
+
+    def push(self, name, mark=False):
+        now = time.perf_counter()
+        if self._stack:
+            top = self._stack[-1]
+            self._stat(top[0])[0] += now - top[1]
+        self._stack.append([name, now, mark])
+        self._stat(name)
+
+    def pop(self):
+        now = time.perf_counter()
+        name, start, _ = self._stack.pop()
+        self._stat(name)[0] += now - start
+        if self._stack:
+            self._stack[-1][1] = now
+
+    def mark(self, name):
+        """主程式的循序階段: 結束前一個 mark 並開始新的一段。"""
+        if self._stack and self._stack[-1][2]:
+            self.pop()
+        self.push(name, mark=True)
+
+    def count(self, msg):
+        stat = self._stat(self._stack[-1][0] if self._stack else OTHER)
+        if msg.HasField("delta"):
+            stat[1] += 1
+        stat[2] += msg.ByteSize()
+
+    def finish(self):
+        while self._stack:
+            self.pop()
+        total = time.perf_counter() - self._t0
+        other = self._stat(OTHER)
+        other[0] = max(total - sum(s for s, _, _ in self.stages.values()), 0.0)
+        if other == [0.0, 0, 0]:
+            del self.stages[OTHER]
+        return dict(
+            label=self.label, total_s=total,
+            elements=sum(n for _, n, _ in self.stages.values()), bytes=sum(b for _, _, b in self.stages.values()),
+            stages=[(name, *stat) for name, stat in self.stages.items()],
+        )
+
+
+class Profiler:
+    """每個 session 一個: 保存最近的重跑記錄，並攔截此 session 的訊息佇列以計數。"""
+
+    def __init__(self, history_len=HISTORY_LEN):
+        self.enabled = False
+        self.current = None
+        self.history = deque(maxlen=history_len)
+        self.payload = True  # 是否能計數送出的訊息 (見 _hook)
+        self._ctx = None
+
+    def _hook(self):
+        ctx = get_script_run_ctx()
+        if ctx is None or ctx is self._ctx:
+            return
+        self._ctx = ctx
+        enqueue = getattr(ctx, "_enqueue", None)
+        if not callable(enqueue):
+            if self.payload:
+                warnings.warn(f"Streamlit {st.__version__} 的 ScriptRunContext 沒有 _enqueue (已驗證版本 {TESTED_STREAMLIT})，"
+                              "效能剖析只記錄耗時，不計元素數與位元組數", RuntimeWarning, stacklevel=2)
+            self.payload = False
+            return
+        self.payload = True
+
+        def counting_enqueue(msg):
+            if self.current is not None:
+                self.current.count(msg)
+            enqueue(msg)
+
+        ctx._enqueue = counting_enqueue
+
+    def start(self, label):
+        self._hook()
+        self.current = RerunProfile(label)
+
+    def finish(self):
+        if self.current is not None:
+            self.history.append(self.current.finish())
+            self.current = None
+
+
+def _active():
+    profiler = st.session_state.get("profiler")
+    return profiler if profiler is not None and profiler.enabled else None
+
+
+def begin_rerun(dev_toggle=False):
+    """全頁重跑開始時呼叫；未啟用時不做任何事。"""
+    enabled = env_enabled() or bool(dev_toggle)
+    profiler = st.session_state.get("profiler")
+    if not enabled and profiler is None:
+        return
+    profiler = st.session_state.setdefault("profiler", Profiler())
+    profiler.enabled = enabled
+    if enabled:
+        profiler.finish()  # 前次重跑若中途停止 (st.stop / st.rerun)，先收尾
+        profiler.start("全頁重跑")
+
+
+def mark(name):
+    profiler = _active()
+    if profiler is not None and profiler.current is not None:
+        profiler.current.mark(name)
+
+
+@contextmanager
+def stage(name):
+    """巢狀階段；在片段單獨重跑時 (無進行中的全頁記錄) 自成一筆記錄。"""
+    profiler = _active()
+    if profiler is None:
+        yield
+        return
+    own = profiler.current is None
+    if own:
+        profiler.start(f"片段重跑: {name}")
+    profiler.current.push(name)
+    try:
+        yield
+    finally:
+        profiler.current.pop()
+        if own:
+            profiler.finish()
+
+
+def profiled(name):
+    """以 stage(name) 包裝整個函式 (用於各分頁片段)。"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def end_rerun():
+    """全頁重跑結束: 收尾本次記錄並於側欄顯示剖析面板 (面板本身不計入)。"""
+    profiler = _active()
+    if profiler is None:
+        return
+    profiler.finish()
+    with st.sidebar.expander("⏱️ 效能剖析", expanded=True):
+        if not profiler.payload:
+            st.warning(f"此 Streamlit 版本 ({st.__version__}) 無法攔截訊息佇列 (已驗證 {TESTED_STREAMLIT})，元素數與 KiB 不計。")
+        last = next((h for h in reversed(profiler.history) if h["label"] == "全頁重跑"), None)
+        if last is not None:
+            st.caption(f"最近一次全頁重跑 {last['total_s'] * 1e3:.1f} ms，{last['elements']} 個元素，{last['bytes'] / 1024:.1f} KiB")
+            st.dataframe([
+                {"階段": name, "ms": round(s * 1e3, 2), "占比": f"{s / last['total_s']:.0%}", "元素": n, "KiB": round(b / 1024, 1)}
+                for name, s, n, b in sorted(last["stages"], key=lambda row: -row[1])
+            ], hide_index=True)
+        st.caption(f"最近 {len(profiler.history)} 次重跑 (含片段重跑)")
+        st.dataframe([
+            {"#": i + 1, "類型": h["label"], "ms": round(h["total_s"] * 1e3, 1), "元素": h["elements"], "KiB": round(h["bytes"] / 1024, 1)}
+            for i, h in enumerate(profiler.history)
+        ], hide_index=True)
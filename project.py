@@ -0,0 +1,109 @@
+import numpy as np
+
+from batch import CASE_FIELDS, run_chunk, _chunks
+
+# ==========================================
+# 專案模式: 整棟建築的多組 TP-SYSC 單元 (樓層 × 跨)
+# 每個單元只記錄自身覆寫的欄位，其餘取專案共用參數 (欄位同 batch.CASE_FIELDS)
+# 單元或共用參數變動時只重算受影響的單元；全專案與各樓層合計以增減量維護，不重新加總
+# 用鋼量與勁度合計為 Neumaier 補償累加 (減去舊結果、加上新結果)，反覆編輯不累積浮點誤差
+# ==========================================
+UNIT_FIELDS = ("story", "bay")  # 僅供分組，不進入計算
+SUM_KEYS = ("W_total", "K_eff_kN_mm")  # 樓層內單元並聯，勁度與用鋼量皆可直接相加
+CHUNK = 2048
+
+
+def _clean(fields):
+    """去除未填欄位 (None、空字串、NaN)，未填者沿用共用參數。"""
+    return {
+        k: v for k, v in fields.items()
+        if (k in CASE_FIELDS or k in UNIT_FIELDS) and v is not None and v != "" and not (isinstance(v, float) and np.isnan(v))
+    }
+
+
+def _add(acc, x):
+    """Neumaier 補償累加: acc = [累加值, 補償項]，回傳補償後的和。"""
+    s, t = acc[0], acc[0] + x
+    acc[1] += (s - t) + x if abs(s) >= abs(x) else (x - t) + s
+    acc[0] = t
+    return t + acc[1]
+
+
+class Project:
+    def __init__(self, **shared):
+        self.shared = {}
+        self.units = {}    # 單元代號 -> 自身欄位
+        self.results = {}  # 單元代號 -> 結果列 (batch.run_chunk 格式，另含 story)
+        self.dirty = set()
+        self.totals = dict(units=0, passing=0, errors=0, **dict.fromkeys(SUM_KEYS, 0.0))
+        self.stories = {}  # 樓層 -> 同 totals 的合計
+        self._sums = {}    # 樓層 (None 為全專案) -> {SUM_KEYS: [累加值, 補償項]}
+        self.last_recomputed = ()
+        self.set_shared(**shared)
+
+    def case(self, key):
+        return dict(self.shared, **self.units[key])
+
+    def set_shared(self, **fields):
+        """更新共用參數；只有未覆寫該欄位的單元需要重算。"""
+        changed = {k for k, v in fields.items() if self.shared.get(k) != v}
+        self.shared.update(fields)
+        if changed:
+            self.dirty |= {key for key, own in self.units.items() if not changed <= own.keys()}
+        return self
+
+    def sync(self, units):
+        """以 {單元代號: 欄位} 取代單元表: 新增、刪除與欄位有變動的單元才標記重算。"""
+        removed = [key for key in self.units if key not in units]
+        for key in removed:
+            del self.units[key]
+            self.dirty.discard(key)
+            if key in self.results:
+                self._account(self.results.pop(key), -1)
+        for key, fields in units.items():
+            fields = _clean(fields)
+            if self.units.get(key) != fields:
+                self.units[key] = fields
+                self.dirty.add(key)
+        return self
+
+    def refresh(self):
+        """重算待重算的單元 (分塊向量化)，並以新舊結果之差更新合計。"""
+        keys = [key for key in self.units if key in self.dirty]
+        for chunk in _chunks(keys, CHUNK):
+            cases = [self.case(key) for key in chunk]
+            for key, case, row in zip(chunk, cases, run_chunk(cases)):
+                row["story"] = case.get("story", "")
+                if key in self.results:
+                    self._account(self.results[key], -1)
+                self.results[key] = row
+                self._account(row, 1)
+        self.dirty.clear()
+        self.last_recomputed = tuple(keys)
+        return self
+
+    def _account(self, row, sign):
+        story = self.stories.setdefault(row["story"], dict(units=0, passing=0, errors=0, **dict.fromkeys(SUM_KEYS, 0.0)))
+        for total in (self.totals, story):
+            total["units"] += sign
+            if row.get("error"):
+                total["errors"] += sign
+                continue
+            total["passing"] += sign * bool(row["pass"])
+        if not row.get("error"):
+            for name, total in ((None, self.totals), (row["story"], story)):
+                sums = self._sums.setdefault(name, {k: [0.0, 0.0] for k in SUM_KEYS})
+                for k in SUM_KEYS:
+                    if np.isfinite(row[k]):
+                        total[k] = _add(sums[k], sign * row[k])
+        for name, total in ((None, self.totals), (row["story"], story)):
+            if total["units"] == 0:  # 已無單元: 合計歸零，捨棄殘餘的捨入誤差
+                self._sums.pop(name, None)
+                total.update(dict.fromkeys(SUM_KEYS, 0.0))
+        if story["units"] == 0:
+            del self.stories[row["story"]]
+
+    def rows(self):
+        """先重算待重算的單元，再依單元順序回傳 (代號, 結果列)。"""
+        self.refresh()
+        return [(key, self.results[key]) for key in self.units]
@@ -0,0 +1,59 @@
+import io
+
+import numpy as np
+
+# ==========================================
+# 單調側推曲線: 由 Ke,F / Kp,F / θy / Vn,IC / Vmax / θu 組成的多線段骨架
+#   V(θ) = min(k1·θ, Vn + k2·(θ - θy), Vmax)，0 ≤ θ ≤ θu，k1 = Ke,F·h_SYSC、k2 = Kp,F·h_SYSC
+# 一次計算 m 組設計 (m, n) 的取樣曲線供構架模型使用；繪圖只需各曲線的頂點 (≤ 4 點)
+# ==========================================
+N_POINTS = 500
+
+
+def _columns(r):
+    m = max(np.size(r[k]) for k in ("Ke_F", "Kp_F", "Vn_IC", "Vmax", "h_SYSC_mm", "theta_u"))
+
+    def col(k):
+        return np.broadcast_to(np.asarray(r[k], dtype=float), (m,))[:, None]
+
+    h = col("h_SYSC_mm")
+    return col("Ke_F") * h, col("Kp_F") * h, col("Vn_IC"), col("Vmax"), col("theta_u")
+
+
+def curve(theta, k1, k2, Vn, Vmax):
+    """骨架剪力 (N)，各參數依 broadcasting 對應。"""
+    return np.minimum(np.minimum(k1 * theta, Vn + k2 * (theta - Vn / k1)), Vmax)
+
+
+def backbone(r):
+    """各設計骨架頂點 (θ (m, 4) rad, V (m, 4) kN): 原點、降伏點、達 Vmax 點與 θu 點 (未達者與下一點重合)。"""
+    k1, k2, Vn, Vmax, theta_u = _columns(r)
+    theta_y = np.minimum(Vn / k1, theta_u)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        theta_cap = np.where(k2 > 0, theta_y + (Vmax - Vn) / k2, np.inf)
+    theta = np.hstack([np.zeros_like(theta_u), theta_y, np.clip(theta_cap, theta_y, theta_u), theta_u])
+    return theta, curve(theta, k1, k2, Vn, Vmax) * 1e-3
+
+
+def pushover(r, n_points=N_POINTS):
+    """各設計 0 → θu 等分 n_points 點的側推曲線 (θ (m, n) rad, V (m, n) kN)；轉折點的精確位置見 backbone。"""
+    k1, k2, Vn, Vmax, theta_u = _columns(r)
+    theta = theta_u * np.linspace(0.0, 1.0, n_points)
+    return theta, curve(theta, k1, k2, Vn, Vmax) * 1e-3
+
+
+def polyline(x, y):
+    """(m, k) 曲線組串成單一路徑 (各曲線間以 NaN 分隔)，供單一 WebGL trace 繪製。"""
+    pad = np.full((x.shape[0], 1), np.nan)
+    return np.hstack([x, pad]).ravel(), np.hstack([y, pad]).ravel()
+
+
+def pushover_npz(r, n_points=N_POINTS, **columns):
+    """側推曲線 (float32) 與頂點輸出為 npz (bytes)；columns 為附加的每組設計欄位 (如斷面編號、θ、h_IC)。"""
+    theta, V = pushover(r, n_points)
+    vt, vV = backbone(r)
+    buf = io.BytesIO()
+    np.savez_compressed(buf, theta_rad=theta.astype(np.float32), V_kN=V.astype(np.float32),
+                        vertex_theta_rad=vt, vertex_V_kN=vV,
+                        **{k: np.asarray(v) for k, v in columns.items()})
+    return buf.getvalue()
@@ -0,0 +1,275 @@
+import argparse
+import ast
+import html
+import inspect
+import io
+import os
+import re
+import sys
+import textwrap
+import time
+import zipfile
+from string import Template
+
+import numpy as np
+
+from batch import CASE_FIELDS, case_inputs, map_chunks, read_cases, _chunks
+from checks import check_results
+from engine import INPUTS, NODES, evaluate, check_ratios, governing_ratio
+from formatting import to_sig_fig
+from schematic import schematic_layers, schematic_svg
+
+# ==========================================
+# 計算書輸出: 單一設計或整批設計的 HTML 計算書 (輸入、各中間量與公式、檢核結果、示意圖)
+# 版型 (string.Template) 與公式表於模組載入時建立一次，每個工作行程只建立一次；
+# 整批時分塊交給行程池，每塊一次向量化計算後逐筆套版，主行程只負責依序寫入資料夾或 zip
+#   python report.py cases.csv reports.zip --workers 8
+#   python report.py cases.csv reports/ --pdf        # PDF 需另行安裝 weasyprint
+# 中間量公式取自 engine 各節點的指定敘述，與計算程式碼同步
+# ==========================================
+KATEX = "https://cdn.jsdelivr.net/npm/katex@0.16.11/dist"
+UNITS_NOTE = "單位: 長度 mm、力 N、應力 MPa、彎矩 N-mm、角度 rad、重量 kg (另註明者除外)"
+SUMMARY_ITEMS = (  # (標題, 鍵, 倍率, 單位)
+    ("最大剪應變 γu", "gamma_u", 100.0, "%rad"),
+    ("最大層間位移角 θu", "theta_u", 100.0, "%rad"),
+    ("標稱剪力強度 Vy", "Vn_IC", 1e-3, "kN"),
+    ("極限剪力強度 Vmax", "Vmax", 1e-3, "kN"),
+    ("彈性側向勁度 Keff", "K_eff_kN_mm", 1.0, "kN/mm"),
+    ("間柱總用鋼量", "W_total", 1.0, "kg"),
+    ("勁度重量比 KWR", "KWR", 1.0, ""),
+    ("控制檢核比", "governing_ratio", 1.0, ""),
+)
+
+PAGE = Template("""<!DOCTYPE html>
+<html lang="zh-Hant"><head><meta charset="utf-8"><title>$title</title>
+<link rel="stylesheet" href="$katex/katex.min.css">
+<script defer src="$katex/katex.min.js"></script>
+<script defer src="$katex/contrib/auto-render.min.js" onload="renderMathInElement(document.body)"></script>
+<style>
+body { font-family: "Noto Sans TC", "Microsoft JhengHei", sans-serif; font-size: 10.5pt; margin: 2em; color: #111; }
+h1 { font-size: 16pt; border-bottom: 2px solid #333; } h2 { font-size: 13pt; margin-top: 1.6em; } h3 { font-size: 11pt; }
+table { border-collapse: collapse; width: 100%; margin: 0.4em 0; page-break-inside: auto; }
+th, td { border: 1px solid #bbb; padding: 2px 6px; text-align: left; vertical-align: top; }
+th { background: #eee; } td.num { text-align: right; font-family: monospace; } code { font-size: 9pt; }
+.ok { color: #080; font-weight: bold; } .ng { color: #c00; font-weight: bold; }
+.meta { color: #555; } .schematic svg { max-width: 100%; height: auto; }
+@page { size: A4; margin: 15mm; }
+@media print { body { margin: 0; } h2 { page-break-after: avoid; } tr { page-break-inside: avoid; } }
+</style></head>
+<body>
+<h1>$title</h1>
+<p class="meta">$meta</p>
+$body
+</body></html>
+""")
+SECTION = Template("<h2>$title</h2>\n$content\n")
+TABLE = Template("<table>\n<tr>$head</tr>\n$rows\n</table>")
+
+
+def _assignments(stmts):
+    """依原始碼順序列出指定敘述 (含 with / if 區塊內)。"""
+    for stmt in stmts:
+        if isinstance(stmt, ast.Assign):
+            yield stmt
+        for field in ("body", "orelse"):
+            yield from _assignments(getattr(stmt, field, ()))
+
+
+def node_formulas(nodes=NODES):
+    """各節點的 (名稱, 說明, [(中間量, 公式)])，公式為 engine 原始碼中指定敘述的右側。"""
+    out = []
+    for node in nodes:
+        func = ast.parse(textwrap.dedent(inspect.getsource(node))).body[0]
+        rows = []
+        for stmt in _assignments(func.body):
+            expr = ast.unparse(stmt.value)
+            for target in stmt.targets:
+                rows += [(t.id, expr) for t in getattr(target, "elts", [target]) if isinstance(t, ast.Name)]
+        out.append((node.__name__, inspect.getdoc(node) or "", rows))
+    return tuple(out)
+
+
+FORMULAS = node_formulas()
+
+
+def _table(head, rows):
+    return TABLE.substitute(
+        head="".join(f"<th>{html.escape(h)}</th>" for h in head),
+        rows="\n".join("<tr>" + "".join(rows_cells) + "</tr>" for rows_cells in rows),
+    )
+
+
+def _cell(text, num=False):
+    return f'<td class="num">{html.escape(text)}</td>' if num else f"<td>{html.escape(text)}</td>"
+
+
+def _value(v):
+    return to_sig_fig(v) if isinstance(v, float) else str(v)
+
+
+def schematic_geometry(inputs, r):
+    """示意圖幾何參數 (順序同 schematic.schematic_layers)。"""
+    p = inputs
+    return (p["L_b"], p["d_c"], p["d_b"], p["tf_b"], p["h_SYSC_mm"], r["h_EJ_mm"], p["ts_End"], p["h_IC_mm"],
+            r["d_EJ1"], r["d_EJ2"], p["tf_EJ"], p["d_IC"], p["tf_IC"], p["n_h"], p["n_v"])
+
+
+def report_title(case):
+    return case.get("id") or f"{case['ic_profile']} / {case['ej_profile']}"
+
+
+def render_report(case, inputs, r, generated=None):
+    """單一設計的計算書 (HTML 字串)；case 為 batch.CASE_FIELDS 欄位，r 為 engine.summarize 格式的純量結果。"""
+    checks = check_results(r)
+    summary = _table(("項目", "數值", "單位"), [
+        (_cell(name), _cell(to_sig_fig(r[key] * scale), True), _cell(unit)) for name, key, scale, unit in SUMMARY_ITEMS
+    ] + [(_cell("判定"), (f'<td class="{"ok" if r["governing_ratio"] <= 1.0 else "ng"}">'
+                           f'{"OK!" if r["governing_ratio"] <= 1.0 else "NG!"}</td>'), _cell(""))])
+    case_table = _table(("欄位", "值"), [(_cell(k), _cell(_value(case.get(k, "")))) for k in CASE_FIELDS if k != "id"])
+    input_table = _table(("輸入", "值"), [(_cell(k), _cell(to_sig_fig(float(inputs[k])), True)) for k in INPUTS])
+    steps = "\n".join(
+        f"<h3>{html.escape(name)}{' — ' + html.escape(doc) if doc else ''}</h3>\n" + _table(("中間量", "公式", "值"), [
+            (_cell(var), f"<td><code>{html.escape(expr)}</code></td>", _cell(_value(r[var]) if var in r else "-", True))
+            for var, expr in rows
+        ])
+        for name, doc, rows in FORMULAS
+    )
+    check_table = _table(("檢核項目", "設計值", "", "規範值", "單位", "檢核比", "結果", "公式"), [
+        (_cell(c["name"]), _cell(to_sig_fig(c["demand"]), True), _cell("≥" if c["lower_bound"] else "≤"),
+         _cell(to_sig_fig(c["capacity"]), True), _cell(c["unit"]), _cell(to_sig_fig(c["ratio"]), True),
+         f'<td class="{"ok" if c["ok"] else "ng"}">{"OK!" if c["ok"] else "NG!"}</td>',
+         f"<td>\\({html.escape(c['formula'])}\\)</td>")
+        for c in checks.values()
+    ])
+    svg = schematic_svg(schematic_layers(*schematic_geometry(inputs, r)))
+    body = "".join((
+        SECTION.substitute(title="1. 設計總覽", content=summary),
+        SECTION.substitute(title="2. 設計輸入", content=case_table + input_table),
+        SECTION.substitute(title="3. 計算過程", content=f'<p class="meta">{UNITS_NOTE}</p>\n{steps}'),
+        SECTION.substitute(title="4. 檢核結果", content=check_table),
+        SECTION.substitute(title="5. 立面示意圖", content=f'<div class="schematic">{svg}</div>'),
+    ))
+    generated = generated or time.strftime("%Y-%m-%d %H:%M")
+    return PAGE.substitute(
+        title=html.escape(f"TP-SYSC 計算書: {report_title(case)}"), katex=KATEX, body=body,
+        meta=html.escape(f"資料庫 {case['db']}｜IC {case['ic_profile']} ({case['mat_ic']})｜EJ {case['ej_profile']} "
+                         f"({case['mat_ej']})｜邊界梁 {case['beam_profile']} ({case['mat_beam']})｜{generated}"),
+    )
+
+
+def to_pdf(text):
+    """HTML 轉 PDF (需安裝 weasyprint；未安裝時丟出 ImportError)。"""
+    try:
+        from weasyprint import HTML
+    except ImportError as e:
+        raise ImportError("PDF 輸出需要 weasyprint (pip install weasyprint)；亦可直接以瀏覽器列印 HTML 計算書") from e
+    return HTML(string=text).write_pdf()
+
+
+def file_name(index, case, ext):
+    """依序號與案例 id 命名 (如 0001_2F-B3.html)，id 中不適用於檔名的字元改為底線。"""
+    stem = re.sub(r"[^\w.-]+", "_", str(case.get("id") or "")).strip("_")
+    return f"{index + 1:04d}_{stem}.{ext}" if stem else f"{index + 1:04d}.{ext}"
+
+
+def render_chunk(items, pdf=False):
+    """一塊 (序號, 案例) 整塊向量化計算後逐筆套版，回傳 [(序號, 案例, 檔名 | None, 內容 bytes | 錯誤訊息, 控制檢核比)]。"""
+    out, good, columns = [], [], {k: [] for k in INPUTS}
+    for index, case in items:
+        try:
+            c, inputs = case_inputs(case)
+        except (KeyError, ValueError, TypeError) as e:  # TypeError: 非純量欄位值 (如 JSONL 的 [1])
+            out.append((index, dict(case), None, f"{type(e).__name__}: {e}", None))
+            continue
+        out.append((index, c, inputs))
+        good.append(len(out) - 1)
+        for k in INPUTS:
+            columns[k].append(inputs[k])
+    if not good:
+        return out
+
+    r = evaluate(**{k: np.array(v, dtype=float) for k, v in columns.items()})
+    r.update({f"ratio_{k}": v for k, v in check_ratios(r).items()})
+    r["governing_ratio"] = governing_ratio(r)
+    n = len(good)
+    cols = {k: np.broadcast_to(v, (n,)) for k, v in r.items() if np.ndim(v) <= 1}
+    generated = time.strftime("%Y-%m-%d %H:%M")
+    for j, i in enumerate(good):
+        index, c, inputs = out[i]
+        rj = {k: float(v[j]) for k, v in cols.items()}
+        text = render_report(c, inputs, rj, generated)
+        out[i] = (index, c, file_name(index, c, "pdf" if pdf else "html"),
+                  to_pdf(text) if pdf else text.encode("utf-8"), rj["governing_ratio"])
+    return out
+
+
+def run_reports(cases, workers=None, chunk_size=64, pdf=False):
+    """依輸入順序產出每筆 (序號, 案例, 檔名, 內容, 控制檢核比)；行程池與在途塊數同 batch.run_batch。"""
+    for block in map_chunks(render_chunk, _chunks(enumerate(cases), chunk_size), workers, pdf):
+        yield from block
+
+
+def index_html(entries):
+    """整批計算書的索引頁 (各設計的控制檢核比與連結；輸入有誤者列出錯誤)。"""
+    rows = []
+    for index, case, name, content, ratio in entries:
+        link = f'<a href="{html.escape(name)}">{html.escape(report_title(case))}</a>' if name else html.escape(str(case.get("id", "")))
+        result = (f'<td class="{"ok" if ratio <= 1.0 else "ng"}">{"OK!" if ratio <= 1.0 else "NG!"}</td>'
+                  if name else f'<td class="ng">{html.escape(content)}</td>')
+        rows.append((_cell(str(index + 1)), f"<td>{link}</td>", _cell(to_sig_fig(ratio) if name else "-", True), result))
+    passing = sum(1 for e in entries if e[2] and e[4] <= 1.0)
+    return PAGE.substitute(
+        title="TP-SYSC 計算書索引", katex=KATEX, meta=html.escape(f"共 {len(entries)} 組設計，通過所有檢核 {passing} 組"),
+        body=_table(("#", "設計", "控制檢核比", "結果"), rows),
+    )
+
+
+def write_zip(entries, target):
+    """計算書與 index.html 寫入 zip (target 為路徑或檔案物件)。"""
+    with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as zf:
+        for _, _, name, content, _ in entries:
+            if name:
+                zf.writestr(name, content)
+        zf.writestr("index.html", index_html(entries))
+
+
+def write_reports(entries, output):
+    """寫入資料夾或 zip (副檔名 .zip)，另附 index.html；回傳 (計算書數, 錯誤數)。"""
+    entries = list(entries)
+    if output.endswith(".zip"):
+        write_zip(entries, output)
+    else:
+        os.makedirs(output, exist_ok=True)
+        for _, _, name, content, _ in entries:
+            if name:
+                with open(os.path.join(output, name), "wb") as f:
+                    f.write(content)
+        with open(os.path.join(output, "index.html"), "w", encoding="utf-8") as f:
+            f.write(index_html(entries))
+    errors = sum(1 for e in entries if not e[2])
+    return len(entries) - errors, errors
+
+
+def reports_zip(cases, workers=None, chunk_size=64):
+    """整批 HTML 計算書打包為 zip (bytes)，供 app 下載。"""
+    buf = io.BytesIO()
+    write_zip(list(run_reports(cases, workers, chunk_size)), buf)
+    return buf.getvalue()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TP-SYSC 批次計算書 (HTML / PDF)")
+    parser.add_argument("cases", help="案例檔 (.csv 或 .jsonl，'-' 為標準輸入；欄位同 batch.py)")
+    parser.add_argument("output", help="輸出資料夾，或以 .zip 結尾的壓縮檔")
+    parser.add_argument("--workers", type=int, default=None, help="行程數 (預設為 CPU 核心數，1 為不開行程池)")
+    parser.add_argument("--chunk", type=int, default=64, help="每塊案例數")
+    parser.add_argument("--pdf", action="store_true", help="輸出 PDF (需安裝 weasyprint)")
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    n, errors = write_reports(run_reports(read_cases(args.cases), args.workers, args.chunk, args.pdf), args.output)
+    print(f"{n} reports -> {args.output} ({time.perf_counter() - t0:.1f} s)" + (f", {errors} errors" if errors else ""),
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import numpy as np
+
+# ==========================================
+# 立面示意圖幾何: 每種顏色合併為一條多邊形路徑 (以 None 分隔各段)
+# Plotly 與 SVG 共用同一份幾何，圖面元素數量與加勁板數量無關
+# ==========================================
+C_FLANGE_IC, C_WEB_IC = "#FF9F0A", "#FFD60A"  # 橘黃色 (IC 翼板/腹板)
+C_FLANGE_EJ, C_WEB_EJ = "#0A84FF", "#5AC8FA"  # 藍色 (EJ 翼板/腹板)
+C_STIFF, C_END_PLATE, C_BEAM_WEB, C_BEAM_FLANGE = "#32D74B", "#BF5AF2", "#636366", "#48484A"
+C_PZ_DOUBLER, C_COL = "#8E8E93", "#2C2C2E"
+BG_COLOR = "rgb(17,17,17)"  # plotly_dark 背景
+FIG_HEIGHT = 700
+
+
+def _rect(x0, x1, y0, y1):
+    return [x0, x1, x1, x0, x0], [y0, y0, y1, y1, y0]
+
+
+def _join(polys):
+    """多個 (xs, ys) 串成一條以 None 分隔的路徑。"""
+    xs, ys = [], []
+    for px, py in polys:
+        if xs:
+            xs.append(None)
+            ys.append(None)
+        xs.extend(float(v) for v in px)
+        ys.extend(float(v) for v in py)
+    return xs, ys
+
+
+def schematic_layers(L_b, d_c, d_b, tf_b, h_SYSC_mm, h_EJ_mm, ts_End, h_IC_mm, d_EJ1, d_EJ2, tf_EJ, d_IC, tf_IC, n_h, n_v):
+    """回傳依繪製順序排列的圖層 [(種類, 顏色, 樣式, xs, ys)]，種類為 "fill" 或 "line"。"""
+    x_L, x_R = -L_b*1000/2, L_b*1000/2
+    y_end_bot_s = h_EJ_mm
+    y_end_bot_e = y_end_bot_s + ts_End
+    y_ic_b = y_end_bot_e
+    y_ic_t = y_ic_b + h_IC_mm
+    y_end_top_s = y_ic_t
+    y_end_top_e = y_end_top_s + ts_End
+    xb0, xb1 = x_L+d_c/2, x_R-d_c/2
+
+    # 邊界柱與梁 (下梁上翼板在 y=0，上梁下翼板在 y=h_SYSC)
+    cols = [_rect(x-d_c/2, x+d_c/2, -d_b, h_SYSC_mm+d_b) for x in (x_L, x_R)]
+    beam_flanges = [_rect(xb0, xb1, -d_b, -d_b+tf_b), _rect(xb0, xb1, 0, -tf_b),
+                    _rect(xb0, xb1, h_SYSC_mm+d_b, h_SYSC_mm+d_b-tf_b), _rect(xb0, xb1, h_SYSC_mm, h_SYSC_mm+tf_b)]
+    beam_webs = [_rect(xb0, xb1, -d_b+tf_b, -tf_b), _rect(xb0, xb1, h_SYSC_mm+d_b-tf_b, h_SYSC_mm+tf_b)]
+
+    # Panel Zone 交會區加勁板與雙板
+    ej_flanges = []
+    for x_p in (-d_EJ2/2, d_EJ2/2):
+        ej_flanges.append(_rect(x_p-tf_EJ/2, x_p+tf_EJ/2, -d_b+tf_b, -tf_b))
+        ej_flanges.append(_rect(x_p-tf_EJ/2, x_p+tf_EJ/2, h_SYSC_mm+tf_b, h_SYSC_mm+d_b-tf_b))
+    doublers = [_rect(-d_EJ2/2+tf_EJ/2, d_EJ2/2-tf_EJ/2, -d_b+tf_b, -tf_b),
+                _rect(-d_EJ2/2+tf_EJ/2, d_EJ2/2-tf_EJ/2, h_SYSC_mm+tf_b, h_SYSC_mm+d_b-tf_b)]
+
+    # EJ 段 (梯形翼板與腹板) 與中心切割虛線
+    ej_webs, center = [], []
+    for ysm, ylg in ((h_EJ_mm, 0), (h_SYSC_mm-h_EJ_mm, h_SYSC_mm)):
+        dsm, dlg, tfv = d_EJ1, d_EJ2, tf_EJ
+        ej_flanges.append(([-dsm/2, -dsm/2+tfv, -dlg/2+tfv, -dlg/2, -dsm/2], [ysm, ysm, ylg, ylg, ysm]))
+        ej_flanges.append(([dsm/2-tfv, dsm/2, dlg/2, dlg/2-tfv, dsm/2-tfv], [ysm, ysm, ylg, ylg, ysm]))
+        ej_webs.append(([-dsm/2+tfv, dsm/2-tfv, dlg/2-tfv, -dlg/2+tfv, -dsm/2+tfv], [ysm, ysm, ylg, ylg, ysm]))
+        center.append(([0, 0], [ysm, ylg]))
+
+    # 端部加勁板與 IC 段 (拆分翼板與腹板)
+    w_end = d_IC + 20.0
+    end_plates = [_rect(-w_end/2, w_end/2, y_end_bot_s, y_end_bot_e), _rect(-w_end/2, w_end/2, y_end_top_s, y_end_top_e)]
+    ic_flanges = [_rect(-d_IC/2, -d_IC/2+tf_IC, y_ic_b, y_ic_t), _rect(d_IC/2-tf_IC, d_IC/2, y_ic_b, y_ic_t)]
+    ic_web = [_rect(-d_IC/2+tf_IC, d_IC/2-tf_IC, y_ic_b, y_ic_t)]
+
+    # IC 段面外加勁板 (座標一次以陣列產生)
+    hw_ic_net = d_IC - 2 * tf_IC
+    n_h, n_v = max(int(n_h), 0), max(int(n_v), 0)
+    yc = y_ic_b + np.arange(1, n_h + 1) * (h_IC_mm / (n_h + 1))
+    xc = -hw_ic_net/2 + np.arange(1, n_v + 1) * (hw_ic_net / (n_v + 1))
+    stiffeners = [([-hw_ic_net/2, hw_ic_net/2], [y, y]) for y in yc] + [([x, x], [y_ic_b, y_ic_t]) for x in xc]
+
+    solid = dict(width=3.0)
+    return [
+        ("fill", C_COL, dict(opacity=0.3), *_join(cols)),
+        ("fill", C_BEAM_FLANGE, {}, *_join(beam_flanges)),
+        ("fill", C_BEAM_WEB, {}, *_join(beam_webs)),
+        ("fill", C_PZ_DOUBLER, {}, *_join(doublers)),
+        ("fill", C_FLANGE_EJ, {}, *_join(ej_flanges)),
+        ("fill", C_WEB_EJ, {}, *_join(ej_webs)),
+        ("line", "black", dict(width=2.5, dash="dash"), *_join(center)),
+        ("fill", C_END_PLATE, {}, *_join(end_plates)),
+        ("fill", C_FLANGE_IC, {}, *_join(ic_flanges)),
+        ("fill", C_WEB_IC, {}, *_join(ic_web)),
+        ("line", C_STIFF, solid, *_join(stiffeners)),
+    ]
+
+
+def schematic_figure(layers):
+    """以每圖層一條 Scatter 路徑建立 Plotly 圖 (延遲匯入 plotly)。"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for kind, color, style, xs, ys in layers:
+        if not xs:
+            continue
+        if kind == "fill":
+            fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", fill="toself", fillcolor=color,
+                                     line=dict(color="white", width=0.0), opacity=style.get("opacity", 1.0),
+                                     hoverinfo="skip", showlegend=False))
+        else:
+            fig.add_trace(go.Scatter(x=xs, y=ys, mode="lines", line=dict(color=color, **style),
+                                     hoverinfo="skip", showlegend=False))
+    fig.update_layout(
+        height=FIG_HEIGHT,
+        template="plotly_dark",
+        yaxis=dict(scaleanchor="x", scaleratio=1, showgrid=False, zeroline=False, showticklabels=False),
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        margin=dict(l=10,r=10,t=10,b=10)
+    )
+    return fig
+
+
+def _svg_path(xs, ys, y_top, close):
+    parts, pen = [], "M"
+    for x, y in zip(xs, ys):
+        if x is None:
+            if close:
+                parts.append("Z")
+            pen = "M"
+            continue
+        parts.append(f"{pen}{x:.1f} {y_top - y:.1f}")
+        pen = "L"
+    if close:
+        parts.append("Z")
+    return " ".join(parts)
+
+
+def schematic_svg(layers, pad=50.0):
+    """同一份圖層輸出靜態 SVG 字串 (供下載，不經 Plotly)。"""
+    xs = np.array([v for layer in layers for v in layer[3] if v is not None])
+    ys = np.array([v for layer in layers for v in layer[4] if v is not None])
+    x0, x1 = xs.min() - pad, xs.max() + pad
+    y0, y1 = ys.min() - pad, ys.max() + pad
+    width = FIG_HEIGHT * (x1 - x0) / (y1 - y0)
+    out = [(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{FIG_HEIGHT}" '
+            f'viewBox="{x0:.1f} 0 {x1 - x0:.1f} {y1 - y0:.1f}" style="background:{BG_COLOR}">')]
+    for kind, color, style, lxs, lys in layers:
+        if not lxs:
+            continue
+        d = _svg_path(lxs, lys, y1, kind == "fill")
+        if kind == "fill":
+            out.append(f'<path d="{d}" fill="{color}" fill-opacity="{style.get("opacity", 1.0)}"/>')
+        else:
+            dash = ' stroke-dasharray="6 4"' if style.get("dash") else ""
+            out.append(f'<path d="{d}" fill="none" stroke="{color}" stroke-width="{style["width"]}"'
+                       f' vector-effect="non-scaling-stroke"{dash}/>')
+    out.append("</svg>")
+    return "\n".join(out)
@@ -0,0 +1,166 @@
+import hashlib
+import os
+from functools import cache
+
+import numpy as np
+
+# ==========================================
+# 內建資料庫 (材料與型鋼斷面)
+# 型鋼型錄以二進位檔 sections.npz (名稱陣列 + 尺寸陣列) 隨程式發佈，首次使用時才載入
+# 原始資料見 section_data.py；npz 內記錄原始檔雜湊，不一致時改由原始資料建表
+# ==========================================
+STEEL_DB = {
+    "SN400B": {"Fy": 235, "Ry": 1.3, "Omega": 1.5},
+    "SN490B": {"Fy": 325, "Ry": 1.2, "Omega": 1.3},
+}
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+CATALOG_FILE = os.path.join(_HERE, "sections.npz")
+CATALOG_SOURCE = os.path.join(_HERE, "section_data.py")
+CATALOGS = {"CNS": "CNS_RH_database", "AISC": "AISC_W_database"}  # 型錄代號: section_data 中的變數名稱
+
+
+# ==========================================
+# 欄式斷面表 (結構化陣列 + 預先計算之斷面性質)
+# Ix、Zx 供引擎於型錄斷面 (IC 段、邊界梁) 依 id 直接取用 (engine.evaluate 的 Ix_IC、Zx_beam)；
+# EJ 段取漸變後的梁端深度 d_EJ2，可靠度分析亦會擾動 tw、tf，皆非型錄原始斷面，仍由尺寸計算
+# ==========================================
+SECTION_DTYPE = np.dtype([
+    ("d", "f8"), ("bf", "f8"), ("tw", "f8"), ("tf", "f8"),
+    ("A", "f8"), ("Ix", "f8"), ("Zx", "f8"), ("Zf", "f8"), ("lambda_f", "f8"), ("w_kg_m", "f8"),
+])
+
+# EJ 段候選規則: |bf_EJ - bf_IC| ≤ 20 mm 且 d_EJ ≥ d_EJ0_min_req - 2 mm
+EJ_BF_TOL = 20.0
+EJ_D_TOL = 2.0
+
+
+class SectionTable:
+    """型鋼斷面表: 每列一個斷面，以整數 id 索引，斷面性質於建表時一次算完。"""
+
+    def __init__(self, names, dims):
+        self.names = tuple(str(name) for name in names)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        dims = np.asarray(dims, dtype=float).reshape(-1, 4)
+        t = np.zeros(len(self.names), dtype=SECTION_DTYPE)
+        d, bf, tw, tf = dims.T
+        hw = d - 2 * tf
+        t["d"], t["bf"], t["tw"], t["tf"] = d, bf, tw, tf
+        t["A"] = 2 * bf * tf + hw * tw
+        t["Ix"] = (bf * d**3 - (bf - tw) * hw**3) / 12.0
+        t["Zx"] = bf * tf * (d - tf) + tw * (d / 2 - tf)**2
+        t["Zf"] = bf * tf * (d - tf)
+        t["lambda_f"] = bf / (2 * tf)
+        t["w_kg_m"] = t["A"] * 7.85e-3
+        t.flags.writeable = False
+        self.data = t
+
+        # 幾何 (d, bf, tw, tf) 全等的斷面互為別名: geometry[i] 為斷面 i 的幾何編號 (依首次出現順序)，
+        # unique_ids 為各幾何的代表斷面 (首次出現者)；窮舉搜尋只掃描代表斷面，顯示時以 labels 展開全部別名
+        _, first, inverse = np.unique(dims, axis=0, return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype=np.intp)
+        rank[np.argsort(first)] = np.arange(len(first))
+        self.geometry = rank[inverse.ravel()]
+        self.unique_ids = np.sort(first)
+        self.representative = np.zeros(len(self.names), dtype=bool)
+        self.representative[self.unique_ids] = True
+        groups = {}
+        for name, g in zip(self.names, self.geometry):
+            groups.setdefault(g, []).append(name)
+        self.labels = tuple(" / ".join(groups[g]) for g in self.geometry)
+
+        # bf 排序索引: 翼板寬相容條件化為 searchsorted 區間查詢
+        self._bf_order = np.argsort(bf, kind="stable")
+        self._bf_sorted = bf[self._bf_order]
+        self._d_by_bf = d[self._bf_order]
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, field):
+        return self.data[field]
+
+    def id(self, name):
+        return self.ids[name]
+
+    def dims(self, i):
+        row = self.data[i]
+        return float(row["d"]), float(row["bf"]), float(row["tw"]), float(row["tf"])
+
+    def aliases(self, i):
+        """與斷面 i 幾何相同的所有斷面 id (含自身，依型錄順序)。"""
+        return np.nonzero(self.geometry == self.geometry[i])[0]
+
+    def ej_candidates(self, bf_IC, d_min, bf_tol=EJ_BF_TOL, unique=False):
+        """單筆查詢: 回傳 bf 於 bf_IC ± bf_tol 且 d ≥ d_min 的斷面 id (依型錄順序)；unique 時只含代表斷面。"""
+        lo = np.searchsorted(self._bf_sorted, bf_IC - bf_tol, side="left")
+        hi = np.searchsorted(self._bf_sorted, bf_IC + bf_tol, side="right")
+        hit = self._bf_order[lo:hi][self._d_by_bf[lo:hi] >= d_min]
+        return np.sort(hit[self.representative[hit]] if unique else hit)
+
+    def ej_candidates_batch(self, bf_IC, d_min, bf_tol=EJ_BF_TOL, unique=False):
+        """批次查詢: 對每筆 (bf_IC[i], d_min[i]) 回傳攤平的 (查詢編號, 斷面 id) 配對，不重掃型錄；unique 時只含代表斷面。"""
+        bf_IC, d_min = np.broadcast_arrays(np.asarray(bf_IC, dtype=float), np.asarray(d_min, dtype=float))
+        lo = np.searchsorted(self._bf_sorted, bf_IC - bf_tol, side="left")
+        hi = np.searchsorted(self._bf_sorted, bf_IC + bf_tol, side="right")
+        counts = hi - lo
+        q = np.repeat(np.arange(len(bf_IC)), counts)
+        pos = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(lo, counts)
+        keep = self._d_by_bf[pos] >= d_min[q]
+        if unique:
+            keep &= self.representative[self._bf_order[pos]]
+        return q[keep], self._bf_order[pos[keep]]
+
+
+def _source_hash():
+    with open(CATALOG_SOURCE, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _catalog_arrays():
+    """由 section_data.py 取得 {型錄代號: (名稱陣列, 尺寸陣列)}。"""
+    import section_data
+
+    out = {}
+    for key, var in CATALOGS.items():
+        db = getattr(section_data, var)
+        out[key] = (np.array(list(db), dtype=str), np.asarray(list(db.values()), dtype=float).reshape(-1, 4))
+    return out
+
+
+def build_catalog(path=CATALOG_FILE):
+    """由原始資料重建二進位型錄 (各型錄存 <代號>_names 與 <代號>_dims，並記錄原始檔雜湊)。"""
+    arrays = {}
+    for key, (names, dims) in _catalog_arrays().items():
+        arrays[f"{key}_names"], arrays[f"{key}_dims"] = names, dims
+    np.savez_compressed(path, source_sha256=np.array(_source_hash()), **arrays)
+    return {key: len(arrays[f"{key}_names"]) for key in CATALOGS}
+
+
+@cache
+def _catalog():
+    try:
+        with np.load(CATALOG_FILE, allow_pickle=False) as z:
+            if not os.path.exists(CATALOG_SOURCE) or str(z["source_sha256"]) == _source_hash():
+                return {key: (z[f"{key}_names"], z[f"{key}_dims"]) for key in CATALOGS}
+    except (OSError, KeyError, ValueError):
+        pass
+    return _catalog_arrays()
+
+
+@cache
+def get_table(key):
+    """依型錄代號 ("CNS" / "AISC") 取得 SectionTable，首次呼叫時載入並建表。"""
+    return SectionTable(*_catalog()[key])
+
+
+def __getattr__(name):
+    # 相容舊用法 sections.CNS_TABLE / sections.AISC_TABLE (延遲至首次存取才建表)
+    if name in ("CNS_TABLE", "AISC_TABLE"):
+        return get_table(name.split("_")[0])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    counts = build_catalog()
+    print(f"{CATALOG_FILE}: " + "，".join(f"{key} {n} 筆" for key, n in counts.items()))
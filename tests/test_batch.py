@@ -0,0 +1,67 @@
+import csv
+import json
+
+import pytest
+
+from batch import CASE_FIELDS, RESULT_FIELDS, main, read_cases, run_batch, run_chunk
+from bench import BASE_CASE
+
+NUMERIC = [k for k, v in CASE_FIELDS.items() if isinstance(v, (int, float))]
+
+
+def cases(n):
+    return [dict(BASE_CASE, id=f"C{i}", h_IC_mm=600.0 + 5.0 * i, theta_deg=float(i % 20)) for i in range(n)]
+
+
+def test_csv_jsonl_round_trip(tmp_path):
+    src = cases(7)
+    csv_in, jsonl_in = tmp_path / "cases.csv", tmp_path / "cases.jsonl"
+    with open(csv_in, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(src[0]))
+        writer.writeheader()
+        writer.writerows(src)
+    jsonl_in.write_text("".join(json.dumps(c) + "\n" for c in src), encoding="utf-8")
+    assert [c["id"] for c in read_cases(str(csv_in))] == [c["id"] for c in src]
+
+    main([str(csv_in), str(tmp_path / "out.jsonl"), "--workers", "1"])
+    main([str(jsonl_in), str(tmp_path / "out.csv"), "--workers", "1"])
+    from_csv = list(read_cases(str(tmp_path / "out.jsonl")))
+    with open(tmp_path / "out.csv", newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        assert tuple(reader.fieldnames) == RESULT_FIELDS
+        from_jsonl = list(reader)
+
+    assert [r["id"] for r in from_csv] == [r["id"] for r in from_jsonl] == [c["id"] for c in src]
+    for a, b, c in zip(from_csv, from_jsonl, src):
+        assert not a.get("error") and not b["error"]
+        # CSV 輸入的字串欄位於輸出中為數值，與 JSONL 輸入一致
+        assert all(isinstance(a[k], (int, float)) for k in NUMERIC)
+        assert a["h_IC_mm"] == c["h_IC_mm"] and float(b["h_IC_mm"]) == c["h_IC_mm"]
+        assert float(b["K_eff_kN_mm"]) == pytest.approx(a["K_eff_kN_mm"], rel=1e-12)
+        assert b["pass"] == str(a["pass"])
+
+
+def test_errors_are_recorded_per_row():
+    bad = [
+        dict(BASE_CASE, id="unknown", ic_profile="no such section"),
+        dict(BASE_CASE, id="text", h_IC_mm="abc"),
+        dict(BASE_CASE, id="list", h_IC_mm=[1]),
+        dict(BASE_CASE, id="material", mat_ic="SS400"),
+    ]
+    rows = run_chunk(cases(2) + bad)
+    assert [r["id"] for r in rows] == ["C0", "C1", "unknown", "text", "list", "material"]
+    assert not any(r.get("error") for r in rows[:2])
+    assert [r["error"].split(":")[0] for r in rows[2:]] == ["KeyError", "ValueError", "TypeError", "KeyError"]
+    assert all("K_eff_kN_mm" not in r for r in rows[2:])
+    assert run_chunk(bad[2:3])[0]["error"].startswith("TypeError")
+
+
+def test_pool_preserves_order():
+    src = cases(50)
+    src[17] = dict(src[17], h_IC_mm=[1])
+    serial = list(run_batch(src, "jsonl", workers=1, chunk_size=4))
+    pooled = list(run_batch(src, "jsonl", workers=3, chunk_size=4))
+    assert pooled == serial
+    ids = [json.loads(line)["id"] for _, text in pooled for line in text.splitlines()]
+    assert ids == [c["id"] for c in src]
+    assert sum(n for n, _ in pooled) == len(src)
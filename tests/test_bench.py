@@ -0,0 +1,21 @@
+from bench import BENCHMARKS, previous_results, report
+
+
+def entry(best_s, quick, benchmarks):
+    return dict(quick=quick, benchmarks=list(benchmarks), results={"engine_scalar": dict(best_s=best_s, per_item_s=best_s)})
+
+
+def test_previous_results_only_same_settings():
+    history = [entry(1.0, False, BENCHMARKS), entry(2.0, True, BENCHMARKS), entry(3.0, False, ["engine"]),
+               dict(quick=False, results={"engine_scalar": dict(best_s=4.0)})]  # 舊格式 (未記錄項目組)
+    assert previous_results(history, "engine_scalar", False, list(BENCHMARKS))["best_s"] == 1.0
+    assert previous_results(history, "engine_scalar", True, list(BENCHMARKS))["best_s"] == 2.0
+    assert previous_results(history, "engine_scalar", False, ["engine"])["best_s"] == 3.0
+    assert previous_results(history, "engine_scalar", True, ["engine"]) is None
+
+
+def test_report_ignores_quick_runs_for_full_run(capsys):
+    history = [entry(1.0, False, ["engine"]), entry(0.1, True, ["engine"])]
+    results = {"engine_scalar": dict(best_s=1.1, per_item_s=1.1)}
+    assert report(results, history, False, ["engine"]) == []
+    assert report(results, history, True, ["engine"]) == ["engine_scalar"]
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from engine import core_stage
+from flexibility import closed_form_check, ej_equivalent, quad_comparison, random_cases
+
+
+@pytest.fixture(scope="module")
+def cases():
+    return random_cases(300)
+
+
+def test_gauss_legendre_matches_closed_form(cases):
+    c, core = cases
+    Av, I = closed_form_check(**c, n=32)
+    np.testing.assert_allclose(Av, core["Av_eq_EJ"], rtol=1e-10)
+    np.testing.assert_allclose(I, core["I_eq_EJ"], rtol=1e-8)
+
+
+@pytest.mark.parametrize("profile, params", [
+    ("linear", {}), ("parabolic", {}), ("stepped", {"s_step": 0.4}), ("flange_taper", {"bf_ratio": 1.3}),
+])
+def test_gauss_legendre_matches_quad(cases, profile, params):
+    c, _ = cases
+    sub = {k: v[:50] for k, v in c.items()}
+    assert quad_comparison(sub, profile=profile, **params)["max_rel_err"] < 1e-10
+
+
+def _core(theta_deg):
+    """488 × 300 IC 搭配 616 × 308 EJ (CNS)，θ 為陣列。"""
+    return core_stage(488.0, 300.0, 11.0, 18.0, 308.0, 20.0, 34.0, 325, 1.2, 1.3, 325, 1.2, 200.0, 3.0,
+                      2600.0, 750.0, 18.0, np.asarray(theta_deg, dtype=float))
+
+
+def test_den_part2_series_branch():
+    # θ 由 0 跨越級數 / 封閉解的切換點 (|x| = 1e-2)，兩分支皆須與數值積分一致且連續
+    theta = np.concatenate([[0.0], np.geomspace(1e-6, 10.0, 60)])
+    core = _core(theta)
+    x = np.abs(core["dba"] / core["b_val"])
+    assert (x < 1e-2).sum() > 5 and (x > 1e-2).sum() > 5
+    _, I = closed_form_check(308.0, 20.0, 34.0, core["d_EJ1"], core["d_EJ2"], 750.0, core["h_EJ_mm"], 18.0, n=32)
+    series = x < 1e-2
+    np.testing.assert_allclose(core["I_eq_EJ"][series], I[series], rtol=1e-11)
+    np.testing.assert_allclose(core["I_eq_EJ"], I, rtol=1e-9)
+    assert np.all(np.diff(core["I_eq_EJ"]) >= 0)
+
+
+def test_uniform_section_at_zero_taper():
+    core = _core([0.0])
+    np.testing.assert_allclose(core["I_eq_EJ"], core["I_EJ1"], rtol=1e-13)
+    np.testing.assert_allclose(core["Av_eq_EJ"], core["Av_EJ1"], rtol=1e-13)
+    Av, I = ej_equivalent(308.0, 20.0, 34.0, core["d_EJ1"], core["d_EJ2"], 750.0, core["h_EJ_mm"], 18.0)
+    np.testing.assert_allclose(I, core["I_EJ1"], rtol=1e-12)
+    np.testing.assert_allclose(Av, core["Av_EJ1"], rtol=1e-12)
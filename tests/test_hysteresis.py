@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from flexibility import random_cases
+from hysteresis import bilinear_response, cycle_amplitudes, drift_history, hysteresis
+
+
+def _step_by_step(theta, k1, k2, Vy):
+    """逐步回圈的參考解。"""
+    r = Vy * (1.0 - k2 / k1)
+    F = np.zeros((len(k1), len(theta)))
+    for n in range(1, len(theta)):
+        F[:, n] = np.clip(F[:, n - 1] + k1 * (theta[n] - theta[n - 1]), k2 * theta[n] - r, k2 * theta[n] + r)
+    return F
+
+
+@pytest.fixture(scope="module")
+def core():
+    _, core = random_cases(50)
+    return core
+
+
+@pytest.mark.parametrize("points_per_quarter", [4, 16, 64])
+@pytest.mark.parametrize("hardening", [True, False])
+def test_bilinear_response_matches_step_by_step(core, points_per_quarter, hardening):
+    theta, rev = drift_history(cycle_amplitudes(0.05), points_per_quarter)
+    k1 = core["Ke_F"] * 2600.0
+    k2 = core["Kp_F"] * 2600.0 if hardening else np.zeros_like(k1)
+    Vy = core["Vn_IC"]
+    F = bilinear_response(theta, rev, k1, k2, Vy)
+    np.testing.assert_allclose(F, _step_by_step(theta, k1, k2, Vy), rtol=0, atol=1e-9 * Vy.max())
+
+
+def test_chunked_hysteresis_matches_single_block(core):
+    r = dict(core, h_SYSC_mm=2600.0, theta_u=0.04)
+    full, _ = hysteresis(r, points_per_quarter=8, trace=True)
+    chunked, _ = hysteresis(r, points_per_quarter=8, trace=True, chunk_steps=1)
+    np.testing.assert_allclose(chunked["force"], full["force"])
+    np.testing.assert_allclose(chunked["energy"], full["energy"])
+    assert np.all(full["energy"] >= -1e-9)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from scipy.optimize import brentq
+
+from batch import case_inputs
+from bench import BASE_CASE
+from graph import DesignGraph
+from inverse import N_SCAN, REPORT_KEYS, InverseSolver, ej_candidates
+from sections import get_table
+
+RANGES = {"theta_deg": (0.0, 30.0), "h_IC_mm": (260.0, 1560.0)}
+TARGETS = ("K_eff_kN_mm", "theta_u", "KWR")
+
+
+@pytest.fixture(scope="module")
+def design():
+    p = case_inputs(BASE_CASE)[1]
+    inputs = {k: v for k, v in p.items() if k not in ("bf_EJ", "tw_EJ", "tf_EJ")}
+    _, candidates = ej_candidates(get_table("CNS"), p["bf_IC"])
+    return inputs, candidates
+
+
+@pytest.fixture(scope="module")
+def solver(design):
+    return InverseSolver(*design)
+
+
+def reference_root(graph, var, key, target, lo, hi):
+    """單一 EJ 斷面: 同樣的粗網格取第一個變號區間，再以 scipy brentq 求根；無變號者為 NaN。"""
+    def f(x):
+        return float(np.ravel(graph.sweep(**{var: np.array([x])})[key])[0]) - target
+
+    x = np.linspace(lo, hi, N_SCAN)
+    fx = np.array([f(v) for v in x])
+    for j in range(N_SCAN - 1):
+        if fx[j] == 0:
+            return x[j]
+        if np.signbit(fx[j]) != np.signbit(fx[j + 1]):
+            return brentq(f, x[j], x[j + 1], xtol=1e-12, rtol=1e-12)
+    return np.nan
+
+
+@pytest.mark.parametrize("var", list(RANGES))
+@pytest.mark.parametrize("key", TARGETS)
+def test_roots_match_brentq(design, solver, var, key):
+    inputs, candidates = design
+    lo, hi = RANGES[var]
+    _, y, _ = solver.scan(var, key, lo, hi)
+    target = float(np.median(y.max(axis=1)))  # 約半數斷面於範圍內達不到目標 (無變號區間)
+    out, stats = solver.solve(var, key, target, lo, hi)
+    expected = np.array([
+        reference_root(DesignGraph(**dict(inputs, **{k: candidates[k][i] for k in ("bf_EJ", "tw_EJ", "tf_EJ")})),
+                       var, key, target, lo, hi)
+        for i in range(solver.m)
+    ])
+    solved = np.isfinite(expected)
+    assert 0 < solved.sum() < solver.m
+    np.testing.assert_array_equal(np.isfinite(out["root"]), solved)
+    np.testing.assert_allclose(out["root"][solved], expected[solved], rtol=0, atol=1e-7 * (hi - lo))
+    assert out["converged"][solved].all() and not out["converged"][~solved].any()
+    np.testing.assert_allclose(out[key][solved], target, rtol=1e-6)
+    assert stats["solved"] == solved.sum()
+
+
+@pytest.mark.parametrize("offset", [-1.0, 1.0])
+def test_target_out_of_range(solver, offset):
+    lo, hi = RANGES["theta_deg"]
+    _, y, _ = solver.scan("theta_deg", "K_eff_kN_mm", lo, hi)
+    target = y.min() - 1.0 if offset < 0 else y.max() + 1.0
+    out, stats = solver.solve("theta_deg", "K_eff_kN_mm", target, lo, hi)
+    assert stats["solved"] == 0 and stats["iterations"] == 0
+    assert np.isnan(out["root"]).all()
+    assert not out["converged"].any() and not out["ok"].any()
+    assert all(np.isnan(out[k]).all() for k in REPORT_KEYS)
+    assert np.isinf(out["governing_ratio"]).all()
+
+
+def test_scan_cache_is_bounded(design):
+    solver = InverseSolver(*design, max_scans=2)
+    for hi in (10.0, 20.0, 30.0):
+        assert not solver.scan("theta_deg", "KWR", 0.0, hi)[2]
+    assert len(solver._scans) == 2
+    assert solver.scan("theta_deg", "KWR", 0.0, 30.0)[2]
+    assert not solver.scan("theta_deg", "KWR", 0.0, 10.0)[2]  # 最久未用者已被移除
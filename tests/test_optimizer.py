@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from engine import evaluate, passes_all, d_EJ0_min_req, ej_height
+from optimizer import search
+from sections import STEEL_DB, EJ_BF_TOL, EJ_D_TOL, SectionTable, get_table
+
+THETA = (4.0, 10.0, 16.0)
+H_IC = (600.0, 800.0, 1000.0)
+STIFF = (range(3), range(4), (10.0, 14.0), (90.0, 120.0))
+FIXED = dict(E_GPa=200.0, target_drift=3.0, h_SYSC_mm=2600.0, d_c=500.0, L_b=6.0, t_dp=15.0)
+
+
+@pytest.fixture(scope="module")
+def table():
+    """CNS 型錄中翼板寬約 300 mm 的斷面每隔兩個取一個 (淺至深皆有，窮舉量可承受)。"""
+    cns = get_table("CNS")
+    ids = [i for i in cns.unique_ids if 280.0 <= cns["bf"][i] <= 320.0][::3]
+    return SectionTable([cns.names[i] for i in ids], [cns.dims(i) for i in ids])
+
+
+def brute_force(table, mat, rank_by):
+    """每組 (IC, EJ, θ, h_IC) 以 evaluate 展開全部加勁板配置 × 邊界梁，取通過者中 W_total 最小的配置。"""
+    d, bf, tw, tf = (table[k] for k in ("d", "bf", "tw", "tf"))
+    nv, nh, ts, bs = (g.ravel().astype(float) for g in np.meshgrid(*STIFF, indexing="ij"))
+    scores = []
+    for i in range(len(table)):
+        for j in range(len(table)):
+            if abs(bf[j] - bf[i]) > EJ_BF_TOL:
+                continue
+            theta, h_IC = np.meshgrid(THETA, H_IC, indexing="ij")
+            theta, h_IC = theta.ravel()[:, None, None], h_IC.ravel()[:, None, None]
+            r = evaluate(
+                d_IC=d[i], bf_IC=bf[i], tw_IC=tw[i], tf_IC=tf[i], bf_EJ=bf[j], tw_EJ=tw[j], tf_EJ=tf[j],
+                d_b=d[None, None, :], bf_b=bf[None, None, :], tw_b=tw[None, None, :], tf_b=tf[None, None, :],
+                Fy_IC=mat["Fy"], Ry_IC=mat["Ry"], Omega_IC=mat["Omega"], Fy_EJ=mat["Fy"], Ry_EJ=mat["Ry"], Fy_beam=mat["Fy"],
+                h_IC_mm=h_IC, ts_End=tf[i], theta_deg=theta,
+                n_v=nv[None, :, None], n_h=nh[None, :, None], ts_stiff=ts[None, :, None], bs_stiff=bs[None, :, None], **FIXED,
+            )
+            ok = passes_all(r)
+            h_EJ = ej_height(FIXED["h_SYSC_mm"], h_IC, tf[i])
+            ok &= (h_EJ > 0) & (d[j] >= d_EJ0_min_req(d[i], h_EJ, theta) - EJ_D_TOL)
+            W = np.where(ok, np.broadcast_to(r["W_total"], ok.shape), np.inf).min(axis=(1, 2))
+            K = np.broadcast_to(r["K_eff_kN_mm"], ok.shape)[:, 0, 0]
+            scores += [w if rank_by == "W_total" else -k / w for w, k in zip(W, K) if np.isfinite(w)]
+    return np.sort(scores)
+
+
+@pytest.mark.parametrize("rank_by", ["W_total", "KWR"])
+def test_search_matches_brute_force(table, rank_by):
+    mat = STEEL_DB["SN490B"]
+    rows, stats = search(table, mat, mat, mat, *FIXED.values(), THETA, H_IC, *STIFF, rank_by=rank_by, top_n=15, batch=7)
+    expected = brute_force(table, mat, rank_by)[:15]
+    assert len(expected) > 0
+    got = [r["W_total (kg)"] if rank_by == "W_total" else -r["KWR"] for r in rows]
+    np.testing.assert_allclose(got, expected, rtol=1e-9)
+    assert all(r["最大檢核比"] <= 1.0 for r in rows)
+    assert stats["cores_checked"] <= stats["core_passing"]
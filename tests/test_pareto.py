@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from pareto import non_dominated, pareto_front
+
+
+def _brute_force(points, maximize=None):
+    """O(n²) 兩兩比較的參考解。"""
+    x = np.asarray(points, dtype=float)
+    if maximize is not None:
+        x = np.where(np.asarray(maximize, dtype=bool), x, -x)
+    ge = (x[:, None, :] >= x[None, :, :]).all(axis=2)
+    gt = (x[:, None, :] > x[None, :, :]).any(axis=2)
+    return ~(ge & gt).any(axis=0)
+
+
+@pytest.mark.parametrize("k", [2, 3])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_non_dominated_matches_brute_force(k, seed):
+    rng = np.random.default_rng(seed)
+    pts = np.round(rng.random((3000, k)), 2)  # 含大量重複值
+    maximize = [True, False, True][:k]
+    assert np.array_equal(non_dominated(pts, maximize), _brute_force(pts, maximize))
+
+
+def test_non_dominated_nan_and_ties():
+    pts = np.array([[1.0, 1.0], [1.0, 1.0], [0.5, 2.0], [np.nan, 5.0], [0.4, 1.5]])
+    assert non_dominated(pts).tolist() == [True, True, True, False, False]
+
+
+def test_pareto_front_only_passing_sorted():
+    rng = np.random.default_rng(3)
+    cand = {"KWR": rng.random(500), "theta_u": rng.random(500), "W_total": rng.random(500), "ok": rng.random(500) < 0.7}
+    front, _ = pareto_front(cand)
+    idx = np.nonzero(cand["ok"])[0]
+    pts = np.column_stack([cand["KWR"][idx], cand["theta_u"][idx], cand["W_total"][idx]])
+    assert set(front) == set(idx[_brute_force(pts, [True, True, False])])
+    assert np.all(np.diff(cand["KWR"][front]) <= 0)
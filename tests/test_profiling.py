@@ -0,0 +1,35 @@
+import types
+
+import pytest
+
+import profiling
+
+
+class FakeMsg:
+    def HasField(self, name):
+        return name == "delta"
+
+    def ByteSize(self):
+        return 10
+
+
+def test_hook_counts_enqueued_messages(monkeypatch):
+    sent = []
+    ctx = types.SimpleNamespace(_enqueue=sent.append)
+    monkeypatch.setattr(profiling, "get_script_run_ctx", lambda: ctx)
+    p = profiling.Profiler()
+    p.start("全頁重跑")
+    ctx._enqueue(FakeMsg())
+    p.finish()
+    assert p.payload and len(sent) == 1
+    assert (p.history[-1]["elements"], p.history[-1]["bytes"]) == (1, 10)
+
+
+def test_hook_without_enqueue_falls_back(monkeypatch):
+    monkeypatch.setattr(profiling, "get_script_run_ctx", lambda: types.SimpleNamespace())
+    p = profiling.Profiler()
+    with pytest.warns(RuntimeWarning):
+        p.start("全頁重跑")
+    p.finish()
+    assert not p.payload
+    assert p.history[-1]["bytes"] == 0
@@ -0,0 +1,43 @@
+import math
+
+from project import SUM_KEYS, Project
+
+SHARED = dict(ic_profile="488 X 300 X 11 X 18", ej_profile="616 X 308 X 20 X 34", beam_profile="828 X 308 X 22 X 40")
+
+
+def units(n_story, n_bay, dh=0.0):
+    return {f"{s}-{b}": dict(story=f"{s}F", bay=f"B{b}", h_SYSC_mm=2600.0 + dh + 10.0 * b)
+            for s in range(1, n_story + 1) for b in range(1, n_bay + 1)}
+
+
+def exact_totals(project, story=None):
+    """由各單元結果以 math.fsum 重新加總 (僅供核對增減維護的合計)。"""
+    rows = [row for _, row in project.rows() if not row.get("error") and story in (None, row["story"])]
+    return {k: math.fsum(row[k] for row in rows) for k in SUM_KEYS}
+
+
+def close(a, b):
+    return abs(a - b) <= 2 * math.ulp(b)
+
+
+def test_totals_match_fsum_after_many_edits():
+    project = Project(**SHARED)
+    project.sync(units(6, 4)).refresh()
+    for i in range(200):
+        project.sync(units(6 - i % 3, 4, dh=float(i % 7) * 13.7)).refresh()
+        if i % 25 == 0:
+            project.set_shared(t_dp=15.0 + i % 5).refresh()
+    expected = exact_totals(project)
+    for k in SUM_KEYS:
+        assert close(project.totals[k], expected[k])
+    for story, total in project.stories.items():
+        assert all(close(total[k], v) for k, v in exact_totals(project, story).items())
+    assert project.totals["units"] == len(project.units)
+
+
+def test_removed_units_leave_totals():
+    project = Project(**SHARED)
+    project.sync(units(3, 2)).refresh()
+    project.sync({}).refresh()
+    assert project.stories == {}
+    assert project.totals["units"] == 0 and all(project.totals[k] == 0.0 for k in SUM_KEYS)
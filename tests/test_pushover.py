@@ -0,0 +1,63 @@
+import io
+
+import numpy as np
+import pytest
+
+from batch import case_inputs
+from bench import BASE_CASE
+from engine import evaluate, evaluate_one
+from pushover import backbone, polyline, pushover, pushover_npz
+
+
+@pytest.fixture(scope="module")
+def designs():
+    p = case_inputs(BASE_CASE)[1]
+    return evaluate(**dict(p, theta_deg=np.linspace(0.0, 25.0, 6)[:, None], h_IC_mm=np.linspace(500.0, 1100.0, 5)[None, :]))
+
+
+def flat(r):
+    keys = ("Ke_F", "Kp_F", "Vn_IC", "Vmax", "h_SYSC_mm", "theta_u")
+    shape = np.broadcast_shapes(*(np.shape(r[k]) for k in keys))
+    return {k: np.broadcast_to(r[k], shape).ravel() for k in keys}
+
+
+def test_curve_is_monotone_on_backbone(designs):
+    r = flat(designs)
+    theta, V = pushover(r, 400)
+    assert np.all(np.diff(V, axis=1) >= -1e-9)
+    vt, vV = backbone(r)
+    assert np.all(np.diff(vt, axis=1) >= 0) and np.all(np.diff(vV, axis=1) >= -1e-9)
+    # 取樣點落在頂點折線上 (骨架在頂點之間為線性)
+    for i in range(len(vt)):
+        np.testing.assert_allclose(V[i], np.interp(theta[i], vt[i], vV[i]), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(V[:, -1], vV[:, -1])
+    assert np.all(V <= r["Vmax"][:, None] * 1e-3 * (1 + 1e-12))
+
+
+def test_elastic_slope_and_yield_point():
+    r = evaluate_one(**case_inputs(BASE_CASE)[1])
+    k1 = r["Ke_F"] * r["h_SYSC_mm"]  # N/rad
+    theta_y = r["Vn_IC"] / k1
+    vt, vV = backbone(r)
+    assert vt[0, 0] == 0.0 and vV[0, 0] == 0.0
+    assert vt[0, 1] == pytest.approx(theta_y) and vV[0, 1] == pytest.approx(r["Vn_IC"] * 1e-3)
+    theta, V = pushover(r, 1000)
+    elastic = (theta[0] > 0) & (theta[0] < theta_y)
+    assert elastic.sum() > 2
+    np.testing.assert_allclose(V[0, elastic] / theta[0, elastic], k1 * 1e-3, rtol=1e-12)
+    # 降伏後勁度為 Kp,F·h_SYSC (達 Vmax 之前)
+    k2 = r["Kp_F"] * r["h_SYSC_mm"]
+    post = (theta[0] > theta_y) & (V[0] < r["Vmax"] * 1e-3 - 1e-9)
+    assert post.sum() > 2
+    np.testing.assert_allclose(np.diff(V[0, post]) / np.diff(theta[0, post]), k2 * 1e-3, rtol=1e-8)
+
+
+def test_polyline_and_npz(designs):
+    r = flat(designs)
+    vt, vV = backbone(r)
+    x, y = polyline(vt, vV)
+    assert len(x) == len(y) == vt.shape[0] * 5 and np.isnan(x[4::5]).all() and np.isnan(y[4::5]).all()
+    with np.load(io.BytesIO(pushover_npz(r, 50, ok=np.ones(len(vt), dtype=bool)))) as z:
+        assert z["theta_rad"].shape == (len(vt), 50) and z["theta_rad"].dtype == np.float32
+        np.testing.assert_array_equal(z["vertex_V_kN"], vV)
+        assert z["ok"].all()
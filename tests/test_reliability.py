@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from batch import case_inputs
+from bench import BASE_CASE
+from engine import CHECKS, check_ratios, evaluate, governing_ratio
+from reliability import DEFAULT_SCATTER, monte_carlo, sample, streams
+
+N = 3000
+SEED = 7
+
+
+@pytest.fixture(scope="module")
+def inputs():
+    return case_inputs(BASE_CASE)[1]
+
+
+def test_chunk_size_does_not_change_result(inputs):
+    single, _ = monte_carlo(inputs, N, chunk=N, seed=SEED)
+    assert single["system"]["failures"] > 0  # EJ 剪力檢核比約 0.95，樣本中有失效
+    for chunk in (1000, 257, 1):
+        out, stats = monte_carlo(inputs, N, chunk=chunk, seed=SEED)
+        assert stats["samples"] == N
+        for key, v in out.items():
+            assert v["failures"] == single[key]["failures"] and v["pf"] == single[key]["pf"]
+            np.testing.assert_allclose(v["mean_ratio"], single[key]["mean_ratio"], rtol=1e-12)
+
+
+def test_pf_matches_unchunked_reference(inputs):
+    """一次抽完全部樣本、直接計數失效比例的參考解。"""
+    rngs = streams(SEED, DEFAULT_SCATTER)
+    x = dict(inputs)
+    for name, (dist, bias, cov) in DEFAULT_SCATTER.items():
+        x[name] = sample(rngs[name], float(inputs[name]), dist, bias, cov, N)
+    r = evaluate(**x)
+    ratios = dict(check_ratios(r), system=governing_ratio(r))
+    out, _ = monte_carlo(inputs, N, chunk=400, seed=SEED)
+    assert set(out) == {key for key, *_ in CHECKS} | {"system"}
+    for key, ratio in ratios.items():
+        ratio = np.broadcast_to(ratio, (N,))
+        assert out[key]["pf"] == np.mean(~(ratio <= 1.0))
+        np.testing.assert_allclose(out[key]["mean_ratio"], ratio[np.isfinite(ratio)].mean(), rtol=1e-12)
+    pf = out["system"]["pf"]
+    assert out["system"]["std_err"] == pytest.approx(np.sqrt(pf * (1 - pf) / N))
+
+
+def test_seed_reproducible(inputs):
+    a, _ = monte_carlo(inputs, 500, chunk=100, seed=1)
+    b, _ = monte_carlo(inputs, 500, chunk=100, seed=1)
+    c, _ = monte_carlo(inputs, 500, chunk=100, seed=2)
+    assert a == b
+    assert any(a[k]["mean_ratio"] != c[k]["mean_ratio"] for k in a)
@@ -0,0 +1,9 @@
+from bench import BASE_CASE
+from report import index_html, run_reports
+
+
+def test_bad_case_is_recorded_not_raised():
+    entries = list(run_reports([dict(BASE_CASE, id="bad", h_IC_mm=[1]), dict(BASE_CASE, id="ok")], workers=1))
+    assert [(index, name) for index, _, name, _, _ in entries] == [(0, None), (1, "0002_ok.html")]
+    assert entries[0][3].startswith("TypeError")
+    assert "TypeError" in index_html(entries)
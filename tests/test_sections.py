@@ -0,0 +1,28 @@
+import numpy as np
+
+from batch import case_inputs
+from bench import BASE_CASE
+from engine import evaluate, ic_section, beam_section
+from sections import get_table
+
+
+def test_table_columns_match_engine_nodes():
+    table = get_table("CNS")
+    d, bf, tw, tf = (table[k] for k in ("d", "bf", "tw", "tf"))
+    np.testing.assert_array_equal(table["Ix"], ic_section(d, bf, tw, tf)["Ix_IC"])
+    np.testing.assert_array_equal(table["Zx"], beam_section(d, bf, tw, tf)["Zx_beam"])
+
+
+def test_given_section_properties_skip_nodes():
+    p = case_inputs(BASE_CASE)[1]
+    table = get_table("CNS")
+    i = table.id(BASE_CASE["ic_profile"])
+    b = table.id(BASE_CASE["beam_profile"])
+    computed = evaluate(**p)
+    given = evaluate(**p, Ix_IC=table["Ix"][i], Zx_beam=table["Zx"][b])
+    assert computed.keys() == given.keys()
+    for k in computed:
+        np.testing.assert_array_equal(given[k], computed[k], err_msg=k)
+    # 給定的量直接沿用 (不經節點重算)
+    sentinel = evaluate(**p, Ix_IC=1.0, Zx_beam=2.0)
+    assert sentinel["Ix_IC"] == 1.0 and sentinel["Zx_beam"] == 2.0